@@ -137,6 +137,14 @@ class NeuralTrainer:
     # Forward Pass
     # ─────────────────────────────────────────────────────────────────────────
     
+    @staticmethod
+    def _by_layer(nodes: Dict[str, Any]) -> Dict[Any, List[str]]:
+        """จัดกลุ่ม node ตาม layer ในรอบเดียว (คงลำดับเดิมของ dict)"""
+        by_layer: Dict[Any, List[str]] = {}
+        for nid, n in nodes.items():
+            by_layer.setdefault(n.get("layer"), []).append(nid)
+        return by_layer
+    
     def forward(self, inputs: List[float]) -> List[float]:
         """
         Forward propagation
@@ -165,19 +173,23 @@ class NeuralTrainer:
                 self._node_inputs[nid] = 0.0
         
         # 2. Propagate through layers (layer by layer)
+        # lookup ครั้งเดียวต่อ pass — ไม่ต้อง scan connections ทั้งหมดทุก node
+        by_layer = self._by_layer(nodes)
+        incoming: Dict[str, List[dict]] = {}
+        for conn in conns.values():
+            if conn.get("enabled"):
+                incoming.setdefault(conn.get("destination"), []).append(conn)
+        
         max_layer = max(n.get("layer", 0) for n in nodes.values())
         for layer in range(1, max_layer + 1):
-            layer_nodes = [nid for nid, n in nodes.items() if n.get("layer") == layer]
-            
-            for nid in layer_nodes:
+            for nid in by_layer.get(layer, ()):
                 # sum incoming connections
                 weighted_sum = 0.0
-                for cid, conn in conns.items():
-                    if conn.get("destination") == nid and conn.get("enabled"):
-                        src = conn.get("source")
-                        weight = conn.get("weight", 0.0)
-                        if src in self._node_outputs:
-                            weighted_sum += self._node_outputs[src] * weight
+                for conn in incoming.get(nid, ()):
+                    src = conn.get("source")
+                    weight = conn.get("weight", 0.0)
+                    if src in self._node_outputs:
+                        weighted_sum += self._node_outputs[src] * weight
                 
                 # add bias — รองรับทั้ง float และ dict
                 bias_val = biases.get(nid, 0.0)
@@ -228,19 +240,22 @@ class NeuralTrainer:
             node_deltas[nid] = error * self._activate_deriv(output)
         
         # 2. Backpropagate error to hidden/input layers
+        by_layer = self._by_layer(nodes)
+        outgoing: Dict[str, List[dict]] = {}
+        for conn in conns.values():
+            if conn.get("enabled"):
+                outgoing.setdefault(conn.get("source"), []).append(conn)
+        
         max_layer = max(n.get("layer", 0) for n in nodes.values())
         for layer in range(max_layer - 1, -1, -1):
-            layer_nodes = [nid for nid, n in nodes.items() if n.get("layer") == layer]
-            
-            for nid in layer_nodes:
+            for nid in by_layer.get(layer, ()):
                 # sum error from downstream nodes
                 error_sum = 0.0
-                for cid, conn in conns.items():
-                    if conn.get("source") == nid and conn.get("enabled"):
-                        dst = conn.get("destination")
-                        if dst in node_deltas:
-                            weight = conn.get("weight", 0.0)
-                            error_sum += node_deltas[dst] * weight
+                for conn in outgoing.get(nid, ()):
+                    dst = conn.get("destination")
+                    if dst in node_deltas:
+                        weight = conn.get("weight", 0.0)
+                        error_sum += node_deltas[dst] * weight
                 
                 # delta = error_sum * activation_derivative
                 output = self._node_outputs.get(nid, 0.0)
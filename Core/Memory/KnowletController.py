@@ -297,7 +297,7 @@ class KnowletController:
             path = ShardPath.build_path(
                 self._base, tier, category, primary, atom_id, depth
             )
-            if not path.exists() or not quick_check(str(path)):
+            if not quick_check(str(path)):     # ไฟล์ไม่มี → False
                 continue
             try:
                 atom = AtomBinaryFormat.load(str(path))
@@ -343,14 +343,33 @@ class MemoryController:
         return True
 
     def auto_promote(self) -> dict:
-        summary = {"short_to_middle": 0, "middle_to_long": 0}
-        for atom_id in self._short.list_promotable():
-            if self.promote(atom_id, "short"):
-                summary["short_to_middle"] += 1
-        for atom_id in self._middle.list_promotable():
-            if self.promote(atom_id, "middle"):
-                summary["middle_to_long"] += 1
-        return summary
+        # short ก่อน — Atom ที่เพิ่งขึ้น middle ถูกพิจารณาต่อในรอบเดียวกัน
+        short_to_middle = self._promote_many(self._short.list_promotable(), "short")
+        middle_to_long  = self._promote_many(self._middle.list_promotable(), "middle")
+        return {"short_to_middle": short_to_middle, "middle_to_long": middle_to_long}
+
+    def _promote_many(self, atom_ids: List[str], from_tier: str) -> int:
+        """
+        promote หลาย Atom ไป Tier ถัดไปในครั้งเดียว
+        เขียนด้วย write_many (fsync directory ครั้งเดียว)
+        แล้วลบจาก Tier เดิมเฉพาะตัวที่เขียนสำเร็จ
+        """
+        to_tier = self._next_tier(from_tier)
+        if not to_tier or not atom_ids:
+            return 0
+        source = self._get_tier(from_tier)
+        items = [
+            (atom_id, data)
+            for atom_id, data in zip(atom_ids, source.read_many(atom_ids))
+            if data is not None
+        ]
+        written = self._get_tier(to_tier).write_many(items)
+        for atom_id in written:
+            source.delete(atom_id)
+            self._logger.info(
+                "[MemoryController] PROMOTE %s %s → %s", atom_id[:8], from_tier, to_tier
+            )
+        return len(written)
 
     # ─────────────────────────────────────────
     # Cleanup
@@ -362,8 +381,9 @@ class MemoryController:
             if self._middle.delete(atom_id): summary["middle"] += 1
         for atom_id in self._long.list_expired():
             if self._long.delete(atom_id):   summary["long"] += 1
-        promotable = set(self._short.list_promotable())
-        for atom_id in self._short.list_stale():
+        short = self._short.classify()         # stale + promotable ในรอบเดียว
+        promotable = set(short["promotable"])
+        for atom_id in short["stale"]:
             if atom_id not in promotable:
                 if self._short.delete(atom_id): summary["short"] += 1
         return summary
@@ -10,21 +10,32 @@ It can detect and fix various types of corruption including:
 - Header corruption
 """
 
-import struct
-import zlib
+import mmap
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Iterator, Optional, List, Tuple
 from .AtomStructure import (
     AtomData,
     AtomHeader,
     AtomBinaryFormat,
     MAGIC,
     VERSION,
+    SUPPORTED_VERSIONS,
     HEADER_SIZE,
     FOOTER_SIZE,
+    _HEADER,
+    _CRC,
+    checksum,
 )
 
-@dataclass
+# Upper bound on magic-byte hits tried by aggressive repair
+MAX_MAGIC_CANDIDATES = 1024
+
+@dataclass(slots=True)
 class RepairReport:
     """Report of repair operations performed"""
     success: bool
@@ -77,26 +88,43 @@ class AtomRepair:
         """
         Diagnose issues with ATOM binary data without attempting repair
         
+        binary_data may be any bytes-like buffer (bytes, bytearray,
+        memoryview, mmap).
+        
         Returns:
             List of issues found
         """
+        return AtomRepair._diagnose_parsed(binary_data)[0]
+    
+    @staticmethod
+    def _diagnose_parsed(binary_data: bytes) -> Tuple[List[str], Optional[AtomHeader], Optional[int]]:
+        """
+        Diagnose and also hand back the work already done
+        
+        Returns:
+            (issues, parsed header or None, calculated CRC32 or None)
+        """
         issues = []
+        header = None
+        calculated_crc = None
         
         # Check minimum size
         if len(binary_data) < HEADER_SIZE + FOOTER_SIZE:
             issues.append(f"File too small: {len(binary_data)} bytes (minimum: {HEADER_SIZE + FOOTER_SIZE})")
-            return issues
+            return issues, header, calculated_crc
+        
+        mv = memoryview(binary_data)
         
         # Check magic bytes
-        if binary_data[:4] != MAGIC:
-            issues.append(f"Invalid magic bytes: {binary_data[:4]} (expected: {MAGIC})")
+        if mv[:4] != MAGIC:
+            issues.append(f"Invalid magic bytes: {bytes(mv[:4])} (expected: {MAGIC})")
         
         # Try to parse header
         try:
-            header = AtomHeader.from_bytes(binary_data[:HEADER_SIZE])
+            header = AtomHeader.from_bytes(mv)
             
             # Check version
-            if header.version != VERSION:
+            if header.version not in SUPPORTED_VERSIONS:
                 issues.append(f"Unsupported version: {header.version} (current: {VERSION})")
             
             # Check reserved field
@@ -105,14 +133,14 @@ class AtomRepair:
             
             # Check size consistency
             expected_size = HEADER_SIZE + header.payload_len + header.metadata_len + header.source_len + FOOTER_SIZE
-            if len(binary_data) != expected_size:
-                issues.append(f"Size mismatch: {len(binary_data)} != {expected_size}")
+            if len(mv) != expected_size:
+                issues.append(f"Size mismatch: {len(mv)} != {expected_size}")
             
             # Check CRC32
-            if len(binary_data) >= expected_size:
+            if len(mv) >= expected_size:
                 crc_offset = expected_size - FOOTER_SIZE
-                stored_crc = struct.unpack('>I', binary_data[crc_offset:crc_offset + FOOTER_SIZE])[0]
-                calculated_crc = zlib.crc32(binary_data[:crc_offset]) & 0xffffffff
+                stored_crc = _CRC.unpack_from(mv, crc_offset)[0]
+                calculated_crc = checksum(header.version, mv[:crc_offset])
                 
                 if stored_crc != calculated_crc:
                     issues.append(f"CRC32 mismatch: {stored_crc:08x} != {calculated_crc:08x}")
@@ -120,32 +148,41 @@ class AtomRepair:
         except Exception as e:
             issues.append(f"Header parsing error: {e}")
         
-        return issues
+        return issues, header, calculated_crc
     
     @staticmethod
-    def repair(binary_data: bytes, aggressive: bool = False) -> RepairReport:
+    def repair(binary_data: bytes, aggressive: bool = False,
+               issues: Optional[List[str]] = None) -> RepairReport:
         """
         Attempt to repair corrupted ATOM binary data
         
         Args:
-            binary_data: Corrupted binary data
+            binary_data: Corrupted binary data (any bytes-like buffer, e.g. mmap)
             aggressive: If True, attempt more aggressive repair strategies
+            issues: Result of an earlier diagnose() on the same data —
+                    skips diagnosing again when provided
             
         Returns:
             RepairReport with details of repair attempt
         """
-        issues = []
         fixes = []
         warnings = []
         original_size = len(binary_data)
         
-        # Diagnose first
-        issues = AtomRepair.diagnose(binary_data)
+        # Diagnose first — keep the parsed header and CRC32 for reuse below
+        if issues is None:
+            issues, header, calculated_crc = AtomRepair._diagnose_parsed(binary_data)
+        else:
+            issues, header, calculated_crc = list(issues), None, None
         
         if not issues:
             # No issues, return original data
             try:
-                data = AtomBinaryFormat.decode(binary_data)
+                if header is not None and calculated_crc is not None:
+                    # Already verified by diagnose — no second CRC32 pass
+                    data = AtomBinaryFormat._unpack_body(memoryview(binary_data), header)
+                else:
+                    data = AtomBinaryFormat.decode(binary_data)
                 return RepairReport(
                     success=True,
                     original_size=original_size,
@@ -165,31 +202,34 @@ class AtomRepair:
         if repaired_data[:4] != MAGIC:
             repaired_data[:4] = MAGIC
             fixes.append("Repaired magic bytes to 'ATOM'")
+            header = None
         
         # Fix 2: Try to extract header
-        try:
-            header = AtomHeader.from_bytes(bytes(repaired_data[:HEADER_SIZE]))
-        except Exception as e:
-            if aggressive:
-                # Aggressive: Try to reconstruct header from partial data
-                fixes.append(f"Attempted header reconstruction (aggressive mode)")
-                return AtomRepair._aggressive_repair(binary_data, issues, fixes, warnings)
-            else:
-                return RepairReport(
-                    success=False,
-                    original_size=original_size,
-                    repaired_size=len(repaired_data),
-                    issues_found=issues,
-                    fixes_applied=fixes,
-                    warnings=[f"Header too corrupted. Try aggressive mode."],
-                    recovered_data=None
-                )
+        if header is None:
+            try:
+                header = AtomHeader.from_bytes(repaired_data)
+            except Exception as e:
+                if aggressive:
+                    # Aggressive: Try to reconstruct header from partial data
+                    fixes.append(f"Attempted header reconstruction (aggressive mode)")
+                    return AtomRepair._aggressive_repair(binary_data, issues, fixes, warnings)
+                else:
+                    return RepairReport(
+                        success=False,
+                        original_size=original_size,
+                        repaired_size=len(repaired_data),
+                        issues_found=issues,
+                        fixes_applied=fixes,
+                        warnings=[f"Header too corrupted. Try aggressive mode."],
+                        recovered_data=None
+                    )
         
         # Fix 3: Repair reserved field
         if header.reserved != 0:
-            struct.pack_into('>H', repaired_data, 6, 0)
+            repaired_data[6:8] = b'\x00\x00'
             fixes.append("Reset reserved field to 0")
             header.reserved = 0
+            calculated_crc = None
         
         # Fix 4: Handle size mismatches
         expected_size = HEADER_SIZE + header.payload_len + header.metadata_len + header.source_len + FOOTER_SIZE
@@ -199,7 +239,7 @@ class AtomRepair:
             if aggressive:
                 # Try to salvage what we can
                 fixes.append("File truncated - attempting partial recovery")
-                return AtomRepair._recover_truncated(bytes(repaired_data), header, issues, fixes, warnings)
+                return AtomRepair._recover_truncated(repaired_data, header, issues, fixes, warnings)
             else:
                 warnings.append(f"File truncated: {len(repaired_data)} < {expected_size}. Try aggressive mode.")
                 return RepairReport(
@@ -218,14 +258,16 @@ class AtomRepair:
             fixes.append(f"Truncated {len(binary_data) - expected_size} extra bytes at end")
         
         # Fix 5: Recalculate and fix CRC32
+        # Header + body bytes untouched since diagnose → reuse its CRC32
         crc_offset = expected_size - FOOTER_SIZE
-        calculated_crc = zlib.crc32(repaired_data[:crc_offset]) & 0xffffffff
-        struct.pack_into('>I', repaired_data, crc_offset, calculated_crc)
+        if calculated_crc is None:
+            calculated_crc = checksum(header.version, memoryview(repaired_data)[:crc_offset])
+        _CRC.pack_into(repaired_data, crc_offset, calculated_crc)
         fixes.append(f"Recalculated CRC32: {calculated_crc:08x}")
         
-        # Try to decode repaired data
+        # Size and CRC32 are consistent by construction — unpack directly
         try:
-            recovered_data = AtomBinaryFormat.decode(bytes(repaired_data))
+            recovered_data = AtomBinaryFormat._unpack_body(memoryview(repaired_data), header)
             
             # Validate recovered data makes sense
             if len(recovered_data.payload) == 0 and len(recovered_data.metadata) == 0:
@@ -268,15 +310,17 @@ class AtomRepair:
         
         source_size = min(header.source_len, remaining)
         
-        # Extract what we have
+        # Extract what we have — view slices, one copy per field
+        mv = memoryview(binary_data)
         offset = HEADER_SIZE
-        payload = binary_data[offset:offset + payload_size]
+        payload = bytes(mv[offset:offset + payload_size])
         offset += payload_size
         
-        metadata = binary_data[offset:offset + metadata_size] if metadata_size > 0 else b''
+        metadata = bytes(mv[offset:offset + metadata_size])
         offset += metadata_size
         
-        source = binary_data[offset:offset + source_size] if source_size > 0 else b''
+        source = bytes(mv[offset:offset + source_size])
+        mv.release()
         
         warnings.append(f"Recovered {payload_size}/{header.payload_len} bytes of payload")
         if metadata_size < header.metadata_len:
@@ -309,13 +353,51 @@ class AtomRepair:
                           fixes: List[str], warnings: List[str]) -> RepairReport:
         """Aggressive repair - try to find ATOM structure anywhere in file"""
         
-        # Search for magic bytes
-        magic_positions = []
-        for i in range(len(binary_data) - 4):
-            if binary_data[i:i+4] == MAGIC:
-                magic_positions.append(i)
+        # Try each magic hit lazily — cheap header check first, one CRC32 per
+        # plausible hit, stop at the first intact ATOM
+        mv = memoryview(binary_data)
+        data_len = len(binary_data)
+        fallback_pos = None
+        candidates = 0
         
-        if not magic_positions:
+        for pos in _iter_magic(binary_data, MAX_MAGIC_CANDIDATES):
+            candidates += 1
+            if pos + HEADER_SIZE + FOOTER_SIZE > data_len:
+                continue
+            
+            fields = _HEADER.unpack_from(binary_data, pos)
+            _, version, _, reserved, _, payload_len, metadata_len, source_len = fields
+            expected_size = HEADER_SIZE + payload_len + metadata_len + source_len + FOOTER_SIZE
+            
+            # Body would run past end of data → repair() would fail as truncated
+            if expected_size > data_len - pos:
+                continue
+            
+            if fallback_pos is None:
+                fallback_pos = pos
+            
+            if version not in SUPPORTED_VERSIONS or reserved != 0:
+                continue
+            
+            crc_offset = pos + expected_size - FOOTER_SIZE
+            stored_crc = _CRC.unpack_from(binary_data, crc_offset)[0]
+            if checksum(version, mv[pos:crc_offset]) != stored_crc:
+                continue
+            
+            # Intact ATOM — accept without re-running repair()
+            fixes.append(f"Found {candidates} potential ATOM structure(s)")
+            fixes.append(f"Successfully recovered from offset {pos}")
+            return RepairReport(
+                success=True,
+                original_size=data_len,
+                repaired_size=expected_size,
+                issues_found=issues,
+                fixes_applied=fixes,
+                warnings=warnings,
+                recovered_data=AtomBinaryFormat._unpack_body(mv[pos:], AtomHeader(*fields))
+            )
+        
+        if not candidates:
             warnings.append("No ATOM magic bytes found anywhere in file")
             return RepairReport(
                 success=False,
@@ -327,23 +409,22 @@ class AtomRepair:
                 recovered_data=None
             )
         
-        fixes.append(f"Found {len(magic_positions)} potential ATOM structure(s)")
+        fixes.append(f"Found {candidates} potential ATOM structure(s)")
+        if candidates >= MAX_MAGIC_CANDIDATES:
+            warnings.append(f"Stopped scanning after {MAX_MAGIC_CANDIDATES} magic byte matches")
         
-        # Try each position
-        for pos in magic_positions:
+        # No intact ATOM — rebuild from the first structurally plausible header
+        if fallback_pos is not None:
             try:
-                # Try to parse from this position
-                if pos + HEADER_SIZE <= len(binary_data):
-                    candidate = binary_data[pos:]
-                    report = AtomRepair.repair(candidate, aggressive=False)
-                    
-                    if report.success:
-                        fixes.append(f"Successfully recovered from offset {pos}")
-                        report.fixes_applied = fixes + report.fixes_applied
-                        report.issues_found = issues
-                        return report
+                report = AtomRepair.repair(binary_data[fallback_pos:], aggressive=False)
+                
+                if report.success:
+                    fixes.append(f"Successfully recovered from offset {fallback_pos}")
+                    report.fixes_applied = fixes + report.fixes_applied
+                    report.issues_found = issues
+                    return report
             except:
-                continue
+                pass
         
         warnings.append("Could not recover valid ATOM structure from any position")
         return RepairReport(
@@ -370,12 +451,10 @@ class AtomRepair:
         Returns:
             RepairReport
         """
-        # Read corrupted file
-        with open(input_path, 'rb') as f:
-            binary_data = f.read()
-        
-        # Attempt repair
-        report = AtomRepair.repair(binary_data, aggressive=aggressive)
+        # Repair straight from the mapped file — no full-file read into the heap.
+        # The report only holds copied bytes, so the mapping can close after.
+        with _mapped(input_path) as binary_data:
+            report = AtomRepair.repair(binary_data, aggressive=aggressive)
         
         # Save repaired file if successful
         if report.success and output_path:
@@ -386,21 +465,182 @@ class AtomRepair:
         
         return report
 
+    
+    @staticmethod
+    def repair_files(input_paths: List[str], output_paths: Optional[List[str]] = None,
+                     aggressive: bool = False) -> List[RepairReport]:
+        """
+        Repair many ATOM files as one batch
+        
+        I/O is split into phases — read every input, repair in memory, then
+        write every output — using raw os-level calls so each file costs only
+        open/fstat/read/close instead of the buffered file object setup.
+        
+        Args:
+            input_paths: Paths to corrupted files
+            output_paths: Paths to save repaired files, parallel to input_paths (optional)
+            aggressive: Use aggressive repair strategies
+            
+        Returns:
+            List of RepairReport in the same order as input_paths
+        """
+        if output_paths is not None and len(output_paths) != len(input_paths):
+            raise ValueError(f"output_paths length mismatch: {len(output_paths)} != {len(input_paths)}")
+        
+        # Phase 1: read all inputs
+        blobs = [_read_raw(path) for path in input_paths]
+        
+        # Phase 2: repair in memory
+        reports = [AtomRepair.repair(blob, aggressive=aggressive) for blob in blobs]
+        
+        # Phase 3: write repaired outputs
+        if output_paths:
+            for report, output_path in zip(reports, output_paths):
+                if report.success:
+                    _write_raw(output_path, AtomBinaryFormat.encode(report.recovered_data))
+                    report.fixes_applied.append(f"Saved repaired file to {output_path}")
+        
+        return reports
+    
+    @staticmethod
+    def repair_many(input_paths: List[str], output_paths: Optional[List[str]] = None,
+                    aggressive: bool = False, workers: Optional[int] = None) -> List[RepairReport]:
+        """
+        Repair many ATOM files in parallel across CPU cores
+        
+        Paths are split into one contiguous chunk per worker and each chunk
+        runs through repair_files() in its own process. Only paths cross the
+        process boundary on the way in; workers read the files themselves.
+        
+        Args:
+            input_paths: Paths to corrupted files
+            output_paths: Paths to save repaired files, parallel to input_paths (optional)
+            aggressive: Use aggressive repair strategies
+            workers: Number of processes (default: os.cpu_count())
+            
+        Returns:
+            List of RepairReport in the same order as input_paths
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(input_paths) <= 1:
+            return AtomRepair.repair_files(input_paths, output_paths, aggressive)
+        
+        if output_paths is not None and len(output_paths) != len(input_paths):
+            raise ValueError(f"output_paths length mismatch: {len(output_paths)} != {len(input_paths)}")
+        
+        chunk = -(-len(input_paths) // workers)
+        bounds = [(start, start + chunk) for start in range(0, len(input_paths), chunk)]
+        
+        # Never fork: callers (the tiers) may hold ThreadPoolExecutors and
+        # locks that a forked child would inherit mid-operation
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        
+        reports = []
+        with ProcessPoolExecutor(max_workers=len(bounds), mp_context=ctx) as pool:
+            futures = [
+                pool.submit(
+                    AtomRepair.repair_files,
+                    input_paths[start:end],
+                    output_paths[start:end] if output_paths else None,
+                    aggressive,
+                )
+                for start, end in bounds
+            ]
+            for future in futures:
+                reports.extend(future.result())
+        
+        return reports
+
+
+def _iter_magic(data: bytes, limit: int) -> Iterator[int]:
+    """Yield offsets of MAGIC in data, at most limit of them"""
+    pos = 0
+    for _ in range(limit):
+        i = data.find(MAGIC, pos)
+        if i < 0:
+            return
+        yield i
+        pos = i + 1
+
+
+@contextmanager
+def _mapped(filepath: str):
+    """
+    Read-only mmap of a whole file
+    
+    Empty files cannot be mapped and are yielded as b''. Views taken from
+    the mapping must be released before the with-block exits.
+    """
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _read_raw(filepath: str) -> bytes:
+    """Read whole file with a single sized os.read (looping only on short reads)"""
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _write_raw(filepath: str, data: bytes) -> None:
+    """Write whole file with os.write (looping only on short writes)"""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=4096)
+def _verify_cached(filepath: str, mtime_ns: int, size: int) -> bool:
+    """
+    Read and decode file, memoized by (path, mtime_ns, size)
+    
+    A rewritten file gets a new key, so no explicit invalidation is needed.
+    """
+    try:
+        with _mapped(filepath) as data:
+            try:
+                AtomBinaryFormat.decode(data)
+                return True
+            except ValueError:
+                return False
+    except OSError:
+        return False
+
 
 def quick_check(filepath: str) -> bool:
     """
     Quick check if ATOM file is valid
     
+    Results are cached per (path, mtime, size), so repeated checks of an
+    unchanged file skip the read and CRC32 verification.
+    
     Returns:
         True if valid, False if corrupted
     """
     try:
-        with open(filepath, 'rb') as f:
-            data = f.read()
-        AtomBinaryFormat.decode(data)
-        return True
-    except:
+        st = os.stat(filepath)
+    except OSError:
         return False
+    return _verify_cached(filepath, st.st_mtime_ns, st.st_size)
 
 
 def auto_repair(filepath: str, backup: bool = True) -> bool:
@@ -19,22 +19,132 @@ Binary Structure:
 
 [ Footer ]
 └─ crc32 (4)            : uint32 (header + body)
+                          version 1 → CRC32/IEEE (zlib)
+                          version 2 → CRC32C (Castagnoli)
 """
 
+import mmap
+import os
 import struct
 import time
 import zlib
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    from pycrc32 import crc32 as _crc32_native
+except ImportError:          # optional — PCLMULQDQ CRC32, fallback เป็น zlib
+    _crc32_native = None
+
+try:
+    from google_crc32c import value as _crc32c_native
+except ImportError:          # optional — try the other binding, then pure Python
+    try:
+        from crc32c import crc32c as _crc32c_native
+    except ImportError:
+        _crc32c_native = None
 
 # Constants
 MAGIC = b"ATOM"
 HEADER_SIZE = 28  # 4 + 1 + 1 + 2 + 8 + 4 + 4 + 4 = 28 bytes
 FOOTER_SIZE = 4
 VERSION = 1
+VERSION_CRC32C = 2
+SUPPORTED_VERSIONS = (VERSION, VERSION_CRC32C)
+
+# Precompiled layouts — format string parsed once at import
+_HEADER = struct.Struct('>4sBBHqIII')
+_CRC = struct.Struct('>I')
+
+# Same layout as _HEADER — lets a batch of headers be parsed in one NumPy call
+_HEADER_DTYPE = np.dtype([
+    ('magic',         'S4'),
+    ('version',       'u1'),
+    ('flags',         'u1'),
+    ('reserved',      '>u2'),
+    ('created_ts_ms', '>i8'),
+    ('payload_len',   '>u4'),
+    ('metadata_len',  '>u4'),
+    ('source_len',    '>u4'),
+])
+
+
+def _crc32c_table() -> List[int]:
+    """Reflected CRC32C lookup table (polynomial 0x82F63B78)"""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+_CRC32C_TABLE = _crc32c_table()
+
+
+def crc32c(data) -> int:
+    """
+    CRC32C (Castagnoli) of a bytes-like object
+    
+    Uses the hardware-accelerated google-crc32c / crc32c binding when
+    installed; otherwise a table-driven pure-Python fallback so version 2
+    files stay readable everywhere.
+    """
+    if _crc32c_native is not None:
+        return _crc32c_native(data)
+    
+    table = _CRC32C_TABLE
+    crc = 0xffffffff
+    for byte in memoryview(data).cast('B'):
+        crc = table[(crc ^ byte) & 0xff] ^ (crc >> 8)
+    return crc ^ 0xffffffff
+
+
+def _probe_crc32_native() -> Optional[bool]:
+    """
+    Check the optional CRC32 binding once at import
+    
+    Returns None if it is missing or disagrees with zlib, otherwise whether
+    it must be given bytes (True) or accepts any buffer (False).
+    """
+    if _crc32_native is None:
+        return None
+    sample = b"123456789"
+    expected = zlib.crc32(sample) & 0xffffffff
+    try:
+        if _crc32_native(memoryview(sample)) & 0xffffffff == expected:
+            return False
+    except TypeError:
+        pass
+    try:
+        if _crc32_native(sample) & 0xffffffff == expected:
+            return True
+    except TypeError:
+        pass
+    return None
+
+_CRC32_NATIVE_NEEDS_BYTES = _probe_crc32_native()
 
 
-@dataclass
+def crc32(data) -> int:
+    """CRC32/IEEE of a bytes-like object — hardware binding when available, else zlib"""
+    if _CRC32_NATIVE_NEEDS_BYTES is None:
+        return zlib.crc32(data) & 0xffffffff
+    if _CRC32_NATIVE_NEEDS_BYTES and not isinstance(data, bytes):
+        data = bytes(data)
+    return _crc32_native(data) & 0xffffffff
+
+
+def checksum(version: int, data) -> int:
+    """Footer checksum for a format version (unknown versions → CRC32/IEEE)"""
+    if version == VERSION_CRC32C:
+        return crc32c(data)
+    return crc32(data)
+
+
+@dataclass(slots=True)
 class AtomHeader:
     """ATOM Binary Format Header"""
     magic: bytes = MAGIC
@@ -48,8 +158,7 @@ class AtomHeader:
     
     def to_bytes(self) -> bytes:
         """Convert header to bytes"""
-        return struct.pack(
-            '>4sBBHqIII',
+        return _HEADER.pack(
             self.magic,
             self.version,
             self.flags,
@@ -62,16 +171,17 @@ class AtomHeader:
     
     @classmethod
     def from_bytes(cls, data: bytes) -> 'AtomHeader':
-        """Parse header from bytes"""
+        """Parse header from the start of a bytes-like buffer (no slicing needed)"""
         if len(data) < HEADER_SIZE:
             raise ValueError(f"Header data too short: {len(data)} < {HEADER_SIZE}")
         
-        unpacked = struct.unpack('>4sBBHqIII', data[:HEADER_SIZE])
+        # 4-byte compare rejects garbage before unpacking anything
+        if data[:4] != MAGIC:
+            raise ValueError(f"Invalid magic: {bytes(data[:4])} != {MAGIC}")
         
-        magic, version, flags, reserved, created_ts_ms, payload_len, metadata_len, source_len = unpacked
+        unpacked = _HEADER.unpack_from(data, 0)
         
-        if magic != MAGIC:
-            raise ValueError(f"Invalid magic: {magic} != {MAGIC}")
+        magic, version, flags, reserved, created_ts_ms, payload_len, metadata_len, source_len = unpacked
         
         return cls(
             magic=magic,
@@ -84,7 +194,7 @@ class AtomHeader:
             source_len=source_len
         )
 
-@dataclass
+@dataclass(slots=True)
 class AtomData:
     """ATOM Binary Format Data Container"""
     payload: bytes
@@ -95,49 +205,62 @@ class AtomData:
     
     def __post_init__(self):
         if self.created_ts_ms is None:
-            self.created_ts_ms = int(time.time() * 1000)
+            self.created_ts_ms = time.time_ns() // 1_000_000
 
 
 class AtomBinaryFormat:
     """Handler for ATOM Binary Format"""
     
     @staticmethod
-    def encode(data: AtomData) -> bytes:
+    def encode(data: AtomData, version: int = VERSION) -> bytes:
         """
         Encode AtomData into ATOM binary format
         
         Args:
             data: AtomData object containing payload, metadata, and source
+            version: Format version — VERSION (CRC32) or VERSION_CRC32C
             
         Returns:
             Complete binary data with header, body, and footer
         """
-        # Create header
-        header = AtomHeader(
-            version=VERSION,
-            flags=data.flags,
-            reserved=0,
-            created_ts_ms=data.created_ts_ms,
-            payload_len=len(data.payload),
-            metadata_len=len(data.metadata),
-            source_len=len(data.source)
-        )
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported version: {version}")
         
-        # Build header bytes
-        header_bytes = header.to_bytes()
+        payload_len = len(data.payload)
+        metadata_len = len(data.metadata)
+        source_len = len(data.source)
+        total = HEADER_SIZE + payload_len + metadata_len + source_len + FOOTER_SIZE
         
-        # Build body bytes
-        body_bytes = data.payload + data.metadata + data.source
+        # One buffer of the final size — header, body, footer written in place
+        buf = bytearray(total)
         
-        # Calculate CRC32 (header + body)
-        crc_data = header_bytes + body_bytes
-        crc32 = zlib.crc32(crc_data) & 0xffffffff
+        # Header
+        _HEADER.pack_into(
+            buf, 0,
+            MAGIC,
+            version,
+            data.flags,
+            0,
+            data.created_ts_ms,
+            payload_len,
+            metadata_len,
+            source_len
+        )
         
-        # Build footer
-        footer_bytes = struct.pack('>I', crc32)
+        # Body
+        offset = HEADER_SIZE
+        buf[offset:offset + payload_len] = data.payload
+        offset += payload_len
+        buf[offset:offset + metadata_len] = data.metadata
+        offset += metadata_len
+        buf[offset:offset + source_len] = data.source
+        offset += source_len
+        
+        # Footer: CRC32 / CRC32C (header + body)
+        crc32 = checksum(version, memoryview(buf)[:offset])
+        _CRC.pack_into(buf, offset, crc32)
         
-        # Combine all parts
-        return header_bytes + body_bytes + footer_bytes
+        return bytes(buf)
     
     @staticmethod
     def decode(binary_data: bytes) -> AtomData:
@@ -146,6 +269,7 @@ class AtomBinaryFormat:
         
         Args:
             binary_data: Complete binary data with header, body, and footer
+                         (bytes or any buffer, e.g. an mmap)
             
         Returns:
             AtomData object
@@ -156,36 +280,117 @@ class AtomBinaryFormat:
         if len(binary_data) < HEADER_SIZE + FOOTER_SIZE:
             raise ValueError("Binary data too short")
         
-        # Parse header
-        header = AtomHeader.from_bytes(binary_data[:HEADER_SIZE])
+        # Zero-copy view — slices below do not allocate until materialized.
+        # Released on exit so an mmap passed in can be closed right after,
+        # even when decoding raises.
+        with memoryview(binary_data) as mv:
+            # Parse header
+            header = AtomHeader.from_bytes(mv)
+            
+            # Calculate expected total size
+            expected_size = HEADER_SIZE + header.payload_len + header.metadata_len + header.source_len + FOOTER_SIZE
+            
+            if len(mv) != expected_size:
+                raise ValueError(f"Size mismatch: {len(mv)} != {expected_size}")
+            
+            # Extract and verify CRC32
+            offset = expected_size - FOOTER_SIZE
+            stored_crc32 = _CRC.unpack_from(mv, offset)[0]
+            
+            # Calculate CRC32 of header + body (algorithm chosen by version)
+            calculated_crc32 = checksum(header.version, mv[:offset])
+            
+            if stored_crc32 != calculated_crc32:
+                raise ValueError(f"CRC32 mismatch: {stored_crc32:08x} != {calculated_crc32:08x}")
+            
+            return AtomBinaryFormat._unpack_body(mv, header)
+    
+    @staticmethod
+    def decode_many(blobs: List[bytes]) -> List[AtomData]:
+        """
+        Decode a batch of ATOM binaries (e.g. a whole tier directory)
         
-        # Calculate expected total size
-        expected_size = HEADER_SIZE + header.payload_len + header.metadata_len + header.source_len + FOOTER_SIZE
+        Headers are stacked and parsed with one vectorized NumPy read;
+        magic and size checks run over the whole batch at once, leaving
+        only the CRC32 and body copy per blob.
         
-        if len(binary_data) != expected_size:
-            raise ValueError(f"Size mismatch: {len(binary_data)} != {expected_size}")
+        Args:
+            blobs: List of complete ATOM binaries
+            
+        Returns:
+            List of AtomData in the same order as blobs
+            
+        Raises:
+            ValueError: If any blob is corrupted or invalid (index in message)
+        """
+        if not blobs:
+            return []
         
-        # Extract body parts
-        offset = HEADER_SIZE
-        payload = binary_data[offset:offset + header.payload_len]
-        offset += header.payload_len
+        views = [memoryview(blob) for blob in blobs]
+        lengths = np.fromiter((len(mv) for mv in views), dtype=np.int64, count=len(views))
         
-        metadata = binary_data[offset:offset + header.metadata_len]
-        offset += header.metadata_len
+        short = np.flatnonzero(lengths < HEADER_SIZE + FOOTER_SIZE)
+        if short.size:
+            raise ValueError(f"[{short[0]}] Binary data too short")
+        
+        headers = np.frombuffer(b"".join(mv[:HEADER_SIZE] for mv in views), dtype=_HEADER_DTYPE)
+        
+        bad_magic = np.flatnonzero(headers['magic'] != MAGIC)
+        if bad_magic.size:
+            i = bad_magic[0]
+            raise ValueError(f"[{i}] Invalid magic: {headers['magic'][i]} != {MAGIC}")
         
-        source = binary_data[offset:offset + header.source_len]
-        offset += header.source_len
+        payload_lens = headers['payload_len'].astype(np.int64)
+        metadata_lens = headers['metadata_len'].astype(np.int64)
+        source_lens = headers['source_len'].astype(np.int64)
+        expected = HEADER_SIZE + payload_lens + metadata_lens + source_lens + FOOTER_SIZE
         
-        # Extract and verify CRC32
-        footer_data = binary_data[offset:offset + FOOTER_SIZE]
-        stored_crc32 = struct.unpack('>I', footer_data)[0]
+        mismatch = np.flatnonzero(lengths != expected)
+        if mismatch.size:
+            i = mismatch[0]
+            raise ValueError(f"[{i}] Size mismatch: {lengths[i]} != {expected[i]}")
         
-        # Calculate CRC32 of header + body
-        crc_data = binary_data[:offset]
-        calculated_crc32 = zlib.crc32(crc_data) & 0xffffffff
+        # Body offsets for every blob, as plain ints for slicing
+        metadata_starts = (HEADER_SIZE + payload_lens).tolist()
+        source_starts = (HEADER_SIZE + payload_lens + metadata_lens).tolist()
+        crc_offsets = (expected - FOOTER_SIZE).tolist()
+        versions = headers['version'].tolist()
+        flags = headers['flags'].tolist()
+        created = headers['created_ts_ms'].tolist()
         
-        if stored_crc32 != calculated_crc32:
-            raise ValueError(f"CRC32 mismatch: {stored_crc32:08x} != {calculated_crc32:08x}")
+        results = []
+        for i, mv in enumerate(views):
+            crc_offset = crc_offsets[i]
+            stored_crc32 = _CRC.unpack_from(mv, crc_offset)[0]
+            calculated_crc32 = checksum(versions[i], mv[:crc_offset])
+            if stored_crc32 != calculated_crc32:
+                raise ValueError(f"[{i}] CRC32 mismatch: {stored_crc32:08x} != {calculated_crc32:08x}")
+            
+            results.append(AtomData(
+                payload=bytes(mv[HEADER_SIZE:metadata_starts[i]]),
+                metadata=bytes(mv[metadata_starts[i]:source_starts[i]]),
+                source=bytes(mv[source_starts[i]:crc_offset]),
+                flags=flags[i],
+                created_ts_ms=created[i]
+            ))
+        
+        return results
+    
+    @staticmethod
+    def _unpack_body(mv: memoryview, header: AtomHeader) -> AtomData:
+        """
+        Copy payload/metadata/source out of an already-verified buffer
+        
+        Callers must have checked size and CRC32 against header first.
+        """
+        offset = HEADER_SIZE
+        payload = bytes(mv[offset:offset + header.payload_len])
+        offset += header.payload_len
+        
+        metadata = bytes(mv[offset:offset + header.metadata_len])
+        offset += header.metadata_len
+        
+        source = bytes(mv[offset:offset + header.source_len])
         
         return AtomData(
             payload=payload,
@@ -204,7 +409,19 @@ class AtomBinaryFormat:
     
     @staticmethod
     def load(filepath: str) -> AtomData:
-        """Load AtomData from file"""
-        with open(filepath, 'rb') as f:
-            binary_data = f.read()
-        return AtomBinaryFormat.decode(binary_data)
\ No newline at end of file
+        """
+        Load AtomData from file
+        
+        The file is memory-mapped and decoded in place: CRC verification
+        and field extraction share one page-cache-backed view, and only
+        the payload/metadata/source copies are allocated.
+        """
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            # Empty files cannot be mapped — let decode reject them
+            if os.fstat(fd).st_size == 0:
+                return AtomBinaryFormat.decode(b'')
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                return AtomBinaryFormat.decode(mm)
+        finally:
+            os.close(fd)
\ No newline at end of file
@@ -14,7 +14,7 @@ File Structure:
     เช่น short/conversation/python/01A/a1b2c3d4.atom
 
 Shard:
-    - ใช้ hex ของ atom_id
+    - ใช้ hex ของ blake2b(atom_id) — กระจายเท่ากันทุก bucket แม้ id ไม่สุ่ม
     - depth เริ่มต้น 2 ตัว
     - auto-expand เมื่อ folder entries > OS_FOLDER_LIMIT
 """
@@ -22,12 +22,20 @@ Shard:
 from __future__ import annotations
 
 import json
+import math
+import os
 import time
 import hashlib
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:          # optional — fallback เป็น json มาตรฐาน
+    orjson = None
+
 
 # ============================================================================
 # CONSTANTS
@@ -37,13 +45,14 @@ OS_FOLDER_LIMIT  = 4096   # entries ที่ระบบไฟล์ทำง
 SHARD_DEPTH_MIN  = 2      # depth เริ่มต้น เช่น "01"
 SHARD_DEPTH_MAX  = 8      # depth สูงสุด เช่น "01A2B3C4"
 MAJORITY_RATIO   = 0.5    # Atom ที่ context เดียวกันต้องเกินครึ่ง
+CONFIDENCE_SCALE = 65535  # quantize confidence เป็น uint16 ตอนเก็บแบบ compact
 
 
 # ============================================================================
 # KNOWLET DATA
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class KnowletData:
     """
     Knowlet — ข้อสรุปจาก Atom หลายๆ ตัว
@@ -70,7 +79,7 @@ class KnowletData:
     parent_confidence: float
     is_promoted:       bool  = False
     reviewer_id:       Optional[str] = None
-    created_at:        int   = field(default_factory=lambda: int(time.time() * 1000))
+    created_at:        int   = field(default_factory=lambda: time.time_ns() // 1_000_000)
     promoted_at:       Optional[int] = None
 
     def __post_init__(self):
@@ -105,8 +114,8 @@ class KnowletData:
         """
         Factory method สร้าง Knowlet พร้อม auto-generate knowlet_id
         """
-        raw = f"{category}:{primary}:{summary}:{time.time()}".encode()
-        knowlet_id = hashlib.sha256(raw).hexdigest()[:16]
+        raw = f"{category}:{primary}:{summary}:{time.time_ns()}".encode()
+        knowlet_id = hashlib.blake2b(raw, digest_size=8).hexdigest()
 
         return cls(
             knowlet_id=knowlet_id,
@@ -139,7 +148,7 @@ class KnowletData:
             is_promoted=True,
             reviewer_id=reviewer_id,
             created_at=self.created_at,
-            promoted_at=int(time.time() * 1000),
+            promoted_at=time.time_ns() // 1_000_000,
         )
 
     def to_dict(self) -> dict:
@@ -173,11 +182,38 @@ class KnowletData:
             promoted_at=data.get('promoted_at'),
         )
 
+    def to_dict_compact(self) -> dict:
+        """
+        เหมือน to_dict แต่ quantize confidence เป็น uint16 (0–65535)
+        ใช้ตอนเก็บลง disk — ในหน่วยความจำยังเป็น float เหมือนเดิม
+
+        confidence ปัดขึ้น / parent_confidence ปัดลง
+        → ยังรักษา Rule 2 (confidence > parent) หลัง decode เสมอ
+        """
+        data = self.to_dict()
+        del data['confidence'], data['parent_confidence']
+        data['c']  = math.ceil(self.confidence * CONFIDENCE_SCALE)
+        data['pc'] = math.floor(self.parent_confidence * CONFIDENCE_SCALE)
+        return data
+
+    @classmethod
+    def from_dict_compact(cls, data: dict) -> 'KnowletData':
+        return cls.from_dict({
+            **data,
+            'confidence':        data['c']  / CONFIDENCE_SCALE,
+            'parent_confidence': data['pc'] / CONFIDENCE_SCALE,
+        })
+
     def to_json(self) -> str:
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY — confidence ที่คำนวณด้วย numpy (np.float64) ยัง dump ได้เหมือน json
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
         return json.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> 'KnowletData':
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(json_str))
         return cls.from_dict(json.loads(json_str))
 
     def __str__(self) -> str:
@@ -195,6 +231,70 @@ class KnowletData:
 # SHARD PATH LOGIC
 # ============================================================================
 
+@lru_cache(maxsize=65536)
+def _shard_hash(atom_id: str) -> str:
+    """hex 8 ตัว (= SHARD_DEPTH_MAX) จาก blake2b ของ atom_id — cache ไว้เพราะ id เดิมถูกเรียกซ้ำบ่อย"""
+    return hashlib.blake2b(atom_id.encode(), digest_size=4).hexdigest().upper()
+
+
+@lru_cache(maxsize=4096)
+def _topic_dir(base: Path, tier: str, category: str, primary: str) -> Path:
+    """{base}/{tier}/{category}/{primary} — cache ไว้ ไม่ต้องต่อ Path ใหม่ทุกครั้ง"""
+    return base / tier / category / primary
+
+
+# mtime ที่ใกล้เวลาปัจจุบันกว่านี้ยังไม่จำ — filesystem ที่ mtime หยาบ
+# อาจสร้าง folder ใหม่ใน tick เดียวกันหลัง scan โดย mtime ไม่เปลี่ยน
+_MTIME_RACY_NS = 100_000_000
+
+# topic_dir → (st_mtime_ns, ชื่อ folder ทั้งหมดใน topic)
+_topic_folder_cache: dict[Path, tuple[int, frozenset[str]]] = {}
+
+
+def _topic_folders(topic_dir: Path) -> frozenset[str]:
+    """
+    ชื่อ shard folder ใน topic_dir — stat topic_dir ครั้งเดียวต่อครั้งที่เรียก
+    scandir ใหม่เฉพาะเมื่อ mtime ของ topic_dir เปลี่ยน (มี folder เพิ่ม/ลบ)
+    """
+    try:
+        mtime = os.stat(topic_dir).st_mtime_ns
+    except FileNotFoundError:
+        return frozenset()
+    cached = _topic_folder_cache.get(topic_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(topic_dir) as it:
+            names = frozenset(e.name for e in it if e.is_dir())
+    except FileNotFoundError:
+        return frozenset()
+    if time.time_ns() - mtime > _MTIME_RACY_NS:
+        if len(_topic_folder_cache) >= 4096:
+            _topic_folder_cache.clear()
+        _topic_folder_cache[topic_dir] = (mtime, names)
+    return names
+
+
+def _shard_file(topic_dir: Path, file_id: str, depth: int, filename: str) -> Path:
+    """
+    path ของไฟล์ใน topic_dir ตาม shard แบบ hash
+    ถ้ายังไม่มีไฟล์ที่ path ใหม่ แต่มีอยู่ใน folder แบบเก่า (prefix ของ id ตรงๆ)
+    → คืน path เก่า ไฟล์ที่เขียนก่อนเปลี่ยน layout จึงยังอ่าน/ลบได้
+    (ย้ายเข้า layout ใหม่เองตอน shard expand)
+
+    probe path เก่าเฉพาะเมื่อ topic มี folder ชื่อแบบเก่าของ id นี้อยู่จริง
+    topic ที่ไม่มี layout เก่า → ไม่ stat ไฟล์เลย ผู้เรียกเช็คเองครั้งเดียว
+    """
+    shard  = ShardPath.get_shard(file_id, depth)
+    path   = topic_dir / shard / filename
+    legacy = file_id[:depth].upper()
+    if legacy != shard and legacy in _topic_folders(topic_dir) and not path.exists():
+        legacy_path = topic_dir / legacy / filename
+        if legacy_path.exists():
+            return legacy_path
+    return path
+
+
 class ShardPath:
     """
     จัดการ file path ตาม structure:
@@ -205,32 +305,48 @@ class ShardPath:
 
     @staticmethod
     def get_shard(atom_id: str, depth: int) -> str:
-        """คำนวณ shard folder จาก atom_id + depth"""
-        return atom_id[:depth].upper()
+        """
+        คำนวณ shard folder จาก atom_id + depth
+
+        ใช้ hash ของ atom_id แทน prefix ตรงๆ — id ที่ขึ้นต้นเหมือนกัน
+        (เช่น time-prefixed) จะไม่กองอยู่ folder เดียว
+        depth เพิ่ม → prefix ของ hash ยาวขึ้น ชื่อเดิมยังเป็น prefix ของชื่อใหม่
+        """
+        return _shard_hash(atom_id)[:depth]
 
     @staticmethod
     def detect_depth(topic_path: Path) -> int:
         """
         อ่าน folder จริงแล้วหา shard depth ที่ใช้อยู่
         ถ้าไม่มี folder ใดเลย → ใช้ SHARD_DEPTH_MIN
-        """
-        if not topic_path.exists():
-            return SHARD_DEPTH_MIN
 
-        shards = [p for p in topic_path.iterdir() if p.is_dir()]
-        if not shards:
+        ใช้ os.scandir — DirEntry.is_dir() ใช้ข้อมูลจาก readdir ไม่ต้อง stat ซ้ำ
+        """
+        try:
+            with os.scandir(topic_path) as it:
+                names = [e.name for e in it if e.is_dir()]
+        except FileNotFoundError:
             return SHARD_DEPTH_MIN
 
         # ดู depth จาก folder name ที่มีอยู่
-        return max(len(s.name) for s in shards)
+        return max(map(len, names), default=SHARD_DEPTH_MIN)
 
     @staticmethod
     def should_expand(shard_path: Path) -> bool:
-        """ตรวจว่า shard folder เกิน OS_FOLDER_LIMIT ไหม"""
-        if not shard_path.exists():
+        """
+        ตรวจว่า shard folder เกิน OS_FOLDER_LIMIT ไหม
+        หยุดนับทันทีที่เกิน limit — ไม่ต้องอ่าน folder ทั้งหมด
+        """
+        entries = 0
+        try:
+            with os.scandir(shard_path) as it:
+                for _ in it:
+                    entries += 1
+                    if entries > OS_FOLDER_LIMIT:
+                        return True
+        except FileNotFoundError:
             return False
-        entries = sum(1 for _ in shard_path.iterdir())
-        return entries > OS_FOLDER_LIMIT
+        return False
 
     @staticmethod
     def build_path(
@@ -244,9 +360,11 @@ class ShardPath:
         """
         Build full path สำหรับ atom file
         {base}/{tier}/{category}/{primary}/{shard}/{atom_id}.atom
+        ไฟล์ที่ยังอยู่ใน shard แบบเก่า (prefix ของ id) → คืน path เก่า
         """
-        shard = ShardPath.get_shard(atom_id, depth)
-        return base / tier / category / primary / shard / f"{atom_id}.atom"
+        return _shard_file(
+            _topic_dir(base, tier, category, primary), atom_id, depth, f"{atom_id}.atom"
+        )
 
     @staticmethod
     def build_knowlet_path(
@@ -259,6 +377,9 @@ class ShardPath:
         """
         Build full path สำหรับ knowlet file
         {base}/knowlet/{category}/{primary}/{shard}/{knowlet_id}.knowlet
+        ไฟล์ที่ยังอยู่ใน shard แบบเก่า (prefix ของ id) → คืน path เก่า
         """
-        shard = ShardPath.get_shard(knowlet_id, depth)
-        return base / "knowlet" / category / primary / shard / f"{knowlet_id}.knowlet"
\ No newline at end of file
+        return _shard_file(
+            _topic_dir(base, "knowlet", category, primary),
+            knowlet_id, depth, f"{knowlet_id}.knowlet",
+        )
\ No newline at end of file
@@ -11,23 +11,11 @@ Adapt Layer:
     ImmortalMemory  ←  deserialize               ←  AtomData.payload  ←  .atom file
 """
 
-import json
-import sys
-from pathlib import Path
-
-# ── sys.path setup ───────────────────────────────────────────────
-_tiers_dir     = Path(__file__).parent                          # Core/Memory/Tiers/
-_memory_dir    = _tiers_dir.parent                              # Core/Memory/
-_structure_dir = _memory_dir / "Structure"                      # Core/Memory/Structure/
-_project_root  = _memory_dir.parent.parent                      # MindWave#8/
+from __future__ import annotations
 
-for _p in [str(_structure_dir), str(_tiers_dir),
-           str(_memory_dir), str(_project_root)]:
-    if _p not in sys.path:
-        sys.path.insert(0, _p)
-# ────────────────────────────────────────────────────────────────
+from pathlib import Path
 
-from AtomStructure import AtomData
+from ..Structure.AtomStructure import AtomData
 from .base import BaseTier
 
 
@@ -41,6 +29,11 @@ class Immortal_term(BaseTier):
     # Properties
     # ─────────────────────────────────────────
 
+    @property
+    def _memory_cls(self):
+        """class ของ memory — resolve ตอนใช้ (read_memory) ไม่ใช่ตอนสร้าง Tier"""
+        return ImmortalMemory
+
     @property
     def tier_name(self) -> str:
         return "immortal"
@@ -64,17 +57,17 @@ class Immortal_term(BaseTier):
         return self._read_file(atom_id)
 
     def exists(self, atom_id: str) -> bool:
-        return self._atom_path(atom_id).exists()
+        return self._exists_file(atom_id)
 
-    def list(self) -> list[str]:
-        return self._list_files()
+    def list(self, prefix: str | None = None) -> list[str]:
+        return self._list_files(prefix)
 
     def delete(self, atom_id: str) -> bool:
         """❌ Immortal ลบไม่ได้เด็ดขาด"""
         self._guard_delete()  # raises PermissionError เสมอ
 
     def count(self) -> int:
-        return len(self._list_files())
+        return self._count_files()
 
     def clear(self) -> int:
         """❌ Immortal ล้างไม่ได้เด็ดขาด"""
@@ -82,56 +75,6 @@ class Immortal_term(BaseTier):
             "[immortal] clear is not allowed — Immortal tier cannot be wiped"
         )
 
-    # ─────────────────────────────────────────
-    # Adapt Layer (ImmortalMemory layer)
-    # ─────────────────────────────────────────
-
-    def write_memory(self, memory: ImmortalMemory) -> bool:
-        """
-        รับ ImmortalMemory แล้วแปลงเป็น AtomData ก่อนเก็บลง disk
-
-        ImmortalMemory → to_dict() → json → bytes → AtomData.payload
-        """
-        try:
-            payload = json.dumps(memory.to_dict()).encode("utf-8")
-            data = AtomData(
-                payload=payload,
-                source=b"immortal_term",
-            )
-            return self.write(memory.memory_id, data)
-        except Exception as e:
-            self._logger.error(f"[{self.tier_name}] write_memory FAILED {memory.memory_id}: {e}")
-            return False
-
-    def read_memory(self, atom_id: str) -> ImmortalMemory | None:
-        """
-        อ่าน AtomData จาก disk แล้วแปลงกลับเป็น ImmortalMemory
-
-        AtomData.payload → bytes → json → from_dict() → ImmortalMemory
-        """
-        data = self.read(atom_id)
-        if data is None:
-            return None
-
-        try:
-            raw = json.loads(data.payload.decode("utf-8"))
-            return ImmortalMemory.from_dict(raw)
-        except Exception as e:
-            self._logger.error(f"[{self.tier_name}] read_memory FAILED {atom_id}: {e}")
-            return None
-
-    def list_stale(self) -> list[str]:
-        """
-        คืน atom_id ที่ is_stale = True
-        Immortal ไม่ expire แต่ยังมี stale สำหรับ monitoring
-        """
-        stale = []
-        for atom_id in self.list():
-            memory = self.read_memory(atom_id)
-            if memory and memory.is_stale:
-                stale.append(atom_id)
-        return stale
-
     def is_full(self) -> bool:
         """Immortal ไม่มี capacity limit"""
         return False
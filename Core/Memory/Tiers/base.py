@@ -6,15 +6,121 @@ Tier คือ Storage Handler — รู้แค่ "เขียน/อ่า
 การตัดสินใจว่า Atom ควรอยู่ Tier ไหนเป็นหน้าที่ของ MemoryController
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import json
 import logging
+import mmap
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:          # optional — fallback เป็น json มาตรฐาน
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads      # json.loads รับ bytes ได้โดยตรง
+
+from ..Structure.AtomStructure import (
+    AtomData,
+    AtomHeader,
+    AtomBinaryFormat,
+    HEADER_SIZE,
+    MAGIC,
+    _HEADER_DTYPE,
+)
+
+
+def _fsync_dir(path: str) -> None:
+    """fsync directory ให้ rename/สร้างไฟล์ในนั้นถึง disk (platform ที่เปิด directory ไม่ได้ → ข้าม)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# ดึงค่า importance จาก metadata bytes โดยไม่ต้อง parse JSON ทั้งก้อน
+_IMPORTANCE_RE = re.compile(rb'(?<!\\)"importance"\s*:\s*(-?[0-9][0-9.eE+-]*)')
+
+
+def _importance(metadata: bytes) -> float:
+    """
+    importance ระดับบนสุดของ metadata (ไม่มี → 0)
+    fast path ใช้เฉพาะเมื่อแน่ใจว่า key อยู่ชั้นบนสุด:
+        มี "importance" ที่เดียว และก่อนหน้ามันยังไม่มี object/array ซ้อนเปิดขึ้น
+    นอกนั้น (key ซ้อนใน object ย่อย / ซ้ำ / เลขแปลก) → parse JSON เต็ม
+    """
+    if metadata.count(b'"importance"') == 1:
+        m = _IMPORTANCE_RE.search(metadata)
+        if m is not None:
+            head = metadata[:m.start()]
+            if head.count(b"{") == 1 and b"[" not in head:
+                try:
+                    return float(m.group(1))
+                except ValueError:
+                    pass
+    return _loads(metadata).get("importance", 0)
+
+
+# อ่าน/ลบหลายไฟล์พร้อมกันเมื่อจำนวนถึงเกณฑ์นี้ — น้อยกว่านี้ค่าสร้าง thread ไม่คุ้ม
+PARALLEL_IO_MIN     = 64
+PARALLEL_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+def _tmp_suffix() -> str:
+    """
+    suffix ของไฟล์ชั่วคราวตอนเขียน — ไม่ชนกันข้าม process/thread
+    ลงท้าย .tmp (ไม่ใช่ .atom) จึงไม่ถูกนับตอน scan
+    """
+    return f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+# จำนวน AtomData ที่ cache ไว้ต่อ Tier (LRU) — read ซ้ำไม่ต้องแตะ disk
+READ_CACHE_SIZE = 1024
+
+# mtime ของ directory ที่ใหม่กว่าเวลา scan ไม่ถึงช่วงนี้ไม่น่าเชื่อ —
+# filesystem ใช้นาฬิกาหยาบ (ระดับ ms) ไฟล์ที่เพิ่ม/ลบใน tick เดียวกับ scan
+# อาจไม่ทำให้ mtime ขยับ จึง scan ซ้ำอีกรอบจนกว่า mtime จะเก่าพอ
+MTIME_RACY_NS = 100_000_000
+
+
+def _copy_atom(data: AtomData) -> AtomData:
+    """
+    สำเนา AtomData สำหรับคืนจาก read cache — field ทุกตัวเป็นค่า immutable
+    (bytes / int) copy ตื้นจึงพอ ผู้เรียกแก้ field ได้โดยไม่กระทบ entry ใน cache
+    """
+    return AtomData(
+        payload=data.payload,
+        metadata=data.metadata,
+        source=data.source,
+        flags=data.flags,
+        created_ts_ms=data.created_ts_ms,
+    )
 
-from ..Structure.AtomStructure import AtomData, AtomBinaryFormat
-from ..Structure.AtomRepair import quick_check
 
 class BaseTier(ABC):
 
+    # ─────────────────────────────────────────
+    # Adapt Layer config — แต่ละ Tier ตั้งค่าใน __init__
+    # ─────────────────────────────────────────
+
+    _memory_cls          = None    # class ของ memory (มี to_dict / from_dict)
+    _has_expiry          = False   # memory มี is_expired ไหม
+    _promotion_threshold = None    # importance ขั้นต่ำที่ promote ได้ — None = ไม่มี promote
+
     # ─────────────────────────────────────────
     # Properties ที่ทุก Tier ต้อง define
     # ─────────────────────────────────────────
@@ -51,18 +157,25 @@ class BaseTier(ABC):
 
     @abstractmethod
     def read(self, atom_id: str) -> AtomData | None:
-        """ดึง AtomData ด้วย atom_id — คืน None ถ้าไม่พบ"""
+        """
+        ดึง AtomData ด้วย atom_id — คืน None ถ้าไม่พบ
+        ทุกครั้งคืน AtomData ตัวใหม่ (แม้มาจาก read cache) ผู้เรียกแก้ได้อิสระ
+        ไม่กระทบ read ครั้งถัดไป — การแก้จะไม่ถูกบันทึกจนกว่าเรียก write()
+        """
         return self._read_file(atom_id)
 
     @abstractmethod
     def exists(self, atom_id: str) -> bool:
         """ตรวจว่า Atom มีอยู่ใน Tier นี้ไหม"""
-        return self._atom_path(atom_id).exists()
+        return self._exists_file(atom_id)
 
     @abstractmethod
-    def list(self) -> list[str]:
-        """คืน list ของ atom_id ทั้งหมดใน Tier นี้"""
-        return self._list_files()
+    def list(self, prefix: str | None = None) -> list[str]:
+        """
+        คืน list ของ atom_id ทั้งหมดใน Tier นี้
+        ส่ง prefix มา → เฉพาะ atom_id ที่ขึ้นต้นด้วย prefix
+        """
+        return self._list_files(prefix)
 
     @abstractmethod
     def delete(self, atom_id: str) -> bool:
@@ -79,7 +192,7 @@ class BaseTier(ABC):
         นับจำนวน Atom ทั้งหมดใน Tier
         MemoryController ใช้ตัดสินใจ promote หรือ cleanup
         """
-        return len(self._list_files())
+        return self._count_files()
 
     @abstractmethod
     def clear(self) -> int:
@@ -88,13 +201,211 @@ class BaseTier(ABC):
         คืนจำนวน Atom ที่ลบไป
         Immortal ต้อง override method นี้ให้ raise PermissionError เสมอ
         """
-        deleted = 0
-        for atom_id in self._list_files():
-            if self._delete_file(atom_id):
-                deleted += 1
-        self._logger.info(f"[{self.tier_name}] CLEAR — {deleted} atoms removed")
+        deleted = self._clear_files()
+        self._logger.info("[%s] CLEAR — %s atoms removed", self.tier_name, deleted)
         return deleted
 
+    # ─────────────────────────────────────────
+    # Adapt Layer — memory ↔ AtomData (ใช้ได้ทุก Tier)
+    # ─────────────────────────────────────────
+
+    def write_memory(self, memory) -> bool:
+        """
+        รับ memory ของ Tier นี้ แล้วแปลงเป็น AtomData ก่อนเก็บลง disk
+
+        memory → to_dict() → json → bytes → AtomData.payload
+        """
+        try:
+            data = AtomData(
+                payload=self._serialize(memory),
+                source=self._source_tag,
+            )
+            return self.write(memory.memory_id, data)
+        except Exception as e:
+            self._logger.error("[%s] write_memory FAILED %s: %s", self.tier_name, memory.memory_id, e)
+            return False
+
+    @staticmethod
+    def _serialize(memory) -> bytes:
+        """memory → json bytes"""
+        return _dumps(memory.to_dict())
+
+    def write_memory_batch(self, memories: list) -> int:
+        """
+        เขียน memory หลายตัวในครั้งเดียว — สำหรับ bulk import / promote
+        serialize ทีละตัวแล้วส่งต่อให้ write_many
+        คืนจำนวน memory ที่เขียนสำเร็จ
+        """
+        items = []
+        for memory in memories:
+            try:
+                items.append((
+                    memory.memory_id,
+                    AtomData(payload=self._serialize(memory), source=self._source_tag),
+                ))
+            except Exception as e:
+                self._logger.error("[%s] write_memory FAILED %s: %s", self.tier_name, memory.memory_id, e)
+        return len(self.write_many(items))
+
+    def write_many(self, items: Iterable[tuple[str, AtomData]]) -> list[str]:
+        """
+        เขียน (atom_id, AtomData) หลายตัวในครั้งเดียว — สำหรับ bulk insert / promote
+        จัดกลุ่มตาม folder ปลายทาง เปิด directory fd ครั้งเดียวต่อกลุ่ม
+        สร้างไฟล์แบบ openat (dir_fd) เขียนลงไฟล์ชั่วคราว fsync ข้อมูลแล้วค่อย rename ทับ
+        — reader ไม่เห็นไฟล์ที่เขียนไม่ครบ และหลัง crash ไม่เหลือไฟล์ที่ชื่อใหม่แต่ข้อมูลว่าง
+        แล้ว fsync directory ครั้งเดียวต่อกลุ่ม (ให้ rename ทั้งกลุ่มถึง disk)
+        คืน atom_id ที่เขียนสำเร็จ
+        """
+        groups: dict[Path, list] = {}
+        for atom_id, data in items:
+            groups.setdefault(self._atom_path(atom_id).parent, []).append((atom_id, data))
+
+        use_dir_fd = os.open in os.supports_dir_fd and os.replace in os.supports_dir_fd
+        written = []
+
+        for folder, group in groups.items():
+            folder.mkdir(parents=True, exist_ok=True)
+            dir_fd = os.open(folder, os.O_RDONLY) if use_dir_fd else None
+            try:
+                for atom_id, data in group:
+                    name = f"{atom_id}.atom" if use_dir_fd else str(folder / f"{atom_id}.atom")
+                    tmp = name + _tmp_suffix()
+                    try:
+                        blob = AtomBinaryFormat.encode(data)
+
+                        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+                        try:
+                            view = memoryview(blob)
+                            while view:
+                                view = view[os.write(fd, view):]
+                            os.fsync(fd)
+                        finally:
+                            os.close(fd)
+                        os.replace(tmp, name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+                        written.append(atom_id)
+                        self._resident.add(atom_id)
+                        self._forget(atom_id)
+                        self._logger.info("[%s] WRITE %s", self.tier_name, atom_id)
+                    except Exception as e:
+                        try:
+                            os.unlink(tmp, dir_fd=dir_fd)
+                        except OSError:
+                            pass
+                        self._logger.error("[%s] WRITE FAILED %s: %s", self.tier_name, atom_id, e)
+
+                if dir_fd is not None:
+                    os.fsync(dir_fd)
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+        self._list_gen += 1
+        return written
+
+    def read_memory(self, atom_id: str):
+        """
+        อ่าน AtomData จาก disk แล้วแปลงกลับเป็น memory ของ Tier นี้
+
+        AtomData.payload → bytes → json → from_dict() → memory
+        """
+        data = self.read(atom_id)
+        if data is None:
+            return None
+        return self._to_memory(atom_id, data)
+
+    def _to_memory(self, atom_id: str, data: AtomData):
+        """AtomData ที่อ่านมาแล้ว → memory (None ถ้า payload เสีย)"""
+        try:
+            raw = _loads(data.payload)
+            return self._memory_cls.from_dict(raw)
+        except Exception as e:
+            self._logger.error("[%s] read_memory FAILED %s: %s", self.tier_name, atom_id, e)
+            return None
+
+    def read_many(self, atom_ids: list[str]) -> list[AtomData | None]:
+        """
+        read() หลาย Atom — เรียงตาม atom_ids (ตัวที่ไม่พบ → None)
+        ถ้ามีตั้งแต่ PARALLEL_IO_MIN ขึ้นไป อ่านด้วย thread pool
+        (open/read ปล่อย GIL ระหว่างรอ I/O)
+        """
+        if len(atom_ids) < PARALLEL_IO_MIN:
+            return [self.read(atom_id) for atom_id in atom_ids]
+
+        with ThreadPoolExecutor(max_workers=PARALLEL_IO_WORKERS) as ex:
+            return list(ex.map(self.read, atom_ids))
+
+    def classify(self) -> dict[str, list[str]]:
+        """
+        เดิน tier รอบเดียว อ่านแต่ละ Atom ครั้งเดียว
+        แล้วแยก atom_id เป็น "stale", "expired", "promotable"
+        MemoryController ใช้เมื่อต้องการหลายกลุ่มพร้อมกัน (เช่น cleanup)
+        """
+        result = {"stale": [], "expired": [], "promotable": []}
+        threshold = self._promotion_threshold
+
+        atom_ids = self.list()
+        for atom_id, data in zip(atom_ids, self.read_many(atom_ids)):
+            if data is None:
+                continue
+
+            memory = self._to_memory(atom_id, data)
+            if memory:
+                if memory.is_stale:
+                    result["stale"].append(atom_id)
+                if self._has_expiry and memory.is_expired:
+                    result["expired"].append(atom_id)
+
+            if threshold is None or not data.metadata:
+                continue
+            try:
+                if _importance(data.metadata) >= threshold:
+                    result["promotable"].append(atom_id)
+            except Exception:
+                continue
+
+        return result
+
+    def list_stale(self) -> list[str]:
+        """
+        คืน atom_id ที่ is_stale = True
+        MemoryController ใช้ตัดสินใจว่าจะลบหรือ promote
+        """
+        return self.classify()["stale"]
+
+    def list_expired(self) -> list[str]:
+        """
+        คืน atom_id ที่ is_expired = True
+        MemoryController ใช้ตัดสินใจว่าจะลบทิ้ง — Tier ที่ไม่มี expiry คืน []
+        """
+        if not self._has_expiry:
+            return []
+        return self.classify()["expired"]
+
+    def list_promotable(self) -> list[str]:
+        """
+        คืน atom_id ที่ importance (ใน metadata) >= _promotion_threshold
+        MemoryController ใช้ตัดสินใจว่าจะ promote ขึ้น Tier ถัดไป
+
+        อ่านแค่ metadata ของแต่ละไฟล์ — payload ไม่ได้ใช้
+        """
+        threshold = self._promotion_threshold
+        if threshold is None:
+            return []
+
+        promotable = []
+        for atom_id in self.list():
+            metadata = self._read_metadata_only(atom_id)
+            if not metadata:
+                continue
+            try:
+                if _importance(metadata) >= threshold:
+                    promotable.append(atom_id)
+            except Exception:
+                continue
+
+        return promotable
+
     # ─────────────────────────────────────────
     # Shared logic — ใช้ได้ทุก Tier
     # ─────────────────────────────────────────
@@ -102,60 +413,323 @@ class BaseTier(ABC):
     def initialize(self) -> None:
         """สร้าง data_path ถ้ายังไม่มี และเตรียม logger"""
         self.data_path.mkdir(parents=True, exist_ok=True)
+        self._source_tag = f"{self.tier_name}_term".encode()
+        self._data_dir_str = str(self.data_path)
+        self._path_prefix = self._data_dir_str + os.sep
+        self._resident: set[str] = set()
+        self._resident_mtime: int | None = None     # None = ต้อง scan ใหม่
+        self._list_gen: int = 0
+        self._age_index_cache: tuple[int, np.ndarray, np.ndarray] | None = None
+        self._read_cache: OrderedDict[str, tuple[tuple[int, int, int], AtomData]] = OrderedDict()
+        self._read_cache_gen: int = 0
+        self._read_cache_lock = threading.Lock()
         self._logger = logging.getLogger(f"mindwave.memory.{self.tier_name}")
-        self._logger.debug(f"[{self.tier_name}] initialized at {self.data_path}")
+        self._logger.debug("[%s] initialized at %s", self.tier_name, self.data_path)
 
     def _atom_path(self, atom_id: str) -> Path:
         """แปลง atom_id เป็น path ของไฟล์ .atom"""
-        return self.data_path / f"{atom_id}.atom"
+        return Path(self._path_prefix + atom_id + ".atom")
+
+    def _atom_path_str(self, atom_id: str) -> str:
+        """เหมือน _atom_path แต่คืน str — ต่อ string กับ prefix ที่เตรียมไว้ ไม่ผ่าน pathlib"""
+        return self._path_prefix + atom_id + ".atom"
 
     def _write_file(self, atom_id: str, data: AtomData) -> bool:
-        """เขียนไฟล์ .atom ลง disk — ใช้ AtomBinaryFormat.save ตาม convention"""
+        """
+        เขียนไฟล์ .atom ลง disk — encode ด้วย AtomBinaryFormat ตาม convention
+        เขียนลงไฟล์ชั่วคราว fsync ข้อมูล แล้ว os.replace ทับ (atomic)
+        จากนั้น fsync directory ให้ rename ถึง disk
+        reader ไม่มีทางเห็นไฟล์ที่เขียนไม่ครบ และหลัง crash จะเห็นไฟล์เก่าหรือใหม่ครบทั้งไฟล์
+        """
+        path = self._atom_path_str(atom_id)
+        tmp = path + _tmp_suffix()
         try:
-            AtomBinaryFormat.save(str(self._atom_path(atom_id)), data)
-            self._logger.info(f"[{self.tier_name}] WRITE {atom_id}")
+            blob = AtomBinaryFormat.encode(data)
+            with open(tmp, "wb") as f:
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+            _fsync_dir(os.path.dirname(path))
+            self._resident.add(atom_id)
+            self._list_gen += 1
+            self._forget(atom_id)
+            self._logger.info("[%s] WRITE %s", self.tier_name, atom_id)
             return True
         except Exception as e:
-            self._logger.error(f"[{self.tier_name}] WRITE FAILED {atom_id}: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            self._logger.error("[%s] WRITE FAILED %s: %s", self.tier_name, atom_id, e)
             return False
 
     def _read_file(self, atom_id: str) -> AtomData | None:
-        """อ่านไฟล์ .atom จาก disk — ตรวจ checksum ด้วย quick_check ก่อน"""
-        path = self._atom_path(atom_id)
+        """
+        อ่านไฟล์ .atom จาก disk
+        AtomBinaryFormat.load map ไฟล์ครั้งเดียว — ตรวจ CRC และแยก field
+        จาก mapping เดียวกัน ไม่ต้องอ่านทั้งไฟล์สองรอบผ่าน quick_check
 
-        if not path.exists():
-            self._logger.debug(f"[{self.tier_name}] NOT FOUND {atom_id}")
+        ผลที่อ่านได้เก็บใน LRU (READ_CACHE_SIZE ตัว) คู่กับ (st_ino, st_mtime_ns, st_size)
+        read ซ้ำ stat ไฟล์ครั้งเดียว — key ตรง → คืนจาก memory ไม่ต้องอ่าน/ตรวจ CRC
+        ไฟล์ถูกลบ/เขียนทับ (แม้จาก Tier หรือ process อื่น) → key ไม่ตรง → อ่านใหม่
+        (เขียนผ่าน Tier ได้ inode ใหม่ทุกครั้งเพราะ rename ทับ)
+        ตัวที่อยู่ใน cache ไม่ถูกส่งออกไปตรงๆ — คืนสำเนาเสมอ
+        """
+        path = self._atom_path_str(atom_id)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._read_cache_lock:
+                self._read_cache.pop(atom_id, None)
+            self._logger.debug("[%s] NOT FOUND %s", self.tier_name, atom_id)
             return None
-
-        if not quick_check(str(path)):
-            self._logger.warning(f"[{self.tier_name}] CHECKSUM FAIL {atom_id}")
+        except OSError as e:
+            self._logger.error("[%s] READ FAILED %s: %s", self.tier_name, atom_id, e)
             return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        with self._read_cache_lock:
+            entry = self._read_cache.get(atom_id)
+            if entry is not None and entry[0] == key:
+                self._read_cache.move_to_end(atom_id)
+                return _copy_atom(entry[1])
+            gen = self._read_cache_gen
 
         try:
-            return AtomBinaryFormat.load(str(path))
+            data = AtomBinaryFormat.load(path)
+        except FileNotFoundError:
+            self._logger.debug("[%s] NOT FOUND %s", self.tier_name, atom_id)
+            return None
+        except ValueError:
+            # ไฟล์ว่าง / ขนาดไม่ตรง / CRC ไม่ตรง
+            self._logger.warning("[%s] CHECKSUM FAIL %s", self.tier_name, atom_id)
+            return None
         except Exception as e:
-            self._logger.error(f"[{self.tier_name}] READ FAILED {atom_id}: {e}")
+            self._logger.error("[%s] READ FAILED %s: %s", self.tier_name, atom_id, e)
             return None
 
-    def _delete_file(self, atom_id: str) -> bool:
-        """ลบไฟล์ .atom จาก disk"""
-        path = self._atom_path(atom_id)
+        with self._read_cache_lock:
+            # มี write/delete ระหว่างอ่าน → ผลนี้อาจเก่าแล้ว ไม่เก็บ
+            # (ไฟล์ถูกแทนหลัง stat → เก็บของใหม่คู่ key เก่า read ถัดไปแค่อ่านซ้ำ)
+            if gen == self._read_cache_gen:
+                self._read_cache[atom_id] = (key, data)
+                if len(self._read_cache) > READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+        return _copy_atom(data)
 
-        if not path.exists():
-            self._logger.debug(f"[{self.tier_name}] DELETE NOT FOUND {atom_id}")
-            return False
+    def _forget(self, atom_id: str | None = None) -> None:
+        """ล้าง read cache ของ atom_id (None = ทั้ง Tier) — เรียกทุกครั้งที่ไฟล์เปลี่ยน"""
+        with self._read_cache_lock:
+            self._read_cache_gen += 1
+            if atom_id is None:
+                self._read_cache.clear()
+            else:
+                self._read_cache.pop(atom_id, None)
+
+    def _read_metadata_only(self, atom_id: str) -> bytes | None:
+        """
+        อ่านเฉพาะ metadata ของไฟล์ .atom — map ไฟล์แล้วใช้ header หา offset
+        kernel โหลดแค่ page ที่แตะจริง (header + metadata) ไม่แตะ payload
+        จึงไม่ได้ตรวจ CRC — ใช้กับงาน scan ที่ข้าม Atom เสียได้
+        """
+        path = self._atom_path_str(atom_id)
+
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except FileNotFoundError:
+            self._logger.debug("[%s] NOT FOUND %s", self.tier_name, atom_id)
+            return None
+        except OSError as e:
+            self._logger.warning("[%s] METADATA READ FAILED %s: %s", self.tier_name, atom_id, e)
+            return None
+
+        try:
+            # ไฟล์ว่าง map ไม่ได้ (ValueError) — ถือว่าเสียเหมือน header สั้น
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                header = AtomHeader.from_bytes(mm)
+                start = HEADER_SIZE + header.payload_len
+                end = start + header.metadata_len
+                if end > len(mm):
+                    self._logger.warning("[%s] METADATA TRUNCATED %s", self.tier_name, atom_id)
+                    return None
+                return mm[start:end]
+        except (OSError, ValueError) as e:
+            self._logger.warning("[%s] METADATA READ FAILED %s: %s", self.tier_name, atom_id, e)
+            return None
+        finally:
+            os.close(fd)
 
+    def _delete_file(self, atom_id: str) -> bool:
+        """ลบไฟล์ .atom จาก disk"""
         try:
-            path.unlink()
-            self._logger.warning(f"[{self.tier_name}] DELETE {atom_id}")
+            os.unlink(self._atom_path_str(atom_id))
+            self._resident.discard(atom_id)
+            self._list_gen += 1
+            self._forget(atom_id)
+            self._logger.warning("[%s] DELETE %s", self.tier_name, atom_id)
             return True
+        except FileNotFoundError:
+            self._resident.discard(atom_id)
+            self._logger.debug("[%s] DELETE NOT FOUND %s", self.tier_name, atom_id)
+            return False
         except Exception as e:
-            self._logger.error(f"[{self.tier_name}] DELETE FAILED {atom_id}: {e}")
+            self._logger.error("[%s] DELETE FAILED %s: %s", self.tier_name, atom_id, e)
             return False
 
-    def _list_files(self) -> list[str]:
-        """คืน atom_id ทั้งหมดจากไฟล์ .atom ที่มีอยู่"""
-        return [p.stem for p in self.data_path.glob("*.atom")]
+    def _exists_file(self, atom_id: str) -> bool:
+        """
+        ตรวจว่ามีไฟล์ .atom ไหม — stat path ที่ต่อ string เอง ไม่ผ่าน pathlib
+        ถามจาก disk ทุกครั้ง เห็นไฟล์ที่ Tier/process อื่นเขียนหรือลบด้วย
+        """
+        return os.path.exists(self._path_prefix + atom_id + ".atom")
+
+    def _resident_ids(self) -> set[str]:
+        """
+        atom_id ทั้งหมดใน Tier (ห้ามแก้ set ที่ได้คืน)
+        ไฟล์ .atom อยู่ชั้นเดียวใน data_path — เพิ่ม/ลบไฟล์ (รวม rename ทับ)
+        จากที่ไหนก็ตามทำให้ mtime ของ data_path เปลี่ยน
+        จึง stat data_path ครั้งเดียว: mtime ตรงกับตอน scan → ใช้ set เดิม
+        ไม่ตรง → scan ใหม่ (Tier อื่นบน directory เดียวกันก็เห็นตรงกัน)
+        """
+        try:
+            mtime = os.stat(self._data_dir_str).st_mtime_ns
+        except FileNotFoundError:
+            self._resident, self._resident_mtime = set(), None
+            return self._resident
+
+        if mtime != self._resident_mtime:
+            scanned_at = time.time_ns()
+            self._resident = set(self._scan_atom_ids())
+            # mtime ที่ใกล้เวลา scan เกินไป อาจมีไฟล์เปลี่ยนใน tick เดียวกัน → ไม่จำ
+            self._resident_mtime = mtime if scanned_at - mtime > MTIME_RACY_NS else None
+            self._list_gen += 1
+        return self._resident
+
+    def _list_files(self, prefix: str | None = None) -> list[str]:
+        """
+        คืน atom_id ทั้งหมดใน Tier — copy จาก resident set
+        prefix → กรองใน memory ตอน copy ไม่ต้อง scan directory
+        """
+        resident = self._resident_ids()
+        if prefix is None:
+            return list(resident)
+        return [atom_id for atom_id in resident if atom_id.startswith(prefix)]
+
+    def _count_files(self) -> int:
+        """นับ Atom — ขนาดของ resident set ไม่ต้อง copy"""
+        return len(self._resident_ids())
+
+    def resync(self) -> int:
+        """
+        scan data_path ใหม่ทันทีโดยไม่ดู mtime — ใช้กู้หลัง crash
+        หรือเมื่อ filesystem ไม่อัปเดต mtime ของ directory (เช่น network mount)
+        คืนจำนวน Atom ที่พบ
+        """
+        self._resident_mtime = None
+        self._forget()
+        return len(self._resident_ids())
+
+    def list_older_than(self, seconds: float) -> list[str]:
+        """
+        คืน atom_id ที่ created_ts_ms เก่ากว่า seconds วินาที
+        เทียบทั้ง tier ด้วย numpy ครั้งเดียว ไม่ต้อง deserialize memory ทีละตัว
+        """
+        atom_ids, created = self._age_index()
+        cutoff = time.time_ns() // 1_000_000 - int(seconds * 1000)
+        return atom_ids[created < cutoff].tolist()
+
+    def _age_index(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (atom_ids, created_ts_ms) ของทุก Atom — อ่านแค่ header 28 bytes ต่อไฟล์
+        cache ไว้คู่กับ resident set (_list_gen) — สร้างใหม่เมื่อ
+        Tier นี้ write/delete/clear หรือ scan ใหม่เพราะ directory เปลี่ยน
+        """
+        resident = self._resident_ids()
+        cached = self._age_index_cache
+        if cached is not None and cached[0] == self._list_gen:
+            return cached[1], cached[2]
+
+        ids, heads = [], []
+        for atom_id in list(resident):
+            try:
+                with open(self._atom_path_str(atom_id), "rb") as f:
+                    head = f.read(HEADER_SIZE)
+            except OSError:
+                continue
+            if len(head) == HEADER_SIZE and head[:4] == MAGIC:
+                ids.append(atom_id)
+                heads.append(head)
+
+        index_ids = np.array(ids, dtype=object)
+        created = np.frombuffer(b"".join(heads), dtype=_HEADER_DTYPE)["created_ts_ms"].astype(np.int64)
+        self._age_index_cache = (self._list_gen, index_ids, created)
+        return index_ids, created
+
+    def _scan_atom_ids(self) -> list[str]:
+        """
+        เดิน data_path ทั้ง tree ด้วย os.scandir (รองรับ shard folder)
+        ใช้ type จาก DirEntry — ไม่ stat ซ้ำ ไม่สร้าง Path ต่อไฟล์ ไม่ตาม symlink
+        """
+        results = []
+        stack = [self._data_dir_str]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.endswith(".atom") and e.is_file(follow_symlinks=False):
+                        results.append(e.name[:-5])
+        return results
+
+    def _clear_files(self) -> int:
+        """
+        ลบไฟล์ .atom ทั้งหมดใน data_path — scan เก็บ path แล้ว unlink
+        ใช้ entry.path ตรงๆ ไม่ผ่าน _list_files / _delete_file ทีละตัว
+        ถ้ามีตั้งแต่ PARALLEL_IO_MIN ขึ้นไป unlink ด้วย thread pool
+        (unlink ปล่อย GIL ระหว่างรอ filesystem)
+        คืนจำนวนไฟล์ที่ลบได้
+        """
+        paths = []
+        stack = [self._data_dir_str]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except FileNotFoundError:
+                continue
+            with it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        stack.append(e.path)
+                    elif e.name.endswith(".atom") and e.is_file(follow_symlinks=False):
+                        paths.append(e.path)
+
+        def unlink(path: str) -> bool | None:
+            """True = ลบได้, False = หายไปเองระหว่าง scan, None = ลบไม่ได้"""
+            try:
+                os.unlink(path)
+                return True
+            except FileNotFoundError:
+                return False
+            except OSError as err:
+                atom_id = os.path.basename(path)[:-5]
+                self._logger.error("[%s] DELETE FAILED %s: %s", self.tier_name, atom_id, err)
+                return None
+
+        if len(paths) < PARALLEL_IO_MIN:
+            results = [unlink(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=PARALLEL_IO_WORKERS) as ex:
+                results = list(ex.map(unlink, paths))
+
+        # เหลือแค่ตัวที่ลบไม่ได้
+        self._resident = {
+            os.path.basename(path)[:-5] for path, ok in zip(paths, results) if ok is None
+        }
+        self._resident_mtime = None
+        self._list_gen += 1
+        self._forget()
+        return results.count(True)
 
     def _guard_delete(self) -> None:
         """
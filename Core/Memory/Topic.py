@@ -17,14 +17,27 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 import json
-import math
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:          # optional — fallback to stdlib json
+    orjson = None
+
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+QUANT_SCALE = 127   # unit-vector component → int8 range [-127, 127]
 
 
 # ============================================================================
 # TOPIC DATA
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TopicData:
     """
     One topic cluster learned by an unsupervised model.
@@ -44,17 +57,29 @@ class TopicData:
     embedding:      Optional[List[float]] = field(default=None, repr=False)
     document_count: int            = 0
 
+    # Centroid / keyword caches — built once in __post_init__, not part of the public data
+    _emb:   Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _emb_q: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _kw_set: frozenset           = field(default=frozenset(), init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         self.coherence      = max(0.0, min(1.0, self.coherence))
         self.document_count = max(0, self.document_count)
         # Normalize keywords: strip + lowercase + deduplicate
-        seen, clean = set(), []
-        for kw in self.top_keywords:
-            kw = kw.strip().lower()
-            if kw and kw not in seen:
-                seen.add(kw)
-                clean.append(kw)
-        self.top_keywords = clean
+        # (dict keeps first-seen order, dedup runs in C)
+        self.top_keywords = list(dict.fromkeys(
+            kw for kw in (k.strip().lower() for k in self.top_keywords) if kw
+        ))
+        self._kw_set = frozenset(self.top_keywords)
+        # Centroid as an L2-normalized array, computed once —
+        # cosine_similarity is then a single dot per pair, no norms.
+        # A zero vector stays zero, so its cosine is 0.0 with anything.
+        if self.embedding is not None:
+            emb  = np.asarray(self.embedding, dtype=np.float64)
+            norm = np.linalg.norm(emb)
+            self._emb = emb / norm if norm else emb
+            # int8 copy of the unit vector (scale 127) for cosine_similarity_q
+            self._emb_q = np.clip(np.round(self._emb * QUANT_SCALE), -QUANT_SCALE, QUANT_SCALE).astype(np.int8)
 
     # ------------------------------------------------------------------
     # Derived properties
@@ -83,28 +108,41 @@ class TopicData:
         """
         Cosine similarity between cluster centroids.
         Returns None if either topic has no embedding.
+        Uses the unit vector cached at construction — the embedding is
+        treated as fixed once the cluster is built.
         """
-        if self.embedding is None or other.embedding is None:
+        a, b = self._emb, other._emb
+        if a is None or b is None:
             return None
-        a, b = self.embedding, other.embedding
-        if len(a) != len(b):
+        if a.shape != b.shape:
             raise ValueError(f"Embedding dimensions differ: {len(a)} vs {len(b)}")
-        dot    = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x**2 for x in a))
-        norm_b = math.sqrt(sum(x**2 for x in b))
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+        return float(np.dot(a, b))
+
+    def cosine_similarity_q(self, other: "TopicData") -> Optional[float]:
+        """
+        Approximate cosine similarity on the int8-quantized centroids.
+        An eighth of the float64 footprint; absolute error is typically
+        below 0.01. Same None / ValueError rules as cosine_similarity.
+        """
+        a, b = self._emb_q, other._emb_q
+        if a is None or b is None:
+            return None
+        if a.shape != b.shape:
+            raise ValueError(f"Embedding dimensions differ: {len(a)} vs {len(b)}")
+        # widen before the dot — int8 products overflow
+        return int(np.dot(a.astype(np.int32), b.astype(np.int32))) / (QUANT_SCALE * QUANT_SCALE)
 
     def keyword_overlap(self, other: "TopicData") -> float:
         """
         Jaccard overlap of top_keywords between two clusters.
         Returns 0.0 if both lists are empty.
+        Uses the keyword set cached at construction.
         """
-        s, o = set(self.top_keywords), set(other.top_keywords)
+        s, o = self._kw_set, other._kw_set
         if not s and not o:
             return 0.0
-        return len(s & o) / len(s | o)
+        inter = len(s & o)
+        return inter / (len(s) + len(o) - inter)
 
     # ------------------------------------------------------------------
     # Label assignment (called by model after unsupervised training)
@@ -122,6 +160,8 @@ class TopicData:
 
     # ------------------------------------------------------------------
     # Serialization
+    # Hand-specialized to the exact field set (no fields()/asdict walk) —
+    # keep in sync with the public fields above.
     # ------------------------------------------------------------------
 
     def to_dict(self) -> Dict[str, Any]:
@@ -146,10 +186,16 @@ class TopicData:
         )
 
     def to_json(self) -> str:
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY — numpy scalars (e.g. a coherence computed
+            # with numpy) dump like they did with the stdlib json module
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
         return json.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> "TopicData":
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(json_str))
         return cls.from_dict(json.loads(json_str))
 
     def __str__(self) -> str:
@@ -12,15 +12,29 @@ BrainStructure — Neural network ที่ใช้งานได้จริ
 
 from __future__ import annotations
 
-import copy
+import itertools
 import logging
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+import math
 
 import numpy as np
 from numpy.typing import NDArray
 
+try:
+    from numba import njit
+except ImportError:          # optional — ไม่มี numba ใช้ dense NumPy path อย่างเดียว
+    njit = None
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:          # optional — predict_batch บน device="gpu" ใช้ NumPy แทน
+    jax = None
+    jnp = None
+
 import sys, os
 
 from Core.Neural.Brain.Schema import (
@@ -35,6 +49,112 @@ from Core.Review.Proposal import ProposalData, ProposalAction, ProposalTarget, R
 logger = logging.getLogger("mindwave.brain.structure")
 
 
+# ============================================================================
+# CSR KERNEL — graph ที่ sparse (เช่นหลัง ADD_NODE) ไม่คุ้มกับ dense matmul
+# ============================================================================
+
+# activation → id (0 = ไม่แปลง: None / Linear / softmax) — ใช้ทั้ง CSR kernel และ dense path
+_ACT_ID: Dict[Optional[str], int] = {
+    None: 0, "Linear": 0, "softmax": 0,
+    "ReLU": 1, "LeakyReLU": 2, "GELU": 3, "Sigmoid": 4,
+    "Tanh": 5, "Swish": 6, "ELU": 7, "exp": 8,
+}
+
+# id → vector activation — index tuple แทนการค้นชื่อใน dict ตอน compile
+_ACT_TABLE: Tuple[Optional[Callable[..., NDArray[np.float64]]], ...] = (None,) + tuple(
+    ActivationFunctions.get_vector_function(name)
+    for name, _ in sorted(
+        ((name, i) for name, i in _ACT_ID.items() if i), key=lambda item: item[1]
+    )
+)
+
+
+def _forward_csr(layer_ptr, span_start, span_end, src, dst, w, act_id, values):
+    """
+    forward ทีละ layer บน edge list ที่เรียงตาม layer ของ dst
+
+    edge ของ layer l อยู่ช่วง layer_ptr[l]:layer_ptr[l+1] — รวมทั้ง layer ก่อน
+    แล้วค่อยเขียน values (ให้ผลเหมือน dense: connection ภายใน layer อ่านค่าเดิม)
+    bias เป็น edge จากช่องค่าคงที่ 1.0 ท้าย values เหมือน weight ทั่วไป
+    เขียนแบบ loop ธรรมดาเพื่อให้ numba compile ได้ — ไม่มี numba ก็เรียกตรงได้
+    """
+    for l in range(span_start.shape[0]):
+        s   = span_start[l]
+        e   = span_end[l]
+        acc = np.zeros(e - s)
+        for k in range(layer_ptr[l], layer_ptr[l + 1]):
+            acc[dst[k] - s] += w[k] * values[src[k]]
+        for i in range(e - s):
+            x = acc[i]
+            a = act_id[s + i]
+            if a == 1:
+                x = x if x > 0.0 else 0.0
+            elif a == 2:
+                x = x if x > 0.0 else 0.01 * x
+            elif a == 3:
+                x = 0.5 * x * (1.0 + math.tanh(
+                    math.sqrt(2.0 / math.pi) * (x + 0.044715 * x ** 3)
+                ))
+            elif a == 4 or a == 6:
+                ex  = math.exp(-abs(x))
+                sig = 1.0 / (1.0 + ex) if x >= 0.0 else ex / (1.0 + ex)
+                x   = sig if a == 4 else x * sig
+            elif a == 5:
+                x = math.tanh(x)
+            elif a == 7:
+                x = x if x > 0.0 else math.exp(x) - 1.0
+            elif a == 8:
+                x = math.exp(min(x, 80.0))
+            values[s + i] = x
+
+
+# ไม่ใช้ fastmath — ต้องให้ NaN/inf ผ่านไปถึง gradient monitor ตามจริง
+_forward_csr_jit = njit(cache=True)(_forward_csr) if njit is not None else None
+
+
+def _build_jax_forward(
+    spans:  List[Tuple[int, int]],
+    groups: List[List[Tuple[int, NDArray[np.int64]]]],
+) -> Callable:
+    """
+    สร้าง forward ของ topology นี้เป็น jax.jit — โครง (span / กลุ่ม activation)
+    ฝังเป็นค่าคงที่ ส่วน weight เป็น argument จึงใช้ compile เดิมได้จน topology เปลี่ยน
+
+    ความหมายเหมือน _forward_dense: V (N + 1, B) ทั้งก้อน แต่ละ layer อ่าน V ทั้งหมด
+    """
+    acts = {
+        1: lambda x: jnp.maximum(x, 0.0),
+        2: lambda x: jnp.where(x > 0, x, 0.01 * x),
+        3: lambda x: 0.5 * x * (1.0 + jnp.tanh(math.sqrt(2.0 / math.pi) * (x + 0.044715 * x ** 3))),
+        4: jax.nn.sigmoid,
+        5: jnp.tanh,
+        6: lambda x: x * jax.nn.sigmoid(x),
+        7: lambda x: jnp.where(x > 0, x, jnp.exp(jnp.minimum(x, 0.0)) - 1.0),
+        8: lambda x: jnp.exp(jnp.minimum(x, 80.0)),
+    }
+
+    @jax.jit
+    def forward(Ws, V):
+        for W, (s, e), layer_groups in zip(Ws, spans, groups):
+            z = W @ V
+            for a, idx in layer_groups:
+                z = z.at[idx].set(acts[a](z[idx]))
+            V = V.at[s:e].set(z)
+        return V
+
+    return forward
+
+
+def _pool_table(pool: Dict[str, float]) -> Tuple[Tuple[str, ...], NDArray[np.float64]]:
+    """(ชื่อ, cumulative probability ที่ normalize ให้ปลายเป็น 1.0) ของ pool สำหรับ searchsorted"""
+    cum = np.cumsum(list(pool.values()))
+    return tuple(pool), cum / cum[-1]
+
+
+# loss ที่มี fused path บน logit — เทียบด้วย identity ของฟังก์ชันที่ลงทะเบียนไว้
+_MDN_NLL_LOSS = LossFunctions.get_loss_function("MDN_NLL")
+
+
 class BrainStructure:
 
     def __init__(
@@ -46,24 +166,44 @@ class BrainStructure:
         verbose:         bool = True,
         neural_controller: Optional[NeuralController] = None,
         condition=None,
+        device:          Literal["cpu", "gpu"] = "cpu",
     ):
         self.seed           = int(np.random.randint(0, 1_000_000))
-        np.random.seed(self.seed)
+        # RNG ของ instance เอง (PCG64) — ไม่ reseed global state ของ numpy
+        self._rng           = np.random.default_rng(self.seed)
+        # pool ของ N(0,1) สำหรับ noise เล็กๆ ราย interaction — เติมจาก _rng เมื่อหมด
+        self._noise_buf     = np.empty(0)
+        self._noise_idx     = 0
 
         self.model_type     = model_type
         self.mdn_components = mdn_components
         self.mdn_dim        = mdn_dim
         self.verbose        = verbose
+        # "gpu" → predict_batch ผ่าน jax.jit (ถ้ามี jax) — train ยังอยู่บน NumPy เสมอ
+        self.device         = device
+        if device == "gpu" and jax is None:
+            logger.warning("[BrainStructure] device='gpu' requested but jax is not installed — using NumPy")
 
         self._condition = condition
         # Neural controller สำหรับ gradient monitoring + proposals
         self._neural = neural_controller or NeuralController()
 
-        self.layers:      Optional[List[int]]             = None
-        self.nodes:       Dict[str, NodeSchema]           = {}
-        self.connections: Dict[str, ConnectionSchema]     = {}
-        self.weights:     Dict[str, float]                = {}
-        self.biases:      Dict[str, float]                = {}
+        self.layers:       Optional[List[int]]             = None
+        self._nodes:       Dict[str, NodeSchema]           = {}
+        self._connections: Dict[str, ConnectionSchema]     = {}
+        self._weights:     Dict[str, float]                = {}
+        self._biases:      Dict[str, float]                = {}
+        # เลขรันของ node id ที่ evolution เพิ่ม — ไม่ลดลงตาม prune (ดู _new_node_id)
+        self._node_seq:    int                             = 0
+
+        # Dense view (SoA arrays) — ตัวจริงของค่าตัวเลขระหว่างคำนวณ
+        self._dense_valid:  bool = False
+        self._nodes_dirty:  bool = False   # value / usage / gradient ใน array ใหม่กว่า dict
+        self._params_dirty: bool = False   # weight / bias ใน array ใหม่กว่า dict
+        self._topology_dirty: bool  = True   # ต้อง compile โครง dense view ใหม่
+        self._nodes_touched:  bool  = False  # nodes ถูกเข้าถึง — เทียบ signature ก่อน
+        self._topology_sig:   tuple = ()
+        self._jax_forward:    Optional[Callable] = None   # jit ของ topology ปัจจุบัน
 
         # Pending evolution proposals
         self._pending_proposals: List[ProposalData] = []
@@ -82,6 +222,62 @@ class BrainStructure:
         self.loss_name      = ""
         self.compiled_at    = None
 
+    # ────────────────────────────────────────────────────────────
+    # Dict views — sync จาก dense arrays เมื่อมีคนเข้าถึง
+    # ────────────────────────────────────────────────────────────
+    #
+    # ระหว่าง forward / backprop / train ค่าตัวเลขอยู่ใน array อย่างเดียว
+    # dict ถูกเขียนตามเมื่อเข้าถึงผ่าน property — ผู้เรียกอาจแก้ dict ตรงๆ
+    # ทุกการเข้าถึงจึงทำให้ต้องโหลดค่าจาก dict ใหม่ในรอบถัดไป
+    # - weights / biases  → โหลดแค่ค่าตัวเลข
+    # - connections       → compile โครงใหม่ด้วย (enabled / edge อาจเปลี่ยน)
+    # - nodes             → compile ใหม่เฉพาะเมื่อ layer / role / activation เปลี่ยน
+    # method ภายในที่แค่อ่านใช้ _sync_nodes() / _sync_params() กับ dict ดิบแทน
+
+    @property
+    def nodes(self) -> Dict[str, NodeSchema]:
+        self._release_dense()
+        self._nodes_touched = True
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value: Dict[str, NodeSchema]) -> None:
+        self._drop_dense()
+        self._topology_dirty = True
+        self._nodes = value
+
+    @property
+    def connections(self) -> Dict[str, ConnectionSchema]:
+        self._release_dense()
+        self._topology_dirty = True
+        return self._connections
+
+    @connections.setter
+    def connections(self, value: Dict[str, ConnectionSchema]) -> None:
+        self._drop_dense()
+        self._topology_dirty = True
+        self._connections = value
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        self._release_dense()
+        return self._weights
+
+    @weights.setter
+    def weights(self, value: Dict[str, float]) -> None:
+        self._drop_dense()
+        self._weights = value
+
+    @property
+    def biases(self) -> Dict[str, float]:
+        self._release_dense()
+        return self._biases
+
+    @biases.setter
+    def biases(self, value: Dict[str, float]) -> None:
+        self._drop_dense()
+        self._biases = value
+
     # ────────────────────────────────────────────────────────────
     # Hyperparameter pools
     # ────────────────────────────────────────────────────────────
@@ -91,22 +287,32 @@ class BrainStructure:
         "Sigmoid": 0.10, "Tanh": 0.10, "Swish": 0.10,
         "ELU": 0.10, "Linear": 0.05,
     }
+    # สัดส่วน connection ต่อช่องของ dense W ที่ต่ำกว่านี้ → forward ผ่าน CSR kernel
+    CSR_MAX_DENSITY = 0.25
+    # จำนวน connection สูงสุดที่ realtime update แก้ต่อ interaction
+    REALTIME_MAX_UPDATES = 10
+    # ขนาด pool ของ noise ที่สุ่มไว้ล่วงหน้า (ต่อการเรียก _rng หนึ่งครั้ง)
+    NOISE_POOL_SIZE = 1024
+
     LOSS_POOL = {
         "MSE": 0.35, "MAE": 0.15, "BinaryCrossEntropy": 0.15,
         "CategoricalCrossEntropy": 0.10, "MDN_NLL": 0.25,
     }
 
+    # ตารางสุ่มของ pool — subclass ที่เปลี่ยน pool ได้ตารางใหม่ใน __init_subclass__
+    _ACT_KEYS,  _ACT_CUM  = _pool_table(ACTIVATION_POOL)
+    _LOSS_KEYS, _LOSS_CUM = _pool_table(LOSS_POOL)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ACT_KEYS,  cls._ACT_CUM  = _pool_table(cls.ACTIVATION_POOL)
+        cls._LOSS_KEYS, cls._LOSS_CUM = _pool_table(cls.LOSS_POOL)
+
     def _rand_activation(self) -> str:
-        return str(np.random.choice(
-            list(self.ACTIVATION_POOL.keys()),
-            p=list(self.ACTIVATION_POOL.values()),
-        ))
+        return self._ACT_KEYS[int(np.searchsorted(self._ACT_CUM, self._rng.random(), side="right"))]
 
     def _rand_loss(self) -> str:
-        return str(np.random.choice(
-            list(self.LOSS_POOL.keys()),
-            p=list(self.LOSS_POOL.values()),
-        ))
+        return self._LOSS_KEYS[int(np.searchsorted(self._LOSS_CUM, self._rng.random(), side="right"))]
 
     # ────────────────────────────────────────────────────────────
     # Build
@@ -120,11 +326,12 @@ class BrainStructure:
         min_nodes:       int   = 2,
         max_nodes:       int   = 16,
     ) -> None:
+        rng = self._rng
         if self.layers is None:
-            self.layers = [
-                int(np.random.randint(min_nodes, max_nodes + 1))
-                for _ in range(np.random.randint(min_layers, max_layers + 1))
-            ]
+            self.layers = rng.integers(
+                min_nodes, max_nodes + 1,
+                size=int(rng.integers(min_layers, max_layers + 1)),
+            ).tolist()
 
         self.nodes.clear()
         self.connections.clear()
@@ -153,7 +360,6 @@ class BrainStructure:
                             layer=li, role="output", head=head,
                             activation=act, value=None, gradient=None, usage=0.0,
                         )
-                        self.biases[nid] = float(np.random.randn() * 0.01)
                         curr_nodes.append(nid)
                         node_counter += 1
             else:
@@ -168,21 +374,25 @@ class BrainStructure:
                         layer=li, role=role, head=None,
                         activation=act, value=None, gradient=None, usage=0.0,
                     )
-                    self.biases[nid] = float(np.random.randn() * 0.01)
                     curr_nodes.append(nid)
                     node_counter += 1
 
-            for s in prev_nodes:
-                for d in curr_nodes:
-                    if np.random.rand() <= connection_prob:
-                        cid = f"{s}->{d}"
-                        self.connections[cid] = ConnectionSchema(
-                            source=s, destination=d, enabled=True,
-                        )
-                        self.weights[cid] = float(np.random.randn() * 0.01)
+            if prev_nodes and curr_nodes:
+                keep = rng.random((len(prev_nodes), len(curr_nodes))) <= connection_prob
+                for i, j in zip(*np.nonzero(keep)):
+                    s, d = prev_nodes[i], curr_nodes[j]
+                    self.connections[f"{s}->{d}"] = ConnectionSchema(
+                        source=s, destination=d, enabled=True,
+                    )
 
             prev_nodes = curr_nodes
 
+        self._node_seq = node_counter
+
+        # สุ่ม bias / weight ทั้งหมดในครั้งเดียว
+        self.biases.update(zip(self.nodes, (rng.standard_normal(len(self.nodes)) * 0.01).tolist()))
+        self.weights.update(zip(self.connections, (rng.standard_normal(len(self.connections)) * 0.01).tolist()))
+
         logger.info(
             f"[BrainStructure] built {len(self.nodes)} nodes "
             f"{len(self.connections)} connections"
@@ -199,179 +409,633 @@ class BrainStructure:
         self.compiled_at  = datetime.now()
         logger.info(f"[BrainStructure] compiled loss={self.loss_name}")
 
+    # ────────────────────────────────────────────────────────────
+    # Dense view — graph ใน dict → matrix ต่อ layer
+    # ────────────────────────────────────────────────────────────
+
+    def _compile_dense(self) -> None:
+        """
+        สร้างโครงของ dense view จาก nodes / connections (ไม่รวมค่าตัวเลข)
+
+        - _order      : node id เรียงตาม layer (input มาก่อนใน layer เดียวกัน
+                        ที่เหลือคงลำดับของ dict)
+        - _node_index : nid → index ใน value vector
+        - _layer_span : (start, end) ของ node ที่ต้องคำนวณในแต่ละ layer
+        - _W[l]       : weight ของ layer l — shape (n_l, N + 1) แถว = dst, คอลัมน์ = src
+                        ช่องที่ไม่มี connection หรือ disabled = 0
+                        คอลัมน์สุดท้ายคือ bias — value vector มีช่อง N เป็น 1.0 เสมอ
+        - _mask[l]    : True เฉพาะช่องที่เป็น connection ที่ enabled (ไม่รวมคอลัมน์ bias)
+        - _b[l]       : view ของคอลัมน์ bias ใน _W[l]
+        - _free_idx   : index ของ node ที่ไม่ได้คำนวณ (input) — bias ของ node พวกนี้
+                        ไม่ถูกใช้ใน forward แต่ยังอัปเดตตาม gradient เก็บแยกใน _free_bias
+        - _layer_act  : [(vector activation, index ใน layer)] ต่อ layer — เฉพาะกลุ่มที่ต้องแปลง
+        - _act_groups : [(activation id, index ใน layer)] ต่อ layer — โครงเดียวกันสำหรับ JAX
+        - _z_buf[l]   : buffer ขนาด n_l ที่จองไว้ล่วงหน้าสำหรับ forward ทีละตัวอย่าง
+        - _edges[l]   : (rows, cols, cids) ของ connection ใน _W[l] — ใช้เขียน weight กลับ
+        - _upd[l]     : (rows, cols) ของ connection + คอลัมน์ bias — ช่องที่ gradient อัปเดต
+        - _intra[l]   : True ถ้ามี connection ภายใน layer เดียวกัน
+        - _seq[l]     : True ถ้ามี connection ภายใน layer ที่ src อยู่ก่อน dst (หรือ src = dst)
+                        ตามลำดับ dict — layer นี้ต้องคำนวณทีละ node (ดู _layer_seq)
+        - _row_act[l] : vector activation ราย node ของ layer (None = ไม่แปลง) — ใช้กับ _seq
+        - _input_idx  : index ของ input node ตามลำดับ dict (= คอลัมน์ของ x)
+        - _output_idx : head → index ของ output node ตามลำดับ dict
+        - _csr        : ส่วนคงที่ของ edge list สำหรับ CSR kernel (None = ใช้ dense)
+        - _computed   : True สำหรับ node ที่ forward คำนวณ (ไม่ใช่ input)
+        - _edge_pos   : cid → (l, row, col) ใน _W
+        - _enabled_cids : cid ของ connection ที่ enabled ตามลำดับ dict (รวมที่ชี้เข้า input)
+        - _bias_pos   : nid → (l, row) ใน _b — l = -1 หมายถึง index ใน _free_bias
+
+        loop รายตัวแบบเดิมไล่ node ใน layer ตามลำดับ dict — src ที่อยู่หลัง dst
+        ยังเป็นค่าเดิม ส่วน src ที่อยู่ก่อน dst เป็นค่าใหม่ที่เพิ่งคำนวณ
+        ADD_NODE ต่อท้าย dict เสมอ connection ภายใน layer ที่มันสร้างจึงชี้จาก
+        node ใหม่ไป node เก่า → คำนวณทั้ง layer พร้อมกันจาก value เดิมได้ผลเท่ากัน
+        layer ที่มี connection ทิศกลับ (เช่นแก้ dict เอง) ตั้ง _seq ไว้ คำนวณทีละ node แทน
+        """
+        order = sorted(
+            self._nodes,
+            key=lambda nid: (self._nodes[nid]["layer"], self._nodes[nid]["role"] != "input"),
+        )
+        index = {nid: i for i, nid in enumerate(order)}
+        N     = len(order)
+
+        act_id = [_ACT_ID[self._nodes[nid]["activation"]] for nid in order]
+
+        spans:  List[Tuple[int, int]] = []
+        acts:   List[list]            = []
+        act_groups: List[List[Tuple[int, NDArray[np.int64]]]] = []
+        i = 0
+        while i < N:
+            layer = self._nodes[order[i]]["layer"]
+            while i < N and self._nodes[order[i]]["layer"] == layer \
+                    and self._nodes[order[i]]["role"] == "input":
+                i += 1
+            start = i
+            groups: Dict[int, List[int]] = {}
+            while i < N and self._nodes[order[i]]["layer"] == layer:
+                groups.setdefault(act_id[i], []).append(i - start)
+                i += 1
+            if i == start:
+                continue
+            spans.append((start, i))
+            # id 0 ไม่ต้องแปลง — softmax จัดการใน collect_outputs
+            acts.append([
+                (_ACT_TABLE[a], slice(None) if len(idx) == i - start else np.asarray(idx))
+                for a, idx in groups.items() if a
+            ])
+            act_groups.append([(a, np.asarray(idx)) for a, idx in groups.items() if a])
+
+        mask  = [np.zeros((e - s, N), dtype=bool) for s, e in spans]
+        owner = np.empty(N, dtype=np.int64)
+        for l, (s, e) in enumerate(spans):
+            owner[s:e] = l
+        computed = np.zeros(N, dtype=bool)
+        for s, e in spans:
+            computed[s:e] = True
+
+        edges: List[Tuple[List[int], List[int], List[str]]] = [([], [], []) for _ in spans]
+        enabled_cids: List[str] = []
+        for cid, c in self._connections.items():
+            if not c["enabled"]:
+                continue
+            enabled_cids.append(cid)
+            d = index[c["destination"]]
+            if not computed[d]:
+                continue
+            l   = owner[d]
+            row = d - spans[l][0]
+            src = index[c["source"]]
+            mask[l][row, src] = True
+            edges[l][0].append(row)
+            edges[l][1].append(src)
+            edges[l][2].append(cid)
+
+        outputs: Dict[str, List[str]] = {}
+        for nid, n in self._nodes.items():
+            if n["role"] == "output":
+                outputs.setdefault(n["head"] if n["head"] is not None else "default", []).append(nid)
+
+        self._order      = order
+        self._node_index = index
+        self._layer_span = spans
+        self._layer_act  = acts
+        self._act_groups = act_groups
+        self._jax_forward = None
+        self._z_buf      = [np.empty(e - s) for s, e in spans]
+        # W ทุก layer เป็น view บน buffer เดียว — อ้างช่อง weight ข้าม layer ด้วย index แบน
+        w_off = np.concatenate([[0], np.cumsum([(e - s) * (N + 1) for s, e in spans])]).astype(np.int64)
+        self._W_flat     = np.zeros(int(w_off[-1]))
+        self._W          = [
+            self._W_flat[w_off[l]:w_off[l + 1]].reshape(e - s, N + 1)
+            for l, (s, e) in enumerate(spans)
+        ]
+        self._mask       = mask
+        self._b          = [W[:, N] for W in self._W]
+        self._free_idx   = np.flatnonzero(~computed)
+        self._free_bias  = np.zeros(self._free_idx.size)
+        self._edges      = [
+            (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64), cids)
+            for rows, cols, cids in edges
+        ]
+        self._upd        = [
+            (np.concatenate([rows, np.arange(e - s)]), np.concatenate([cols, np.full(e - s, N)]))
+            for (rows, cols, _), (s, e) in zip(self._edges, spans)
+        ]
+        self._intra      = [bool(m[:, s:e].any()) for m, (s, e) in zip(mask, spans)]
+        # แถว = dst, คอลัมน์ = src ภายใน layer → src ก่อนหรือเท่ากับ dst คือสามเหลี่ยมล่างรวมทแยง
+        self._seq        = [bool(np.tril(m[:, s:e]).any()) for m, (s, e) in zip(mask, spans)]
+        self._row_act    = [[_ACT_TABLE[a] for a in act_id[s:e]] for s, e in spans]
+        self._input_idx  = np.array(
+            [index[nid] for nid, n in self._nodes.items() if n["role"] == "input"],
+            dtype=np.int64,
+        )
+        self._output_ids = outputs
+        self._output_idx = {
+            k: np.array([index[nid] for nid in ids], dtype=np.int64)
+            for k, ids in outputs.items()
+        }
+        self._computed   = computed
+        self._enabled_cids = enabled_cids
+        self._edge_pos   = {
+            cid: (l, row, col)
+            for l, (rows, cols, cids) in enumerate(edges)
+            for row, col, cid in zip(rows, cols, cids)
+        }
+        # connection ที่ realtime update แตะ: enabled ตัวแรกๆ ตามลำดับ dict
+        # pos = index ใน _W_flat หรือ -1 ถ้าปลายทางไม่ได้ถูกคำนวณ (weight อยู่ใน dict)
+        rt = enabled_cids[:self.REALTIME_MAX_UPDATES]
+        self._rt_cids = rt
+        self._rt_dst  = np.array(
+            [index[self._connections[cid]["destination"]] for cid in rt], dtype=np.int64,
+        )
+        self._rt_pos  = np.array([
+            w_off[p[0]] + p[1] * (N + 1) + p[2] if p is not None else -1
+            for p in map(self._edge_pos.get, rt)
+        ], dtype=np.int64)
+        self._bias_pos   = {order[i]: (-1, k) for k, i in enumerate(self._free_idx.tolist())}
+        for l, (s, e) in enumerate(spans):
+            for row in range(e - s):
+                self._bias_pos[order[s + row]] = (l, row)
+
+        n_edges = sum(len(rows) for rows, _ in self._upd)
+        cells   = sum((e - s) * (N + 1) for s, e in spans)
+        self._csr = None
+        # CSR kernel / JAX คำนวณทั้ง layer พร้อมกัน — layer แบบ _seq ใช้ dense path เท่านั้น
+        if _forward_csr_jit is not None and n_edges < self.CSR_MAX_DENSITY * cells \
+                and not any(self._seq):
+            self._csr = (
+                np.concatenate([[0], np.cumsum([len(rows) for rows, _ in self._upd])]).astype(np.int64),
+                np.array([s for s, _ in spans], dtype=np.int64),
+                np.array([e for _, e in spans], dtype=np.int64),
+                np.concatenate([cols for _, cols in self._upd] or [np.empty(0, np.int64)]),
+                np.concatenate([rows + s for (rows, _), (s, _) in zip(self._upd, spans)]
+                               or [np.empty(0, np.int64)]),
+                np.array(act_id, dtype=np.int8),
+            )
+
+    def _enabled_ids(self) -> List[str]:
+        """
+        cid ของ connection ที่ enabled — ใช้ list ที่เก็บไว้ตอน compile ถ้า topology
+        ยังไม่เปลี่ยน (การเข้าถึง connections ทุกครั้งตั้ง _topology_dirty) ห้ามแก้ list ที่คืน
+        """
+        if not self._topology_dirty:
+            return self._enabled_cids
+        return [cid for cid, c in self._connections.items() if c["enabled"]]
+
+    def _num_enabled(self) -> int:
+        """จำนวน connection ที่ enabled"""
+        return len(self._enabled_ids())
+
+    def _node_signature(self) -> tuple:
+        """ส่วนของ node ที่มีผลต่อโครง dense view"""
+        return tuple(
+            (nid, n["layer"], n["role"], n["head"], n["activation"])
+            for nid, n in self._nodes.items()
+        )
+
+    def _refresh_topology(self) -> None:
+        """
+        compile โครง dense view ใหม่เฉพาะเมื่อ topology เปลี่ยน
+
+        _topology_dirty ถูกตั้งโดย build / evolution / การเข้าถึง connections
+        ส่วน nodes ที่ถูกเข้าถึง (ส่วนใหญ่แค่อ่าน/ตั้ง value) เทียบ signature แทน
+        """
+        if self._nodes_touched and not self._topology_dirty:
+            self._topology_dirty = self._node_signature() != self._topology_sig
+        self._nodes_touched = False
+        if not self._topology_dirty:
+            return
+        self._compile_dense()
+        self._topology_sig   = self._node_signature()
+        self._topology_dirty = False
+
+    def _load_dense(self) -> None:
+        """โหลดค่าตัวเลข (weight / bias / value / gradient / usage) จาก dict เข้า array"""
+        for W, (rows, cols, cids), (s, e) in zip(self._W, self._edges, self._layer_span):
+            W[rows, cols] = [self._weights[cid] for cid in cids]
+            W[:, -1]      = [self._biases[nid] for nid in self._order[s:e]]
+        self._free_bias[:] = [self._biases[self._order[i]] for i in self._free_idx]
+        nodes  = [self._nodes[nid] for nid in self._order]
+        values = [n["value"] for n in nodes]
+        grads  = [n["gradient"] for n in nodes]
+        self._has_value = np.array([v is not None for v in values], dtype=bool)
+        self._has_grad  = np.array([g is not None for g in grads], dtype=bool)
+        self._values    = np.array([0.0 if v is None else v for v in values] + [1.0], dtype=np.float64)
+        self._grads     = np.array([0.0 if g is None else g for g in grads], dtype=np.float64)
+        self._usage     = np.array([n["usage"] for n in nodes], dtype=np.float64)
+
+    def _ensure_dense(self) -> None:
+        """เตรียม dense view จาก dict ถ้ายังไม่มีหรือถูกปล่อยไปแล้ว"""
+        if not self._dense_valid:
+            self._refresh_topology()
+            self._load_dense()
+            self._dense_valid  = True
+            self._nodes_dirty  = False
+            self._params_dirty = False
+
+    def _sync_nodes(self) -> None:
+        """เขียน value / usage / gradient จาก array กลับเข้า node dict"""
+        if not (self._dense_valid and self._nodes_dirty):
+            return
+        for nid, v, has_v, u, g, has_g in zip(
+            self._order, self._values.tolist(), self._has_value.tolist(),
+            self._usage.tolist(), self._grads.tolist(), self._has_grad.tolist(),
+        ):
+            node = self._nodes[nid]
+            node["value"]    = v if has_v else None
+            node["usage"]    = u
+            node["gradient"] = g if has_g else None
+        self._nodes_dirty = False
+
+    def _sync_params(self) -> None:
+        """เขียน weight / bias จาก array กลับเข้า dict"""
+        if not (self._dense_valid and self._params_dirty):
+            return
+        for l, (rows, cols, cids) in enumerate(self._edges):
+            for cid, w in zip(cids, self._W[l][rows, cols].tolist()):
+                self._weights[cid] = w
+            s, e = self._layer_span[l]
+            for nid, b in zip(self._order[s:e], self._b[l].tolist()):
+                self._biases[nid] = b
+        for i, b in zip(self._free_idx.tolist(), self._free_bias.tolist()):
+            self._biases[self._order[i]] = b
+        self._params_dirty = False
+
+    def _release_dense(self) -> None:
+        """sync ทุกอย่างกลับ dict แล้วปล่อย dense view — ผู้เรียกจะแก้ dict ต่อ"""
+        self._sync_nodes()
+        self._sync_params()
+        self._dense_valid = False
+
+    def _drop_dense(self) -> None:
+        """ทิ้ง dense view โดยไม่ sync — dict ถูกแทนทั้งก้อน (เช่น rollback)"""
+        self._dense_valid  = False
+        self._nodes_dirty  = False
+        self._params_dirty = False
+
     # ────────────────────────────────────────────────────────────
     # Forward / Backward
     # ────────────────────────────────────────────────────────────
 
+    def _layer_fused(
+        self,
+        l:   int,
+        V:   NDArray[np.float64],
+        out: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        """
+        weighted sum + bias + activation ของ layer l ลง out ในรอบเดียว
+        bias อยู่ในคอลัมน์สุดท้ายของ W[l] คูณกับช่อง 1.0 ของ V — matmul เดียวจบ
+        out ต้องไม่ใช่ view ของ V — W[l] อ่านทุกคอลัมน์ของ V รวมถึงช่วงของ layer เอง
+
+        activation ทั้ง layer → เขียนทับ out ตรงๆ / หลายชนิด → ทีละกลุ่ม index
+        softmax ไม่ทำที่นี่ — collect_outputs ต้องการ logit ดิบของทั้ง head
+        """
+        np.dot(self._W[l], V, out=out)
+        for act_fn, idx in self._layer_act[l]:
+            if isinstance(idx, slice):
+                act_fn(out, out=out)
+            else:
+                out[idx] = act_fn(out[idx])
+        return out
+
+    def _layer_seq(self, l: int, V: NDArray[np.float64]) -> None:
+        """
+        คำนวณ layer l ทีละ node ตามลำดับ dict แบบ in-place บน V
+        node ที่ตามมาอ่านค่าใหม่ของ node ก่อนหน้าใน layer — ตรงกับ loop รายตัวแบบเดิม
+        """
+        s, e = self._layer_span[l]
+        W    = self._W[l]
+        for row, act_fn in enumerate(self._row_act[l]):
+            z = W[row:row + 1] @ V
+            V[s + row] = (act_fn(z) if act_fn is not None else z)[0]
+
+    def _forward_dense(self, V: NDArray[np.float64], count_usage: bool = True) -> None:
+        """
+        คำนวณทุก layer แบบ in-place บน V — shape (N + 1,) หรือ (N + 1, B) สำหรับ batch
+        value ที่เป็น None นับเป็น 0 — เท่ากับข้ามไปตอนรวม
+        """
+        batched = V.ndim == 2
+        for l, (s, e) in enumerate(self._layer_span):
+            if self._seq[l]:
+                self._layer_seq(l, V)
+            else:
+                out = np.empty((e - s, V.shape[1])) if batched else self._z_buf[l]
+                V[s:e] = self._layer_fused(l, V, out)
+            if count_usage:
+                self._usage[s:e] += V.shape[1] if batched else 1
+
+    def _forward_sparse(self) -> None:
+        """forward ผ่าน CSR kernel — weight อ่านสดจาก _W ทุกครั้ง"""
+        layer_ptr, starts, ends, src, dst, act_id = self._csr
+        w = np.concatenate(
+            [W[rows, cols] for W, (rows, cols) in zip(self._W, self._upd)]
+            or [np.empty(0)]
+        )
+        _forward_csr_jit(layer_ptr, starts, ends, src, dst, w, act_id, self._values)
+        for s, e in self._layer_span:
+            self._usage[s:e] += 1
+
     def forward(self) -> None:
-        by_layer: Dict[int, List[str]] = {}
-        for nid, n in self.nodes.items():
-            by_layer.setdefault(n["layer"], []).append(nid)
-
-        for layer in sorted(by_layer):
-            for nid in by_layer[layer]:
-                node = self.nodes[nid]
-                if node["role"] == "input":
-                    continue
-
-                total = sum(
-                    self.weights[cid] * self.nodes[c["source"]]["value"]
-                    for cid, c in self.connections.items()
-                    if c["enabled"] and c["destination"] == nid
-                    and self.nodes[c["source"]]["value"] is not None
-                )
-                total += self.biases[nid]
+        self._ensure_dense()
+        if self._csr is not None:
+            self._forward_sparse()
+        else:
+            self._forward_dense(self._values)
+        self._has_value |= self._computed
+        self._nodes_dirty = True
 
-                act_name = node["activation"]
-                if act_name == "softmax":
-                    # softmax ใช้ vector — จัดการใน collect_outputs
-                    node["value"] = total
-                elif act_name is not None:
-                    act_fn = ActivationFunctions.get_activation_function(act_name)
-                    node["value"] = act_fn(total)
-                else:
-                    node["value"] = total
+    def to_jax(self) -> List[Any]:
+        """
+        ส่ง weight ปัจจุบันขึ้น device ของ JAX (คอลัมน์สุดท้ายคือ bias)
+        เรียกใหม่หลัง train / evolve — array บน device ไม่ตาม _W ที่แก้ทีหลัง
+        """
+        if jax is None:
+            raise RuntimeError("[BrainStructure] to_jax() requires jax")
+        self._ensure_dense()
+        return [jnp.asarray(W) for W in self._W]
 
-                node["usage"] += 1.0
+    def predict_batch(self, X: NDArray[np.float64]) -> Dict[str, NDArray[np.float64]]:
+        """
+        inference ทั้ง batch — คืน head → array shape (B, n_head) (mdn_pi ผ่าน softmax แล้ว)
+
+        ไม่แตะ value / usage ของ node; device="gpu" และมี jax → forward ผ่าน jax.jit
+        (compile ใหม่เมื่อ topology เปลี่ยน) ไม่งั้นใช้ dense NumPy path
+        คุ้มกับ GPU เฉพาะ batch ใหญ่ — weight ถูกส่งขึ้น device ทุกครั้งที่เรียก
+        """
+        self._ensure_dense()
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        N = len(self._order)
+        V = np.zeros((N + 1, X.shape[0]))
+        V[N] = 1.0
+        V[self._input_idx] = X[:, :self._input_idx.size].T
+
+        if self.device == "gpu" and jax is not None and not any(self._seq):
+            if self._jax_forward is None:
+                self._jax_forward = _build_jax_forward(self._layer_span, self._act_groups)
+            V = np.asarray(self._jax_forward(self.to_jax(), jnp.asarray(V)).block_until_ready())
+        else:
+            self._forward_dense(V, count_usage=False)
+
+        result: Dict[str, NDArray[np.float64]] = {}
+        for k, idx in self._output_idx.items():
+            out = V[idx].T
+            if k == "mdn_pi":
+                out = np.exp(out - out.max(axis=1, keepdims=True))
+                out /= out.sum(axis=1, keepdims=True)
+            result[k] = out
+        return result
+
+    def _backward_dense(
+        self,
+        g:       NDArray[np.float64],
+        reached: Optional[NDArray[np.bool_]] = None,
+    ) -> None:
+        """
+        กระจาย gradient ย้อน layer แบบ in-place: g[src] += Σ g[dst] · w
+        g มี shape (N,) หรือ (N, B)
+
+        loop รายตัวแบบเดิมไล่ node ใน layer ตามลำดับ dict แล้วส่ง gradient ไปยัง src
+        connection ภายใน layer ที่ชี้จาก node ใหม่ไป node เก่า (src อยู่หลัง dst)
+        → src ได้ gradient ครบก่อนถึงตาของตัวเอง เท่ากับ g_l = g0 + Aᵀ g_l
+        layer แบบ _seq ไม่เป็นแบบนั้น → ไล่ทีละ node ตามลำดับเดิมแทน
+        ถ้ามี reached → ติดตามว่า node ไหนได้รับ gradient (แทน None)
+        """
+        for l in range(len(self._layer_span) - 1, -1, -1):
+            s, e = self._layer_span[l]
+            W    = self._W[l]
+            if self._seq[l]:
+                N = W.shape[1] - 1
+                for row in range(e - s):
+                    gi = g[s + row].copy()
+                    g[:N] += np.multiply.outer(W[row, :N], gi)
+                    if reached is not None and reached[s + row]:
+                        reached[:N] |= self._mask[l][row]
+                continue
+            if self._intra[l]:
+                A = W[:, s:e]
+                g[s:e] = np.linalg.solve(np.eye(e - s) - A.T, g[s:e])
+                if reached is not None:
+                    for _ in range(e - s):
+                        r = reached[s:e] | self._mask[l][reached[s:e]][:, s:e].any(axis=0)
+                        if (r == reached[s:e]).all():
+                            break
+                        reached[s:e] = r
+            contrib = W.T @ g[s:e]      # ช่องสุดท้าย = คอลัมน์ bias ไม่ส่งต่อ
+            g[:s] += contrib[:s]
+            g[e:] += contrib[e:-1]
+            if reached is not None:
+                reached |= self._mask[l][reached[s:e]].any(axis=0)
 
     def backward(self) -> None:
-        by_layer: Dict[int, List[str]] = {}
-        for nid, n in self.nodes.items():
-            by_layer.setdefault(n["layer"], []).append(nid)
-
-        for layer in sorted(by_layer, reverse=True):
-            for nid in by_layer[layer]:
-                g = self.nodes[nid]["gradient"]
-                if g is None:
-                    continue
-                for cid, c in self.connections.items():
-                    if not c["enabled"] or c["destination"] != nid:
-                        continue
-                    src      = c["source"]
-                    contrib  = g * self.weights[cid]
-                    prev     = self.nodes[src]["gradient"]
-                    self.nodes[src]["gradient"] = (
-                        contrib if prev is None else prev + contrib
-                    )
+        self._ensure_dense()
+        self._backward_dense(self._grads, self._has_grad)
+        self._nodes_dirty = True
+
+    def _apply_gradients(
+        self,
+        g:  NDArray[np.float64],
+        V:  NDArray[np.float64],
+        lr: float,
+    ) -> None:
+        """
+        W -= lr · g_dst · x_src เฉพาะ connection ที่ enabled
+        คอลัมน์ bias มี x = 1.0 → อัปเดตเป็น bias -= lr · g ในคำสั่งเดียวกัน
+        ถ้าเป็น batch (N, B) → ใช้ค่าเฉลี่ยของ batch
+        """
+        batched = g.ndim == 2
+        for l, (s, e) in enumerate(self._layer_span):
+            rows, cols = self._upd[l]
+            dW = g[s:e][rows] * V[cols]
+            self._W[l][rows, cols] -= lr * (dW.mean(axis=1) if batched else dW)
+        g_free = g[self._free_idx]
+        self._free_bias -= lr * (g_free.mean(axis=1) if batched else g_free)
 
     def collect_outputs(
         self,
     ) -> Tuple[Dict[str, NDArray[np.float64]], Dict[str, List[str]]]:
-        from Core.Neural.Brain.Functions.Activation import softmax as softmax_fn
-        values:    Dict[str, List[float]] = {}
-        index_map: Dict[str, List[str]]   = {}
+        """
+        ค่า output แยกตาม head — gather จาก dense view ด้วย index ที่ compile ไว้
+        index_map (head → node id) เป็นของ topology ปัจจุบัน ห้ามแก้
+        """
+        return self._softmax_pi(self._raw_outputs()), self._output_ids
 
-        for nid, n in self.nodes.items():
-            if n["role"] != "output":
-                continue
-            val = n["value"]
-            if val is None:
+    def _raw_outputs(self) -> Dict[str, NDArray[np.float64]]:
+        """ค่า output ดิบแยกตาม head — mdn_pi ยังเป็น logit"""
+        self._ensure_dense()
+        result: Dict[str, NDArray[np.float64]] = {}
+        for k, idx in self._output_idx.items():
+            has = self._has_value[idx]
+            if not has.all():
+                nid = self._output_ids[k][int(np.flatnonzero(~has)[0])]
                 raise RuntimeError(f"[BrainStructure] output node {nid} has no value")
-            key = n["head"] if n["head"] is not None else "default"
-            values.setdefault(key, []).append(val)
-            index_map.setdefault(key, []).append(nid)
+            result[k] = self._values[idx]
+        return result
 
-        result: Dict[str, NDArray[np.float64]] = {}
-        for k, v in values.items():
-            arr = np.asarray(v, dtype=np.float64)
-            # softmax สำหรับ mdn_pi
-            if k == "mdn_pi":
-                arr = softmax_fn(arr)
-            result[k] = arr
+    @staticmethod
+    def _softmax_pi(raw: Dict[str, NDArray[np.float64]]) -> Dict[str, NDArray[np.float64]]:
+        """softmax สำหรับ mdn_pi — head อื่นคงเดิม"""
+        from Core.Neural.Brain.Functions.Activation import softmax as softmax_fn
+        return {k: softmax_fn(v) if k == "mdn_pi" else v for k, v in raw.items()}
+
+    def _output_gradients(
+        self,
+        y_true:  Any,
+        raw:     Dict[str, NDArray[np.float64]],
+    ) -> Tuple[float, Dict[str, NDArray]]:
+        """
+        คำนวณ loss + gradient จาก output ดิบ แล้วตรวจ gradient ผ่าน NeuralController
+
+        MDN_NLL ที่ลงทะเบียนไว้ → fused softmax + NLL บน logit ของ mdn_pi
+        loss อื่น → softmax mdn_pi ก่อนแล้วเรียก loss_fn / loss_grad_fn ตามปกติ
+        """
+        grads: Dict[str, NDArray]
+        if self.loss_fn is _MDN_NLL_LOSS and "mdn_pi" in raw:
+            loss, d_pi, d_mu, d_sigma = LossFunctions.fused_mdn_nll_from_logits(
+                raw["mdn_pi"], raw["mdn_mu"], raw["mdn_sigma"], y_true,
+            )
+            grads = {"mdn_pi": d_pi, "mdn_mu": d_mu, "mdn_sigma": d_sigma}
+        else:
+            outputs     = self._softmax_pi(raw)
+            loss        = self.loss_fn(y_true, outputs)
+            grad_result = self.loss_grad_fn(y_true, outputs)
+            grads = (
+                grad_result if isinstance(grad_result, dict)
+                else {"default": grad_result}
+            )
 
-        return result, index_map
+        # ── Monitor gradients (ทั้ง vector ต่อ head) ───────────────
+        for key, grad_vec in grads.items():
+            try:
+                self._neural.monitor_gradient_batch(f"output_{key}", grad_vec)
+            except RuntimeError as e:
+                logger.error(f"[BrainStructure] GRADIENT_UNSAFE: {e}")
+                raise  # หยุด training ตาม NeuralEvolution Rule
+
+        return float(loss), grads
 
     def backpropagation(self, y_true: Any, lr: float) -> float:
         if self.loss_fn is None or self.loss_grad_fn is None:
             raise RuntimeError("[BrainStructure] call compile() first")
 
-        outputs, index_map = self.collect_outputs()
-        loss        = self.loss_fn(y_true, outputs)
-        grad_result = self.loss_grad_fn(y_true, outputs)
-        grads: Dict[str, NDArray] = (
-            grad_result if isinstance(grad_result, dict)
-            else {"default": grad_result}
-        )
-
-        # ── Monitor gradients ──────────────────────────────────────
-        for key, grad_vec in grads.items():
-            for g_val in np.asarray(grad_vec).flatten():
-                try:
-                    self._neural.monitor_gradient(f"output_{key}", float(g_val))
-                except RuntimeError as e:
-                    logger.error(f"[BrainStructure] GRADIENT_UNSAFE: {e}")
-                    raise  # หยุด training ตาม NeuralEvolution Rule
+        loss, grads = self._output_gradients(y_true, self._raw_outputs())
 
         # ── Assign output gradients ───────────────────────────────
-        for key, node_ids in index_map.items():
-            grad_vec = grads.get(key, grads.get("default", np.zeros(len(node_ids))))
-            for i, nid in enumerate(node_ids):
-                self.nodes[nid]["gradient"] = float(grad_vec[i])
-
-        self.backward()
+        # gradient ที่เป็น None นับเป็น 0
+        g = self._grads
+        for key, idx in self._output_idx.items():
+            grad_vec = grads.get(key, grads.get("default", np.zeros(idx.size)))
+            g[idx] = np.asarray(grad_vec)[:idx.size]
 
-        # ── Update weights ────────────────────────────────────────
-        for cid, c in self.connections.items():
-            if not c["enabled"]:
-                continue
-            g = self.nodes[c["destination"]]["gradient"]
-            x = self.nodes[c["source"]]["value"]
-            if g is not None and x is not None:
-                self.weights[cid] -= lr * g * x
+        self._backward_dense(g)
+        self._apply_gradients(g, self._values, lr)
+        g.fill(0.0)
+        self._has_grad[:] = False
+        self._nodes_dirty = self._params_dirty = True
 
-        for nid, n in self.nodes.items():
-            if n["gradient"] is not None:
-                self.biases[nid] -= lr * n["gradient"]
-                n["gradient"] = None
-
-        return float(loss)
+        return loss
 
     # ────────────────────────────────────────────────────────────
     # Train
     # ────────────────────────────────────────────────────────────
 
+    def _train_batch(
+        self,
+        x_batch: NDArray[np.float64],
+        y_batch: NDArray[Any],
+        lr:      float,
+    ) -> float:
+        """
+        forward + backward ของทั้ง batch ผ่าน matrix เดียว (node × sample)
+        คืนผลรวม loss ของ batch
+        """
+        B = x_batch.shape[0]
+        N = len(self._order)
+        V = np.zeros((N + 1, B))
+        V[N] = 1.0
+        V[self._input_idx] = x_batch[:, :self._input_idx.size].T
+        self._forward_dense(V)
+
+        G = np.zeros((N, B))
+        G[:, 0] = self._grads   # gradient ที่ค้างอยู่ใน node (ปกติเป็น 0)
+        self._grads.fill(0.0)
+        total = 0.0
+        for k in range(B):
+            raw = {h: V[idx, k] for h, idx in self._output_idx.items()}
+            loss, grads = self._output_gradients(y_batch[k], raw)
+            total += loss
+            for h, idx in self._output_idx.items():
+                grad_vec = grads.get(h, grads.get("default", np.zeros(idx.size)))
+                G[idx, k] = np.asarray(grad_vec)[:idx.size]
+
+        self._backward_dense(G)
+        self._apply_gradients(G, V, lr)
+        self._values[:] = V[:, -1]
+        self._has_value[:] = True
+        self._has_grad[:]  = False
+        return total
+
     def train(
         self,
         x_train: NDArray[np.float64],
         y_train: NDArray[Any],
         *,
-        epochs: int,
-        lr:     float,
+        epochs:     int,
+        lr:         float,
+        batch_size: int = 1,
     ) -> List[float]:
         """
         Train และคืน loss history ต่อ epoch
+
+        batch_size > 1 → คำนวณทีละ batch ด้วย matrix (node × sample)
+        และอัปเดตด้วย gradient เฉลี่ยของ batch — batch_size=1 คือ SGD ทีละ sample
         """
         if self.loss_fn is None:
             raise RuntimeError("[BrainStructure] call compile() first")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
 
-        inputs   = [nid for nid, n in self.nodes.items() if n["role"] == "input"]
+        self._ensure_dense()
         n_samples = x_train.shape[0]
         history: List[float] = []
 
         for ep in range(epochs):
             total_loss = 0.0
-            for i in range(n_samples):
-                # reset values
-                for nid in self.nodes:
-                    if self.nodes[nid]["role"] != "input":
-                        self.nodes[nid]["value"] = None
-
-                for j, nid in enumerate(inputs):
-                    self.nodes[nid]["value"] = float(x_train[i, j])
-
-                self.forward()
-                total_loss += self.backpropagation(y_train[i], lr)
+            for i in range(0, n_samples, batch_size):
+                total_loss += self._train_batch(
+                    x_train[i:i + batch_size], y_train[i:i + batch_size], lr,
+                )
 
             avg_loss = total_loss / n_samples
             history.append(avg_loss)
             if self.verbose:
-                logger.info(
-                    f"[BrainStructure] Epoch {ep+1}/{epochs} "
-                    f"loss={avg_loss:.6f}"
-                )
-                if self.verbose:
-                    print(f"[Epoch {ep+1}/{epochs}] loss={avg_loss:.6f}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "[BrainStructure] Epoch %d/%d loss=%.6f",
+                        ep + 1, epochs, avg_loss,
+                    )
+                print(f"[Epoch {ep+1}/{epochs}] loss={avg_loss:.6f}")
 
+        self._nodes_dirty = self._params_dirty = True
         return history
 
     # ────────────────────────────────────────────────────────────
@@ -379,12 +1043,20 @@ class BrainStructure:
     # ────────────────────────────────────────────────────────────
 
     def take_snapshot(self) -> StructureSnapshot:
-        """เก็บ snapshot ก่อน evolve"""
+        """
+        เก็บ snapshot ก่อน evolve
+
+        NodeSchema / ConnectionSchema มีแต่ค่า scalar — copy ทีละ dict ชั้นเดียว
+        ก็แยกจากของจริงครบ ไม่ต้อง deepcopy; sync ค่าจาก dense view ก่อน
+        แต่ไม่ปล่อย view ทิ้ง (snapshot ไม่ได้แก้โครงสร้าง)
+        """
+        self._sync_nodes()
+        self._sync_params()
         snap: StructureSnapshot = {
-            "nodes":       copy.deepcopy(self.nodes),
-            "connections": copy.deepcopy(self.connections),
-            "weights":     dict(self.weights),
-            "biases":      dict(self.biases),
+            "nodes":       {nid: dict(n) for nid, n in self._nodes.items()},
+            "connections": {cid: dict(c) for cid, c in self._connections.items()},
+            "weights":     dict(self._weights),
+            "biases":      dict(self._biases),
         }
         self._snapshots.append(snap)
         return snap
@@ -428,12 +1100,13 @@ class BrainStructure:
             ProposalData ถ้าต้องการ evolve
             None ถ้า NO_OP
         """
+        self._sync_nodes()
         ctx = EvolutionContext(
             loss            = loss,
             loss_trend      = loss - prev_loss,
-            num_nodes       = len(self.nodes),
-            num_connections = sum(1 for c in self.connections.values() if c["enabled"]),
-            usage           = {nid: n["usage"] for nid, n in self.nodes.items()},
+            num_nodes       = len(self._nodes),
+            num_connections = self._num_enabled(),
+            usage           = {nid: n["usage"] for nid, n in self._nodes.items()},
             model_type      = self.model_type,
         )
 
@@ -527,29 +1200,48 @@ class BrainStructure:
     # ────────────────────────────────────────────────────────────
 
     def _apply_intent(self, intent: str) -> None:
-        match intent:
-            case "ADD_NODE":        self._add_node()
-            case "ADD_CONNECTION":  self._add_connection()
-            case "PRUNE_NODE":      self._prune_node()
-            case "PRUNE_CONNECTION":self._prune_connection()
-            case "ADD_LAYER":       self._add_layer()
-            case "PRUNE_LAYER":     self._prune_layer()
-            case "MUTATE_WEIGHT":   self._mutate_weight()
-            case "MUTATE_BIAS":     self._mutate_bias()
-            case _:
-                raise ValueError(f"unknown intent: {intent}")
+        fn = self._INTENT_TABLE.get(intent)
+        if fn is None:
+            raise ValueError(f"unknown intent: {intent}")
+        fn(self)
+
+    def _noise(self, k: int) -> NDArray[np.float64]:
+        """k ค่าจาก N(0,1) — ตัดจาก pool ที่สุ่มไว้ล่วงหน้า หมดแล้วสุ่มใหม่ทั้งก้อน"""
+        if self._noise_idx + k > self._noise_buf.size:
+            self._noise_buf = self._rng.standard_normal(max(self.NOISE_POOL_SIZE, k))
+            self._noise_idx = 0
+        out = self._noise_buf[self._noise_idx:self._noise_idx + k]
+        self._noise_idx += k
+        return out
+
+    @staticmethod
+    def _nth_key(d: Dict[str, Any], i: int) -> str:
+        """key ลำดับที่ i ของ dict — เดินใน C ไม่ต้องสร้าง list / array ของ string"""
+        return next(itertools.islice(d, i, None))
+
+    def _new_node_id(self, layer: int) -> str:
+        """
+        id ของ node ใหม่จากเลขรัน _node_seq — ไม่ใช้ len(nodes)
+        (หลัง prune จำนวน node ลดลง เลขจาก len ชนกับ id ที่มีอยู่ → node เดิมถูกเขียนทับ)
+        ข้ามเลขที่มีอยู่แล้ว เผื่อ nodes ถูกโหลด / แก้จากภายนอก
+        """
+        while True:
+            nid = f"L{layer}_N{self._node_seq}"
+            self._node_seq += 1
+            if nid not in self._nodes:
+                return nid
 
     def _add_node(self) -> None:
         if not self.connections:
             return
-        cid  = np.random.choice(list(self.connections.keys()))
+        cid  = self._nth_key(self.connections, self._rng.integers(len(self.connections)))
         conn = self.connections[cid]
         if not conn["enabled"]:
             return
         src = conn["source"]
         dst = conn["destination"]
         new_layer = self.nodes[src]["layer"] + 1
-        nid = f"L{new_layer}_N{len(self.nodes)}"
+        nid = self._new_node_id(new_layer)
         self.nodes[nid] = NodeSchema(
             layer=new_layer, role="hidden", head=None,
             activation=self._rand_activation(),
@@ -564,23 +1256,36 @@ class BrainStructure:
         self.weights[c2] = self.weights[cid]
 
     def _add_connection(self) -> None:
-        nodes = list(self.nodes.keys())
+        """
+        สุ่มคู่ (src, dst) ที่ layer ของ src < dst แบบ uniform โดยตรง
+
+        เรียง node ตาม layer แล้วนับจำนวน dst ที่ใช้ได้ของแต่ละ src —
+        สุ่มเลขคู่ k ตัวเดียวแล้ว searchsorted หา src ไม่ต้องสุ่มทิ้งตาม layer
+        """
+        nodes  = list(self._nodes)
+        layers = np.array([n["layer"] for n in self._nodes.values()])
+        order  = np.argsort(layers, kind="stable")
+        first  = np.searchsorted(layers[order], layers[order], side="right")
+        cum    = np.cumsum(len(nodes) - first)
+        if not cum.size or cum[-1] == 0:
+            return
         for _ in range(10):
-            src, dst = np.random.choice(nodes, 2, replace=False)
-            if self.nodes[src]["layer"] >= self.nodes[dst]["layer"]:
-                continue
+            k   = int(self._rng.integers(cum[-1]))
+            i   = int(np.searchsorted(cum, k, side="right"))
+            j   = first[i] + k - (cum[i - 1] if i else 0)
+            src, dst = nodes[order[i]], nodes[order[j]]
             cid = f"{src}->{dst}"
             if cid in self.connections:
                 continue
             self.connections[cid] = ConnectionSchema(source=src, destination=dst, enabled=True)
-            self.weights[cid] = float(np.random.randn() * 0.01)
+            self.weights[cid] = float(self._rng.standard_normal() * 0.01)
             return
 
     def _prune_node(self) -> None:
         candidates = [nid for nid, n in self.nodes.items() if n["role"] == "hidden"]
         if not candidates:
             return
-        nid = np.random.choice(candidates)
+        nid = candidates[self._rng.integers(len(candidates))]
         for cid in [k for k, c in self.connections.items()
                     if c["source"] == nid or c["destination"] == nid]:
             self.connections.pop(cid)
@@ -589,18 +1294,18 @@ class BrainStructure:
         self.biases.pop(nid, None)
 
     def _prune_connection(self) -> None:
-        enabled = [k for k, c in self.connections.items() if c["enabled"]]
+        enabled = self._enabled_ids()
         if enabled:
-            self.connections[np.random.choice(enabled)]["enabled"] = False
+            self.connections[enabled[self._rng.integers(len(enabled))]]["enabled"] = False
 
     def _add_layer(self) -> None:
         max_layer = max(n["layer"] for n in self.nodes.values())
-        insert_at = int(np.random.randint(1, max_layer))
+        insert_at = int(self._rng.integers(1, max_layer))
         for n in self.nodes.values():
             if n["layer"] >= insert_at:
                 n["layer"] += 1
-        for _ in range(int(np.random.randint(2, 6))):
-            nid = f"L{insert_at}_N{len(self.nodes)}"
+        for _ in range(int(self._rng.integers(2, 6))):
+            nid = self._new_node_id(insert_at)
             self.nodes[nid] = NodeSchema(
                 layer=insert_at, role="hidden", head=None,
                 activation=self._rand_activation(),
@@ -618,19 +1323,55 @@ class BrainStructure:
         ]
         if not hidden_layers:
             return
-        target = int(np.random.choice(hidden_layers))
-        for nid in list(layers[target]):
-            self._prune_node()
+        target = hidden_layers[self._rng.integers(len(hidden_layers))]
+        # ลบทั้ง layer ในรอบเดียว: node + bias ของ layer นั้น
+        # แล้วกวาด connection ที่แตะ node เหล่านั้นครั้งเดียว
+        ids = set(layers[target])
+        for cid in [k for k, c in self.connections.items()
+                    if c["source"] in ids or c["destination"] in ids]:
+            self.connections.pop(cid)
+            self.weights.pop(cid, None)
+        for nid in ids:
+            self.nodes.pop(nid)
+            self.biases.pop(nid, None)
 
     def _mutate_weight(self) -> None:
-        if self.weights:
-            cid = np.random.choice(list(self.weights.keys()))
-            self.weights[cid] += float(np.random.randn() * 0.01)
+        """สุ่มด้วย index — ถ้ามี dense view แก้ใน _W ตรงๆ ไม่ต้องปล่อย view"""
+        if not self._weights:
+            return
+        cid   = self._nth_key(self._weights, self._rng.integers(len(self._weights)))
+        delta = float(self._rng.standard_normal() * 0.01)
+        pos   = self._edge_pos.get(cid) if self._dense_valid else None
+        if pos is None:
+            self._weights[cid] += delta
+            return
+        self._W[pos[0]][pos[1], pos[2]] += delta
+        self._params_dirty = True
 
     def _mutate_bias(self) -> None:
-        if self.biases:
-            nid = np.random.choice(list(self.biases.keys()))
-            self.biases[nid] += float(np.random.randn() * 0.01)
+        if not self._biases:
+            return
+        nid   = self._nth_key(self._biases, self._rng.integers(len(self._biases)))
+        delta = float(self._rng.standard_normal() * 0.01)
+        pos   = self._bias_pos.get(nid) if self._dense_valid else None
+        if pos is None:
+            self._biases[nid] += delta
+            return
+        l, row = pos
+        (self._free_bias if l < 0 else self._b[l])[row] += delta
+        self._params_dirty = True
+
+    # intent → evolution op (เรียกเป็น fn(self)) — ใช้ใน _apply_intent
+    _INTENT_TABLE: Dict[str, Callable[["BrainStructure"], None]] = {
+        "ADD_NODE":         _add_node,
+        "ADD_CONNECTION":   _add_connection,
+        "PRUNE_NODE":       _prune_node,
+        "PRUNE_CONNECTION": _prune_connection,
+        "ADD_LAYER":        _add_layer,
+        "PRUNE_LAYER":      _prune_layer,
+        "MUTATE_WEIGHT":    _mutate_weight,
+        "MUTATE_BIAS":      _mutate_bias,
+    }
 
     # ────────────────────────────────────────────────────────────
     # Default intent logic (ถ้าไม่มี rule_engine)
@@ -651,12 +1392,16 @@ class BrainStructure:
     # ────────────────────────────────────────────────────────────
 
     def get_structure_data(self) -> dict:
-        total_nodes  = len(self.nodes)
-        total_active = sum(1 for c in self.connections.values() if c["enabled"])
-        total_usage  = sum(n["usage"] for n in self.nodes.values())
+        self._sync_nodes()
+        total_nodes  = len(self._nodes)
+        total_active = self._num_enabled()
+        total_usage  = (
+            float(self._usage.sum()) if self._dense_valid
+            else sum(n["usage"] for n in self._nodes.values())
+        )
         role_count   = {"input": 0, "hidden": 0, "output": 0}
         layers: set  = set()
-        for n in self.nodes.values():
+        for n in self._nodes.values():
             role_count[n["role"]] += 1
             layers.add(n["layer"])
 
@@ -668,9 +1413,9 @@ class BrainStructure:
             "roles":       role_count,
             "connections": total_active,
             "parameters":  {
-                "total":   total_active + len(self.biases),
+                "total":   total_active + len(self._biases),
                 "weights": total_active,
-                "biases":  len(self.biases),
+                "biases":  len(self._biases),
             },
             "usage_avg":      total_usage / total_nodes if total_nodes else 0.0,
             "snapshots":      len(self._snapshots),
@@ -678,11 +1423,15 @@ class BrainStructure:
         }
 
     def get_usage(self) -> Dict[str, float]:
-        return {nid: n["usage"] for nid, n in self.nodes.items()}
+        self._sync_nodes()
+        return {nid: n["usage"] for nid, n in self._nodes.items()}
 
     def clear_usage(self) -> None:
-        for n in self.nodes.values():
+        self._sync_nodes()
+        for n in self._nodes.values():
             n["usage"] = 0.0
+        if self._dense_valid:
+            self._usage.fill(0.0)
 
 
     # ────────────────────────────────────────────────────────────
@@ -735,16 +1484,18 @@ class BrainStructure:
             self._conf_threshold = 0.6
 
         # ── Forward ───────────────────────────────────────────────
-        inputs = [nid for nid, n in self.nodes.items() if n["role"] == "input"]
-        for nid in self.nodes:
-            if self.nodes[nid]["role"] != "input":
-                self.nodes[nid]["value"] = None
-
-        for j, nid in enumerate(inputs):
-            if j < len(input_vector):
-                self.nodes[nid]["value"] = float(input_vector[j])
-            else:
-                self.nodes[nid]["value"] = 0.0
+        # reset node ที่ไม่ใช่ input ด้วย mask เดียว (_computed) บน dense view
+        self._ensure_dense()
+        self._values[:-1][self._computed] = 0.0
+        self._has_value[self._computed]   = False
+
+        # input ที่ขาด → 0.0 / input ที่เกิน → ตัดทิ้ง
+        x = np.asarray(input_vector, dtype=np.float64).ravel()
+        n = min(x.size, self._input_idx.size)
+        self._values[self._input_idx[:n]] = x[:n]
+        self._values[self._input_idx[n:]] = 0.0
+        self._has_value[self._input_idx] = True
+        self._nodes_dirty = True
 
         self.forward()
         outputs, _ = self.collect_outputs()
@@ -780,13 +1531,14 @@ class BrainStructure:
             result["evolved"] = evolved
             self._last_loss   = implicit_loss
 
-        logger.info(
-            f"[BrainStructure] REALTIME_LEARN context='{context_label}' "
-            f"rep={rep} conf={confidence:.3f} "
-            f"loss={implicit_loss:.6f} "
-            f"interactions={self._interaction_count}"
-            + (f" EVOLVED" if evolved else "")
-        )
+        # เรียกทุก interaction — ไม่สร้างข้อความเลยถ้า INFO ถูกปิด
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[BrainStructure] REALTIME_LEARN context='%s' rep=%d conf=%.3f "
+                "loss=%.6f interactions=%d%s",
+                context_label, rep, confidence, implicit_loss,
+                self._interaction_count, " EVOLVED" if evolved else "",
+            )
 
         return result
 
@@ -821,17 +1573,10 @@ class BrainStructure:
         — output ที่กระจาย = ไม่ coherent = loss สูง
         — output ที่รวมกัน = coherent = loss ต่ำ
         """
-        all_vals = []
-        for arr in outputs.values():
-            all_vals.extend(arr.flatten().tolist())
-
-        if not all_vals:
+        arrs = [np.ravel(a) for a in outputs.values() if np.size(a)]
+        if not arrs:
             return 0.0
-
-        arr    = np.array(all_vals)
-        mean   = float(np.mean(arr))
-        variance = float(np.var(arr))
-        return round(variance, 6)
+        return round(float(np.concatenate(arrs).var()), 6)
 
     def set_evolve_every(self, n: int) -> None:
         """ตั้ง interval ของ auto-evolve (จำนวน interactions)"""
@@ -846,10 +1591,8 @@ class BrainStructure:
             "evolution_count":   getattr(self, "_evolution_count", 0),
             "evolve_every":      self._evolve_every,
             "last_loss":         self._last_loss,
-            "current_nodes":     len(self.nodes),
-            "current_connections": sum(
-                1 for c in self.connections.values() if c["enabled"]
-            ),
+            "current_nodes":     len(self._nodes),
+            "current_connections": self._num_enabled(),
             "log": list(getattr(self, "_evolution_log", [])[-10:]),
         }
 
@@ -872,11 +1615,11 @@ class BrainStructure:
                 "intent":       intent,
                 "loss":         current_loss,
                 "interactions": self._interaction_count,
-                "nodes":        len(self.nodes),
+                "nodes":        len(self._nodes),
             })
             logger.warning(
                 f"[BrainStructure] AUTO_EVOLVE intent={intent} "
-                f"nodes={len(self.nodes)} loss={current_loss:.6f}"
+                f"nodes={len(self._nodes)} loss={current_loss:.6f}"
             )
             return True
         except Exception as e:
@@ -887,8 +1630,8 @@ class BrainStructure:
     def _default_intent_from_loss(self, loss: float) -> str:
         """ตัดสินใจ evolution intent จาก loss + structure"""
         loss_trend = loss - self._last_loss
-        n_nodes    = len(self.nodes)
-        n_active   = sum(1 for c in self.connections.values() if c["enabled"])
+        n_nodes    = len(self._nodes)
+        n_active   = self._num_enabled()
 
         if n_nodes > 100:
             return "PRUNE_NODE"
@@ -918,29 +1661,35 @@ class BrainStructure:
         # minimum perturbation เพื่อให้ weights เปลี่ยนแม้ loss = 0
         # (Realtime — เรียนรู้ตลอดเวลา แม้ output จะสม่ำเสมอ)
         min_delta = effective_lr * 1e-4
-        updated = 0
 
-        for cid, conn in self.connections.items():
-            if not conn["enabled"]:
-                continue
-
-            dst_node = self.nodes.get(conn["destination"])
-            g = dst_node["gradient"] if dst_node else None
-
-            current_w = self.weights.get(cid, 0.0)
-            if g is not None and abs(g) > 1e-10:
-                delta = -effective_lr * g * max(implicit_loss, min_delta)
-            else:
-                # implicit perturbation — ปรับเล็กน้อยเสมอ
-                delta = float(np.random.randn()) * min_delta
-
-            self.weights[cid] = float(np.clip(current_w + delta, -10.0, 10.0))
-            updated += 1
-
-            if updated >= 10:  # จำกัด connections ต่อ step
-                break
-
-        return updated
+        # แก้ weight ใน dense view ตรงๆ — ไม่ต้อง compile ใหม่ทุก interaction
+        # ชุด connection (สูงสุด REALTIME_MAX_UPDATES) ถูกเตรียมไว้ตอน compile
+        self._ensure_dense()
+        cids, dst, pos = self._rt_cids, self._rt_dst, self._rt_pos
+        if not cids:
+            return 0
+
+        g     = np.where(self._has_grad[dst], self._grads[dst], 0.0)
+        delta = -effective_lr * g * max(implicit_loss, min_delta)
+        # implicit perturbation — ปรับเล็กน้อยเสมอ (สุ่มเฉพาะตัวที่ไม่มี gradient)
+        noise = np.abs(g) <= 1e-10
+        if noise.any():
+            delta[noise] = self._noise(int(noise.sum())) * min_delta
+
+        dense   = pos >= 0
+        current = np.empty(len(cids))
+        current[dense] = self._W_flat[pos[dense]]
+        loose   = np.flatnonzero(~dense).tolist()
+        for k in loose:
+            current[k] = self._weights.get(cids[k], 0.0)
+
+        new_w = np.clip(current + delta, -10.0, 10.0)
+        if dense.any():
+            self._W_flat[pos[dense]] = new_w[dense]
+            self._params_dirty = True
+        for k in loose:
+            self._weights[cids[k]] = float(new_w[k])
+        return len(cids)
 
     def _propose_weight_updates(
         self,
@@ -954,28 +1703,36 @@ class BrainStructure:
         ใช้ gradient ที่มีอยู่ใน nodes (จาก backward ที่เคยรัน)
         ถ้าไม่มี gradient → random small perturbation
         """
-        proposals = []
-        checked   = 0
-
-        for cid, conn in self.connections.items():
-            if not conn["enabled"]:
-                continue
-
-            dst_node = self.nodes.get(conn["destination"])
+        # ส่วนที่ไม่ขึ้นกับ connection — สร้างครั้งเดียวต่อการเรียก
+        proposed_by = f"brain_{context_label}"
+        reason      = f"continuous learning: {context_label} loss={implicit_loss:.6f}"
+        proposals: List[ProposalData] = []
+
+        self._sync_nodes()
+        self._sync_params()
+        # bind เป็น local ก่อน loop — ไม่ต้อง LOAD_ATTR ซ้ำทุกรอบ
+        nodes, conns, weights, noise = self._nodes, self._connections, self._weights, self._noise
+        append = proposals.append
+        # จำกัดไม่ให้ propose ทุก connection ในครั้งเดียว
+        for cid in self._enabled_ids()[:5]:
+            dst_node = nodes.get(conns[cid]["destination"])
             g = dst_node["gradient"] if dst_node else None
 
             # คำนวณ new weight
-            current_w = self.weights.get(cid, 0.0)
+            current_w = weights.get(cid, 0.0)
             if g is not None:
                 delta = -lr * g * implicit_loss
             else:
-                delta = -lr * implicit_loss * float(np.random.randn() * 0.1)
+                delta = -lr * implicit_loss * float(noise(1)[0] * 0.1)
 
-            new_w = float(np.clip(current_w + delta, -10.0, 10.0))
+            # clamp บน Python float — ไม่ต้องผ่าน np.clip / 0-D array
+            new_w = current_w + delta
+            new_w = -10.0 if new_w < -10.0 else 10.0 if new_w > 10.0 else float(new_w)
 
-            # สร้าง proposal แทนการ apply ตรง
-            proposal = create_proposal(
-                proposed_by = f"brain_{context_label}",
+            # สร้าง proposal แทนการ apply ตรง — payload ต้องเป็น dict ใหม่ทุกตัว
+            # เพราะ proposal ค้างอยู่ใน pending จนกว่า reviewer จะอ่าน
+            append(create_proposal(
+                proposed_by = proposed_by,
                 action      = ProposalAction.MODIFY,
                 target_type = ProposalTarget.RULE,
                 authority   = RuleAuthority.STANDARD,
@@ -986,15 +1743,10 @@ class BrainStructure:
                     "new_value": new_w,
                     "context":   context_label,
                 },
-                reason = f"continuous learning: {context_label} loss={implicit_loss:.6f}",
-            )
-            self._pending_proposals.append(proposal)
-            proposals.append(proposal)
-
-            checked += 1
-            if checked >= 5:  # จำกัดไม่ให้ propose ทุก connection ในครั้งเดียว
-                break
+                reason = reason,
+            ))
 
+        self._pending_proposals.extend(proposals)
         return proposals
 
     def _apply_weight_from_proposal(self, proposal: "ProposalData") -> None:
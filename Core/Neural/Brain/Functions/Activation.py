@@ -12,6 +12,7 @@ import numpy as np
 from numpy.typing import NDArray
 from typing import Callable
 
+from Core.Neural.Brain.Functions._dtype import DTYPE
 
 # ============================================================================
 # TYPE
@@ -102,10 +103,146 @@ def exp_grad(x: float) -> float:
 
 
 def softmax(arr: NDArray[np.float64]) -> NDArray[np.float64]:
-    """Numerically stable softmax"""
-    shifted = arr - np.max(arr)
-    exps    = np.exp(shifted)
-    return exps / np.sum(exps)
+    """
+    Numerically stable softmax
+
+    ใช้ buffer เดียว: (arr - max) → exp in-place → หาร sum in-place
+    มี numba + input 1 มิติ → kernel เดียววน max / exp-sum / หาร
+    """
+    arr = np.asarray(arr).astype(DTYPE, copy=False)
+    if _softmax_jit is not None and arr.ndim == 1 and arr.size:
+        return _softmax_jit(arr)
+    out = arr - np.max(arr)
+    np.exp(out, out=out)
+    out /= out.sum()
+    return out
+
+
+# ============================================================================
+# VECTOR IMPLEMENTATIONS — ทำงานกับ ndarray ทั้ง layer ในครั้งเดียว
+# out= (อาจเป็น x เอง) → เขียนผลลง buffer เดิมแทนการสร้าง array ใหม่
+# ============================================================================
+
+VecOut = NDArray[np.float64] | None
+
+
+def _into(result: NDArray[np.float64], out: VecOut) -> NDArray[np.float64]:
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+def relu_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return np.maximum(x, 0.0, out=out)
+
+def leaky_relu_vec(x: NDArray[np.float64], out: VecOut = None, alpha: float = 0.01) -> NDArray[np.float64]:
+    return np.multiply(x, np.where(x > 0, 1.0, alpha), out=out)
+
+def gelu_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    t = np.tanh(math.sqrt(2.0 / math.pi) * (x + 0.044715 * x ** 3))
+    t += 1.0
+    return np.multiply(0.5 * x, t, out=out)
+
+def sigmoid_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    # exp(-|x|) ไม่ overflow — แยกสูตรตามเครื่องหมายเหมือน scalar
+    e = np.exp(-np.abs(x))
+    return np.divide(np.where(x >= 0, 1.0, e), 1.0 + e, out=out)
+
+def tanh_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return np.tanh(x, out=out)
+
+def swish_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return np.multiply(x, sigmoid_vec(x), out=out)
+
+def elu_vec(x: NDArray[np.float64], out: VecOut = None, alpha: float = 1.0) -> NDArray[np.float64]:
+    return _into(np.where(x > 0, x, alpha * (np.exp(np.minimum(x, 0.0)) - 1.0)), out)
+
+def linear_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return x if out is None or out is x else _into(x, out)
+
+def exp_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return np.exp(np.minimum(x, 80.0, out=out), out=out)
+
+
+# gradient แบบ vector — sigmoid / swish คำนวณ sigmoid ครั้งเดียวแล้วใช้ซ้ำ
+
+def relu_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return _into((x > 0).astype(np.float64), out)
+
+def leaky_relu_grad_vec(x: NDArray[np.float64], out: VecOut = None, alpha: float = 0.01) -> NDArray[np.float64]:
+    return _into(np.where(x > 0, 1.0, alpha), out)
+
+def gelu_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    cdf = np.tanh(math.sqrt(2.0 / math.pi) * (x + 0.044715 * x ** 3))
+    cdf += 1.0
+    cdf *= 0.5
+    pdf = np.exp(-0.5 * x ** 2) / math.sqrt(2.0 * math.pi)
+    return np.add(cdf, x * pdf, out=out)
+
+def sigmoid_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    s = sigmoid_vec(x)
+    return np.multiply(s, 1.0 - s, out=out)
+
+def tanh_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    t = np.tanh(x)
+    return np.subtract(1.0, t * t, out=out)
+
+def swish_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    s = sigmoid_vec(x)
+    return np.add(s, x * s * (1.0 - s), out=out)
+
+def elu_grad_vec(x: NDArray[np.float64], out: VecOut = None, alpha: float = 1.0) -> NDArray[np.float64]:
+    return _into(np.where(x > 0, 1.0, alpha * np.exp(np.minimum(x, 0.0))), out)
+
+def linear_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return _into(np.ones_like(x, dtype=np.float64), out)
+
+def exp_grad_vec(x: NDArray[np.float64], out: VecOut = None) -> NDArray[np.float64]:
+    return exp_vec(x, out=out)
+
+
+# ============================================================================
+# NUMBA UFUNCS (optional)
+# activation ที่ NumPy ต้องสร้าง temporary หลายก้อน (tanh / exp / where)
+# compile จาก scalar body เป็น ufunc → loop เดียวต่อ element และรองรับ out= เหมือนเดิม
+# ============================================================================
+
+try:
+    from numba import njit, vectorize
+except ImportError:          # optional — ไม่มี numba ใช้ vector implementation ด้านบน
+    njit = vectorize = None
+
+
+def _swish_kernel(x: float) -> float:
+    """swish แบบไม่เรียก sigmoid — numba เรียก Python function ข้างนอกไม่ได้"""
+    if x >= 0:
+        return x * (1.0 / (1.0 + math.exp(-x)))
+    ex = math.exp(x)
+    return x * (ex / (1.0 + ex))
+
+
+def _softmax_kernel(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """softmax 1 มิติแบบ loop ธรรมดา — ให้ numba รวมเป็น kernel เดียว"""
+    m   = x.max()
+    out = np.empty_like(x)
+    s   = 0.0
+    for i in range(x.size):
+        e      = math.exp(x[i] - m)
+        out[i] = e
+        s     += e
+    for i in range(x.size):
+        out[i] /= s
+    return out
+
+
+_softmax_jit = njit(cache=True)(_softmax_kernel) if njit is not None else None
+
+if vectorize is not None:
+    # ระบุ signature → compile ทันทีตอน import ไม่มี JIT latency ใน forward แรก
+    _ufunc = vectorize(["float64(float64)"], cache=True)
+    gelu_vec    = _ufunc(gelu)
+    sigmoid_vec = _ufunc(sigmoid)
+    swish_vec   = _ufunc(_swish_kernel)
 
 
 # ============================================================================
@@ -124,27 +261,70 @@ class ActivationFunctions:
         "ELU":       (elu,       elu_grad),
         "Linear":    (linear,    linear_grad),
         "exp":       (exp_fn,    exp_grad),
-        "softmax":   (None,      None),   # vector-only
+        "softmax":   (softmax,   None),   # รับทั้ง vector — gradient อยู่ใน loss
+    }
+
+    _VECTOR: dict[str, ActivationFn] = {
+        "ReLU":      relu_vec,
+        "LeakyReLU": leaky_relu_vec,
+        "GELU":      gelu_vec,
+        "Sigmoid":   sigmoid_vec,
+        "Tanh":      tanh_vec,
+        "Swish":     swish_vec,
+        "ELU":       elu_vec,
+        "Linear":    linear_vec,
+        "exp":       exp_vec,
+    }
+
+    _VECTOR_GRAD: dict[str, ActivationFn] = {
+        "ReLU":      relu_grad_vec,
+        "LeakyReLU": leaky_relu_grad_vec,
+        "GELU":      gelu_grad_vec,
+        "Sigmoid":   sigmoid_grad_vec,
+        "Tanh":      tanh_grad_vec,
+        "Swish":     swish_grad_vec,
+        "ELU":       elu_grad_vec,
+        "Linear":    linear_grad_vec,
+        "exp":       exp_grad_vec,
     }
 
     @classmethod
-    def get_activation_function(cls, name: str) -> ActivationFn:
-        """คืน forward function"""
-        if name == "softmax":
-            return softmax  # type: ignore
+    def get_activation_function(cls, name: str, vectorized: bool = False) -> ActivationFn:
+        """คืน forward function — vectorized=True → แบบ ndarray ทั้ง layer"""
         entry = cls._SCALAR.get(name)
         if entry is None:
             raise ValueError(
                 f"[ActivationFunctions] unknown activation '{name}'. "
                 f"Available: {list(cls._SCALAR.keys())}"
             )
+        if vectorized and name in cls._VECTOR:
+            return cls._VECTOR[name]
         return entry[0]
 
     @classmethod
-    def get_gradient_function(cls, name: str) -> ActivationFn:
-        """คืน gradient function"""
+    def get_vector_function(cls, name: str) -> ActivationFn:
+        """คืน forward function แบบ element-wise บน ndarray (ไม่รวม softmax)"""
+        fn = cls._VECTOR.get(name)
+        if fn is None:
+            raise ValueError(
+                f"[ActivationFunctions] no vector form for '{name}'. "
+                f"Available: {list(cls._VECTOR.keys())}"
+            )
+        return fn
+
+    @classmethod
+    def get_gradient_function(cls, name: str, vectorized: bool = False) -> ActivationFn:
+        """คืน gradient function — vectorized=True → แบบ ndarray ทั้ง layer"""
         if name == "softmax":
             raise NotImplementedError("softmax gradient ใช้ Jacobian — handle ใน loss")
+        if vectorized:
+            fn = cls._VECTOR_GRAD.get(name)
+            if fn is None:
+                raise ValueError(
+                    f"[ActivationFunctions] no vector gradient for '{name}'. "
+                    f"Available: {list(cls._VECTOR_GRAD.keys())}"
+                )
+            return fn
         entry = cls._SCALAR.get(name)
         if entry is None:
             raise ValueError(
@@ -12,10 +12,12 @@ import numpy as np
 from numpy.typing import NDArray
 from typing import Any, Callable, Dict, Union
 
+from Core.Neural.Brain.Functions._dtype import DTYPE, EPS
+
 
 LossGradOutput = Union[
-    NDArray[np.float64],
-    Dict[str, NDArray[np.float64]],
+    NDArray[np.floating],
+    Dict[str, NDArray[np.floating]],
 ]
 
 
@@ -23,19 +25,19 @@ LossGradOutput = Union[
 # SCALAR HELPERS
 # ============================================================================
 
-_EPS = 1e-8
+_EPS = EPS
 
 
 # ── MSE ──────────────────────────────────────────────────────────────────────
 
 def mse_loss(y_true: Any, outputs: Dict[str, NDArray]) -> float:
     y_pred = outputs.get("default", list(outputs.values())[0])
-    diff   = np.asarray(y_true, dtype=np.float64) - y_pred
+    diff   = np.asarray(y_true, dtype=DTYPE) - y_pred
     return float(np.mean(diff ** 2))
 
 def mse_grad(y_true: Any, outputs: Dict[str, NDArray]) -> NDArray:
     y_pred = outputs.get("default", list(outputs.values())[0])
-    diff   = np.asarray(y_true, dtype=np.float64) - y_pred
+    diff   = np.asarray(y_true, dtype=DTYPE) - y_pred
     return -2.0 * diff / max(len(diff), 1)
 
 
@@ -43,12 +45,12 @@ def mse_grad(y_true: Any, outputs: Dict[str, NDArray]) -> NDArray:
 
 def mae_loss(y_true: Any, outputs: Dict[str, NDArray]) -> float:
     y_pred = outputs.get("default", list(outputs.values())[0])
-    diff   = np.asarray(y_true, dtype=np.float64) - y_pred
+    diff   = np.asarray(y_true, dtype=DTYPE) - y_pred
     return float(np.mean(np.abs(diff)))
 
 def mae_grad(y_true: Any, outputs: Dict[str, NDArray]) -> NDArray:
     y_pred = outputs.get("default", list(outputs.values())[0])
-    diff   = np.asarray(y_true, dtype=np.float64) - y_pred
+    diff   = np.asarray(y_true, dtype=DTYPE) - y_pred
     return -np.sign(diff) / max(len(diff), 1)
 
 
@@ -59,7 +61,7 @@ def bce_loss(y_true: Any, outputs: Dict[str, NDArray]) -> float:
         outputs.get("default", list(outputs.values())[0]),
         _EPS, 1.0 - _EPS
     )
-    yt = np.asarray(y_true, dtype=np.float64)
+    yt = np.asarray(y_true, dtype=DTYPE)
     return float(-np.mean(yt * np.log(y_pred) + (1 - yt) * np.log(1 - y_pred)))
 
 def bce_grad(y_true: Any, outputs: Dict[str, NDArray]) -> NDArray:
@@ -67,7 +69,7 @@ def bce_grad(y_true: Any, outputs: Dict[str, NDArray]) -> NDArray:
         outputs.get("default", list(outputs.values())[0]),
         _EPS, 1.0 - _EPS
     )
-    yt = np.asarray(y_true, dtype=np.float64)
+    yt = np.asarray(y_true, dtype=DTYPE)
     return (-yt / y_pred + (1 - yt) / (1 - y_pred)) / max(len(y_pred), 1)
 
 
@@ -78,18 +80,48 @@ def cce_loss(y_true: Any, outputs: Dict[str, NDArray]) -> float:
         outputs.get("default", list(outputs.values())[0]),
         _EPS, 1.0
     )
-    yt = np.asarray(y_true, dtype=np.float64)
+    yt = np.asarray(y_true, dtype=DTYPE)
     return float(-np.sum(yt * np.log(y_pred)))
 
 def cce_grad(y_true: Any, outputs: Dict[str, NDArray]) -> NDArray:
     """softmax + CCE combined gradient = y_pred - y_true"""
     y_pred = outputs.get("default", list(outputs.values())[0])
-    yt     = np.asarray(y_true, dtype=np.float64)
+    yt     = np.asarray(y_true, dtype=DTYPE)
     return y_pred - yt
 
 
 # ── MDN NLL ───────────────────────────────────────────────────────────────────
 
+def _mdn_components(
+    mu:     NDArray,
+    sigma:  NDArray,
+    y_true: Any,
+    K:      int,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """
+    ทุก component พร้อมกันบน shape (K, D)
+
+    Returns:
+        (diff, sig_k, log_n) — log_n คือ log density ของแต่ละ component (ยังไม่รวม π)
+    """
+    y     = np.asarray(y_true, dtype=DTYPE).flatten()
+    D     = len(mu) // K
+    mu_k  = np.asarray(mu, dtype=DTYPE).reshape(K, D)
+    sig_k = sigma.reshape(K, D)
+    diff  = y[:D] - mu_k
+    log_n = (
+        -0.5 * np.sum((diff / sig_k) ** 2, axis=1)
+        - np.sum(np.log(sig_k), axis=1)
+        - 0.5 * D * math.log(2 * math.pi)
+    )
+    return diff, sig_k, log_n
+
+
+def _logsumexp(a: NDArray) -> float:
+    top = float(a.max())
+    return top + math.log(float(np.exp(a - top).sum()))
+
+
 def mdn_nll_loss(y_true: Any, outputs: Dict[str, NDArray]) -> float:
     """
     Mixture Density Network Negative Log Likelihood
@@ -100,25 +132,10 @@ def mdn_nll_loss(y_true: Any, outputs: Dict[str, NDArray]) -> float:
     pi    = outputs["mdn_pi"]      # mixture weights (softmax applied)
     mu    = outputs["mdn_mu"]      # means
     sigma = np.maximum(outputs["mdn_sigma"], _EPS)  # std devs (exp applied)
-    y     = np.asarray(y_true, dtype=np.float64).flatten()
-
-    K = len(pi)
-    D = len(mu) // K
-
-    log_probs = []
-    for k in range(K):
-        mu_k    = mu[k*D:(k+1)*D]
-        sig_k   = sigma[k*D:(k+1)*D]
-        diff    = y[:D] - mu_k
-        exponent = -0.5 * np.sum((diff / sig_k) ** 2)
-        log_norm = -np.sum(np.log(sig_k)) - 0.5 * D * math.log(2 * math.pi)
-        log_probs.append(math.log(max(pi[k], _EPS)) + log_norm + exponent)
 
-    log_sum = log_probs[0]
-    for lp in log_probs[1:]:
-        log_sum = math.log(math.exp(log_sum - lp) + 1.0) + lp
-
-    return float(-log_sum)
+    _, _, log_n = _mdn_components(mu, sigma, y_true, len(pi))
+    log_probs   = np.log(np.maximum(pi, _EPS)) + log_n
+    return float(-_logsumexp(log_probs))
 
 
 def mdn_nll_grad(
@@ -129,39 +146,48 @@ def mdn_nll_grad(
     pi    = outputs["mdn_pi"]
     mu    = outputs["mdn_mu"]
     sigma = np.maximum(outputs["mdn_sigma"], _EPS)
-    y     = np.asarray(y_true, dtype=np.float64).flatten()
-
-    K = len(pi)
-    D = len(mu) // K
-
-    responsibilities = np.zeros(K)
-    for k in range(K):
-        mu_k  = mu[k*D:(k+1)*D]
-        sig_k = sigma[k*D:(k+1)*D]
-        diff  = y[:D] - mu_k
-        log_n = (-0.5 * np.sum((diff / sig_k) ** 2)
-                 - np.sum(np.log(sig_k))
-                 - 0.5 * D * math.log(2 * math.pi))
-        responsibilities[k] = pi[k] * math.exp(log_n)
-
-    r_sum = responsibilities.sum() + _EPS
-    responsibilities /= r_sum
-
-    d_pi    = pi - responsibilities
-    d_mu    = np.zeros_like(mu)
-    d_sigma = np.zeros_like(sigma)
-
-    for k in range(K):
-        mu_k  = mu[k*D:(k+1)*D]
-        sig_k = sigma[k*D:(k+1)*D]
-        diff  = y[:D] - mu_k
-        rk    = responsibilities[k]
-        d_mu   [k*D:(k+1)*D] = rk * (-diff / (sig_k ** 2))
-        d_sigma[k*D:(k+1)*D] = rk * (-1.0 / sig_k + diff ** 2 / (sig_k ** 3))
 
+    diff, sig_k, log_n = _mdn_components(mu, sigma, y_true, len(pi))
+    log_probs = np.log(np.maximum(pi, _EPS)) + log_n
+    resp      = np.exp(log_probs - _logsumexp(log_probs))
+
+    d_pi    = pi - resp
+    d_mu    = (resp[:, None] * (-diff / sig_k ** 2)).ravel()
+    d_sigma = (resp[:, None] * (-1.0 / sig_k + diff ** 2 / sig_k ** 3)).ravel()
     return {"mdn_pi": d_pi, "mdn_mu": d_mu, "mdn_sigma": d_sigma}
 
 
+def mdn_nll_from_logits(
+    logits_pi: NDArray,
+    mu:        NDArray,
+    sigma:     NDArray,
+    y_true:    Any,
+) -> tuple[float, NDArray, NDArray, NDArray]:
+    """
+    MDN NLL + gradient ในรอบเดียว จาก logit ของ π (ยังไม่ softmax)
+
+    log π = logits − logsumexp(logits) → ไม่ต้อง clamp π ที่ _EPS
+    gradient ของ logit = π − responsibility โดยตรง (ไม่ผ่าน Jacobian ของ softmax)
+    d_mu / d_sigma เหมือน mdn_nll_grad
+
+    Returns:
+        (loss, d_logits_pi, d_mu, d_sigma)
+    """
+    logits = np.asarray(logits_pi, dtype=DTYPE)
+    sigma  = np.maximum(sigma, _EPS)
+
+    diff, sig_k, log_n = _mdn_components(mu, sigma, y_true, logits.size)
+    log_pi    = logits - _logsumexp(logits)
+    log_probs = log_pi + log_n
+    log_sum   = _logsumexp(log_probs)
+    resp      = np.exp(log_probs - log_sum)
+
+    d_logits = np.exp(log_pi) - resp
+    d_mu     = (resp[:, None] * (-diff / sig_k ** 2)).ravel()
+    d_sigma  = (resp[:, None] * (-1.0 / sig_k + diff ** 2 / sig_k ** 3)).ravel()
+    return float(-log_sum), d_logits, d_mu, d_sigma
+
+
 # ============================================================================
 # REGISTRY
 # ============================================================================
@@ -197,4 +223,7 @@ class LossFunctions:
 
     @classmethod
     def available(cls) -> list[str]:
-        return list(cls._REGISTRY.keys())
\ No newline at end of file
+        return list(cls._REGISTRY.keys())
+
+    # MDN_NLL บน logit ดิบ — ใช้แทน softmax + mdn_nll_loss + mdn_nll_grad
+    fused_mdn_nll_from_logits = staticmethod(mdn_nll_from_logits)
\ No newline at end of file
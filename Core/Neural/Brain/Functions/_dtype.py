@@ -0,0 +1,16 @@
+"""
+dtype กลางของ activation / loss path
+
+ค่าเริ่มต้น float64 (เหมือนเดิม) — ตั้ง MINDWAVE_FP32=1 เพื่อใช้ float32
+ลด memory bandwidth / cache footprint ครึ่งหนึ่งสำหรับ brain ขนาดใหญ่
+"""
+
+from __future__ import annotations
+import os
+import numpy as np
+
+
+DTYPE: type[np.floating] = np.float32 if os.environ.get("MINDWAVE_FP32") == "1" else np.float64
+
+# epsilon ที่ยังแยกจาก 1.0 ได้ใน DTYPE — 1 - 1e-8 ใน float32 ปัดเป็น 1.0
+EPS: float = max(1e-8, float(np.finfo(DTYPE).eps))
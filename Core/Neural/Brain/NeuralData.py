@@ -19,11 +19,13 @@ NeuralEvolution.json Rule (SYSTEM):
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import math
 import time
 import uuid
 
+import numpy as np
+
 
 # ============================================================================
 # ENUMS
@@ -49,6 +51,13 @@ class GradientStatus(Enum):
                         GradientStatus.EXPLODE)
 
 
+# code ของ GradientSnapshot.evaluate_batch → status
+STATUS_CODES: Tuple[GradientStatus, ...] = (
+    GradientStatus.NAN, GradientStatus.INF, GradientStatus.EXPLODE,
+    GradientStatus.VANISH, GradientStatus.OK,
+)
+
+
 class ConflictType(Enum):
     """ประเภทของ knowledge conflict ที่ Neural ตรวจพบ"""
     NONE            = "none"
@@ -74,7 +83,7 @@ class WeightUpdateSource(Enum):
 # WEIGHT DATA
 # ============================================================================
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class WeightData:
     """
     Neural weight สำหรับ topic/domain หนึ่ง
@@ -164,7 +173,7 @@ class WeightData:
 # GRADIENT SNAPSHOT
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class GradientSnapshot:
     """
     บันทึกสถานะ gradient ณ เวลาหนึ่ง
@@ -206,6 +215,39 @@ class GradientSnapshot:
             threshold_vanish=threshold_vanish,
         )
 
+    @classmethod
+    def evaluate_batch(
+        cls,
+        domains:   Sequence[str],
+        gradients: np.ndarray,
+        threshold_explode: float = 100.0,
+        threshold_vanish:  float = 1e-7,
+    ) -> Tuple[np.ndarray, List[GradientSnapshot]]:
+        """
+        ตรวจ gradient ทั้ง vector ด้วย mask ชุดเดียว (ลำดับเงื่อนไขเดียวกับ evaluate)
+
+        Returns:
+            (codes, snapshots) — codes เป็น int8 ต่อ element ใช้เป็น index ของ
+            STATUS_CODES; snapshot สร้างเฉพาะตัวที่ไม่ OK
+        """
+        g  = np.asarray(gradients, dtype=np.float64).ravel()
+        ag = np.abs(g)
+        with np.errstate(invalid="ignore"):
+            codes = np.select(
+                [np.isnan(g), np.isinf(g), ag > threshold_explode, ag < threshold_vanish],
+                [0, 1, 2, 3],
+                default=4,
+            ).astype(np.int8)
+        snaps = [
+            cls(
+                domain=domains[i], gradient=float(g[i]), status=STATUS_CODES[codes[i]],
+                threshold_explode=threshold_explode,
+                threshold_vanish=threshold_vanish,
+            )
+            for i in np.flatnonzero(codes != 4).tolist()
+        ]
+        return codes, snaps
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "snap_id":   self.snap_id,
@@ -226,7 +268,7 @@ class GradientSnapshot:
 # CONFLICT DATA
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class ConflictData:
     """
     Knowledge conflict ที่ Neural ตรวจพบ
@@ -266,7 +308,7 @@ class ConflictData:
 # EVOLUTION RECORD
 # ============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class EvolutionRecord:
     """
     บันทึก evolution event หนึ่งครั้ง
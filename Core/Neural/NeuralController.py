@@ -23,6 +23,8 @@ import time
 import uuid
 from typing import Optional, List, Dict
 
+import numpy as np
+
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 from Core.Neural.Brain.NeuralData import (
@@ -46,6 +48,7 @@ class NeuralController:
         self._conflicts:  List[ConflictData]        = []
         self._evolutions: List[EvolutionRecord]     = []
         self._gradients:  List[GradientSnapshot]    = []
+        self._gradients_checked: int                 = 0
         self._proposals:  Dict[str, ProposalData]   = {}
 
         self._explode_threshold = gradient_explode_threshold
@@ -120,6 +123,7 @@ class NeuralController:
             threshold_vanish  = self._vanish_threshold,
         )
         self._gradients.append(snap)
+        self._gradients_checked += 1
 
         if snap.status.is_critical:
             self._logger.error(
@@ -139,6 +143,53 @@ class NeuralController:
         self._logger.debug(f"[NeuralController] GRADIENT {snap}")
         return snap
 
+    def monitor_gradient_batch(
+        self, domain: str, gradients: np.ndarray
+    ) -> Optional[GradientSnapshot]:
+        """
+        ตรวจ gradient ทั้ง vector ในครั้งเดียว — จัด status ด้วย
+        GradientSnapshot.evaluate_batch แทนเรียก monitor_gradient ทีละตัว
+
+        ผลเทียบเท่า loop ทีละตัว:
+          - ตัวที่ VANISH → บันทึก snapshot + warning ทีละตัว
+          - มี NaN/Inf/Explode → หยุดที่ตัวแรก (ตัวหลังจากนั้นไม่นับ)
+          - gradients_checked นับทีละ element
+        ตัวที่ OK ไม่เก็บ snapshot แยก — เก็บเฉพาะตัวที่ |grad| สูงสุด
+        (หรือตัว critical ตัวแรก) เป็น snapshot สุดท้ายของ domain
+
+        Returns:
+            GradientSnapshot ของตัวที่แย่ที่สุด หรือ None ถ้า vector ว่าง
+
+        Raises:
+            RuntimeError: เหมือน monitor_gradient
+        """
+        arr = np.asarray(gradients, dtype=np.float64).ravel()
+        if arr.size == 0:
+            return None
+        codes, snaps = GradientSnapshot.evaluate_batch(
+            [domain] * arr.size, arr,
+            threshold_explode = self._explode_threshold,
+            threshold_vanish  = self._vanish_threshold,
+        )
+        critical = np.flatnonzero(codes < 3)
+        if critical.size:
+            worst = int(critical[0])
+            self._gradients_checked += worst
+        else:
+            worst = int(np.abs(arr).argmax())
+            self._gradients_checked += arr.size - 1
+
+        # ตัวที่ไม่ OK ก่อนตัว critical (หรือทั้งหมดถ้าไม่มี) เป็น VANISH ทั้งหมด
+        for i, snap in zip(np.flatnonzero(codes != 4).tolist(), snaps):
+            if i == worst or (critical.size and i > worst):
+                continue
+            self._gradients.append(snap)
+            self._logger.warning(
+                f"[NeuralController] GRADIENT_VANISH {snap}"
+            )
+
+        return self.monitor_gradient(domain, float(arr[worst]))
+
     def last_gradient(self, domain: str) -> Optional[GradientSnapshot]:
         """gradient snapshot ล่าสุดของ domain"""
         snaps = [g for g in self._gradients if g.domain == domain]
@@ -382,7 +433,7 @@ class NeuralController:
             "conflicts_total":   len(self._conflicts),
             "proposals_pending": len(self.pending_proposals()),
             "evolutions_total":  len(self._evolutions),
-            "gradients_checked": len(self._gradients),
+            "gradients_checked": self._gradients_checked,
             "gradients_critical": critical_grads,
             "total_usage":       sum(
                 w.usage_count for w in self._weights.values()
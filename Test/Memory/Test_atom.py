@@ -0,0 +1,313 @@
+"""
+=================================================================
+  ATOM Binary Format Test Suite
+=================================================================
+  1. Encode / Decode               (9 tests)
+  2. Diagnose / Repair             (8 tests)
+  3. quick_check / batch repair    (8 tests)
+-----------------------------------------------------------------
+  Total: 25 tests
+=================================================================
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+from Core.Memory.Structure.AtomStructure import (
+    AtomData,
+    AtomBinaryFormat,
+    HEADER_SIZE,
+    VERSION_CRC32C,
+    crc32,
+    crc32c,
+)
+from Core.Memory.Structure.AtomRepair import (
+    AtomRepair,
+    MAX_MAGIC_CANDIDATES,
+    auto_repair,
+    quick_check,
+)
+
+
+def make_blob(payload: bytes = b"payload", metadata: bytes = b'{"k": 1}',
+              source: bytes = b"test") -> bytes:
+    return AtomBinaryFormat.encode(
+        AtomData(payload=payload, metadata=metadata, source=source, created_ts_ms=1000)
+    )
+
+
+# ============================================================================
+# 1. Encode / Decode
+# ============================================================================
+
+class TestAtomEncodeDecode(unittest.TestCase):
+
+    def test_roundtrip(self):
+        """encode → decode ได้ข้อมูลเดิม"""
+        data = AtomBinaryFormat.decode(make_blob())
+        self.assertEqual(data.payload,  b"payload")
+        self.assertEqual(data.metadata, b'{"k": 1}')
+        self.assertEqual(data.source,   b"test")
+        self.assertEqual(data.created_ts_ms, 1000)
+
+    def test_decode_returns_bytes_fields(self):
+        """decode คืน field เป็น bytes เสมอ แม้ input เป็น bytearray/memoryview"""
+        blob = make_blob()
+        for buf in (bytearray(blob), memoryview(blob)):
+            data = AtomBinaryFormat.decode(buf)
+            self.assertIsInstance(data.payload,  bytes)
+            self.assertIsInstance(data.metadata, bytes)
+            self.assertIsInstance(data.source,   bytes)
+
+    def test_decode_crc_mismatch_raises(self):
+        """แก้ byte ใน body → CRC32 mismatch"""
+        blob = bytearray(make_blob())
+        blob[HEADER_SIZE] ^= 0xFF
+        with self.assertRaises(ValueError):
+            AtomBinaryFormat.decode(bytes(blob))
+
+    def test_decode_size_mismatch_raises(self):
+        """ข้อมูลขาดหาย → Size mismatch"""
+        with self.assertRaises(ValueError):
+            AtomBinaryFormat.decode(make_blob()[:-1])
+
+    def test_crc32_matches_zlib(self):
+        """crc32 (native หรือ zlib) ให้ค่าเดียวกับ zlib ทั้ง bytes และ memoryview"""
+        data = bytes(range(256)) * 4
+        self.assertEqual(crc32(data), zlib.crc32(data))
+        self.assertEqual(crc32(memoryview(data)[3:]), zlib.crc32(data[3:]))
+
+    def test_crc32c_known_vector(self):
+        """CRC32C ของ "123456789" ต้องได้ค่ามาตรฐาน e3069283"""
+        self.assertEqual(crc32c(b"123456789"), 0xE3069283)
+
+    def test_version2_roundtrip(self):
+        """encode แบบ version 2 (CRC32C) → decode / decode_many / diagnose อ่านได้"""
+        blob = AtomBinaryFormat.encode(
+            AtomData(payload=b"v2", created_ts_ms=1000), version=VERSION_CRC32C
+        )
+        self.assertEqual(blob[4], VERSION_CRC32C)
+        self.assertEqual(AtomBinaryFormat.decode(blob).payload, b"v2")
+        self.assertEqual(AtomBinaryFormat.decode_many([blob, make_blob()])[0].payload, b"v2")
+        self.assertEqual(AtomRepair.diagnose(blob), [])
+
+    def test_decode_many_matches_decode(self):
+        """decode_many ให้ผลเหมือน decode ทีละตัว"""
+        blobs = [make_blob(payload=b"a" * n, source=b"s%d" % n) for n in range(5)]
+        self.assertEqual(
+            AtomBinaryFormat.decode_many(blobs),
+            [AtomBinaryFormat.decode(b) for b in blobs],
+        )
+
+    def test_decode_many_reports_bad_index(self):
+        """blob ที่เสียใน batch → ValueError ระบุ index"""
+        bad = bytearray(make_blob())
+        bad[HEADER_SIZE] ^= 0xFF
+        with self.assertRaisesRegex(ValueError, r"^\[1\] CRC32"):
+            AtomBinaryFormat.decode_many([make_blob(), bytes(bad)])
+
+
+# ============================================================================
+# 2. Diagnose / Repair
+# ============================================================================
+
+class TestAtomRepair(unittest.TestCase):
+
+    def test_diagnose_valid(self):
+        """ไฟล์ปกติ → ไม่มี issue"""
+        self.assertEqual(AtomRepair.diagnose(make_blob()), [])
+
+    def test_diagnose_bad_magic(self):
+        """magic เสีย → รายงาน Invalid magic bytes"""
+        blob = b"XXXX" + make_blob()[4:]
+        issues = AtomRepair.diagnose(blob)
+        self.assertTrue(any("Invalid magic" in i for i in issues))
+
+    def test_repair_bad_crc(self):
+        """CRC เสีย → repair คำนวณใหม่แล้วอ่านได้"""
+        blob = bytearray(make_blob())
+        blob[-1] ^= 0xFF
+        report = AtomRepair.repair(bytes(blob))
+        self.assertTrue(report.success)
+        self.assertEqual(report.recovered_data.payload, b"payload")
+
+    def test_repair_with_precomputed_issues(self):
+        """ส่ง issues จาก diagnose เข้า repair ได้ — ผลเหมือนให้ repair diagnose เอง"""
+        blob = bytearray(make_blob())
+        blob[6] = 0x01                       # reserved != 0
+        blob = bytes(blob)
+        issues = AtomRepair.diagnose(blob)
+        report = AtomRepair.repair(blob, issues=issues)
+        self.assertTrue(report.success)
+        self.assertEqual(report.issues_found, issues)
+        self.assertIn("Reset reserved field to 0", report.fixes_applied)
+        self.assertEqual(AtomRepair.diagnose(AtomBinaryFormat.encode(report.recovered_data)), [])
+
+    def test_repair_truncated_partial_recovery(self):
+        """ไฟล์ถูกตัดท้าย + aggressive → กู้ payload ได้เท่าที่เหลือ เป็น bytes"""
+        blob = make_blob(payload=b"x" * 100)
+        report = AtomRepair.repair(blob[:HEADER_SIZE + 40], aggressive=True)
+        self.assertTrue(report.success)
+        self.assertEqual(report.recovered_data.payload, b"x" * 40)
+        self.assertIsInstance(report.recovered_data.metadata, bytes)
+        self.assertIn("Partial recovery from truncated file", report.fixes_applied)
+
+    def test_aggressive_repair_finds_embedded_atom(self):
+        """มี garbage นำหน้า → scan หา magic แล้ว recover ATOM ได้"""
+        blob = b"\x00garbage\x00" + make_blob()
+        report = AtomRepair._aggressive_repair(blob, [], [], [])
+        self.assertTrue(report.success)
+        self.assertEqual(report.recovered_data.payload, b"payload")
+
+    def test_aggressive_repair_prefers_intact_atom(self):
+        """magic ปลอมที่ header ใช้ไม่ได้ → ข้ามไปเลือก ATOM ที่ CRC ถูกต้อง"""
+        blob = b"ATOM" + b"\xff" * 40 + make_blob() + b"trailing"
+        report = AtomRepair._aggressive_repair(blob, [], [], [])
+        self.assertTrue(report.success)
+        self.assertEqual(report.recovered_data.payload, b"payload")
+        self.assertIn("Successfully recovered from offset 44", report.fixes_applied)
+
+    def test_aggressive_repair_caps_magic_scan(self):
+        """ไฟล์ที่มี magic ปลอมเต็มไปหมด → หยุด scan ที่ MAX_MAGIC_CANDIDATES"""
+        blob = b"ATOM" * (MAX_MAGIC_CANDIDATES + 10)
+        report = AtomRepair._aggressive_repair(blob, [], [], [])
+        self.assertFalse(report.success)
+        self.assertIn(f"Found {MAX_MAGIC_CANDIDATES} potential ATOM structure(s)", report.fixes_applied)
+
+
+# ============================================================================
+# 3. quick_check / batch repair
+# ============================================================================
+
+class TestQuickCheck(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "a.atom")
+        with open(self.path, "wb") as f:
+            f.write(make_blob())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_valid_file(self):
+        """ไฟล์ปกติ → True (เรียกซ้ำได้ผลเดิม)"""
+        self.assertTrue(quick_check(self.path))
+        self.assertTrue(quick_check(self.path))
+
+    def test_modified_file_rechecked(self):
+        """ไฟล์ถูกแก้หลัง check แล้ว → ไม่ใช้ผลเก่าที่ cache ไว้"""
+        self.assertTrue(quick_check(self.path))
+        with open(self.path, "ab") as f:
+            f.write(b"\x00")
+        self.assertFalse(quick_check(self.path))
+
+    def test_repair_files_batch(self):
+        """repair_files ซ่อมหลายไฟล์ในครั้งเดียว คืน report ตามลำดับ input"""
+        bad = os.path.join(self.test_dir, "b.atom")
+        blob = bytearray(make_blob())
+        blob[-1] ^= 0xFF
+        with open(bad, "wb") as f:
+            f.write(blob)
+
+        outs = [self.path + ".out", bad + ".out"]
+        reports = AtomRepair.repair_files([self.path, bad], outs)
+
+        self.assertEqual(len(reports), 2)
+        self.assertTrue(all(r.success for r in reports))
+        self.assertTrue(quick_check(outs[1]))
+
+    def test_repair_many_parallel(self):
+        """repair_many หลาย process → ผลเหมือน repair_files และเรียงตาม input"""
+        paths = []
+        for n in range(4):
+            path = os.path.join(self.test_dir, f"p{n}.atom")
+            blob = bytearray(make_blob(payload=b"x" * n))
+            blob[-1] ^= 0xFF
+            with open(path, "wb") as f:
+                f.write(blob)
+            paths.append(path)
+
+        reports = AtomRepair.repair_many(paths, workers=2)
+        self.assertEqual([r.recovered_data.payload for r in reports],
+                         [b"x" * n for n in range(4)])
+
+    def test_load_mapped(self):
+        """load (mmap) อ่านไฟล์ปกติได้ / ไฟล์เสียหรือว่าง → ValueError"""
+        self.assertEqual(AtomBinaryFormat.load(self.path).payload, b"payload")
+
+        blob = bytearray(make_blob())
+        blob[HEADER_SIZE] ^= 0xFF
+        with open(self.path, "wb") as f:
+            f.write(blob)
+        with self.assertRaisesRegex(ValueError, "CRC32 mismatch"):
+            AtomBinaryFormat.load(self.path)
+
+        open(self.path, "wb").close()
+        with self.assertRaisesRegex(ValueError, "too short"):
+            AtomBinaryFormat.load(self.path)
+
+    def test_missing_file(self):
+        """ไม่มีไฟล์ → False"""
+        self.assertFalse(quick_check(os.path.join(self.test_dir, "missing.atom")))
+
+    def test_empty_file(self):
+        """ไฟล์ว่าง (mmap ไม่ได้) → False ไม่ throw"""
+        path = os.path.join(self.test_dir, "empty.atom")
+        open(path, "wb").close()
+        self.assertFalse(quick_check(path))
+        self.assertFalse(AtomRepair.repair_file(path).success)
+
+    def test_auto_repair_in_place(self):
+        """auto_repair ซ่อม CRC เสียในไฟล์เดิม + สร้าง .bak"""
+        blob = bytearray(make_blob())
+        blob[-1] ^= 0xFF
+        with open(self.path, "wb") as f:
+            f.write(blob)
+
+        self.assertTrue(auto_repair(self.path))
+        self.assertTrue(quick_check(self.path))
+        self.assertTrue(os.path.exists(self.path + ".bak"))
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def run_tests():
+    loader = unittest.TestLoader()
+    suite  = unittest.TestSuite()
+
+    groups = [
+        ("1. Encode / Decode               (9 tests)", TestAtomEncodeDecode),
+        ("2. Diagnose / Repair             (8 tests)", TestAtomRepair),
+        ("3. quick_check / batch repair    (8 tests)", TestQuickCheck),
+    ]
+
+    print("\n=================================================================")
+    print("  ATOM Binary Format Test Suite")
+    print("=================================================================")
+    for label, _ in groups:
+        print(f"  {label}")
+    print("─────────────────────────────────────────────────────────────────")
+    print("  Total: 25 tests")
+    print("=================================================================\n")
+
+    for _, cls in groups:
+        suite.addTests(loader.loadTestsFromTestCase(cls))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n=================================================================")
+    print(f"  Passed : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"  Failed : {len(result.failures)}")
+    print(f"  Errors : {len(result.errors)}")
+    print("=================================================================")
+    print("\n  🎉 ALL TESTS PASSED!\n" if result.wasSuccessful() else "\n  ❌ SOME TESTS FAILED\n")
+
+
+if __name__ == "__main__":
+    run_tests()
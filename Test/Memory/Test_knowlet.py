@@ -0,0 +1,184 @@
+"""
+=================================================================
+  Knowlet / ShardPath Test Suite
+=================================================================
+  1. ShardPath                     (9 tests)
+  2. KnowletData JSON              (2 tests)
+-----------------------------------------------------------------
+  Total: 11 tests
+=================================================================
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import numpy as np
+from Core.Memory.Structure.KnowletStructure import (
+    KnowletData,
+    ShardPath,
+    OS_FOLDER_LIMIT,
+    SHARD_DEPTH_MIN,
+    SHARD_DEPTH_MAX,
+)
+
+
+# ============================================================================
+# 1. ShardPath
+# ============================================================================
+
+class TestShardPath(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_get_shard_prefix_stable(self):
+        """shard ยาวเท่า depth และ depth ที่ลึกขึ้นขยายต่อจากชื่อเดิม"""
+        shards = [ShardPath.get_shard("a1b2c3d4", d) for d in range(1, SHARD_DEPTH_MAX + 1)]
+        for depth, shard in enumerate(shards, start=1):
+            self.assertEqual(len(shard), depth)
+            self.assertTrue(shards[-1].startswith(shard))
+
+    def test_get_shard_spreads_common_prefix(self):
+        """id ที่ prefix เหมือนกันกระจายไปหลาย shard"""
+        shards = {ShardPath.get_shard(f"20240101{i:04d}", SHARD_DEPTH_MIN) for i in range(100)}
+        self.assertGreater(len(shards), 50)
+
+    def test_build_path_layout(self):
+        """build_path / build_knowlet_path ได้ {base}/{tier}/{category}/{primary}/{shard}/{id}"""
+        shard = ShardPath.get_shard("a1b2", 2)
+        self.assertEqual(
+            ShardPath.build_path(self.test_dir, "short", "conversation", "python", "a1b2", 2),
+            self.test_dir / "short" / "conversation" / "python" / shard / "a1b2.atom",
+        )
+        self.assertEqual(
+            ShardPath.build_knowlet_path(self.test_dir, "conversation", "python", "a1b2", 2),
+            self.test_dir / "knowlet" / "conversation" / "python" / shard / "a1b2.knowlet",
+        )
+
+    def test_build_path_legacy_fallback(self):
+        """ไฟล์ที่อยู่ใน shard แบบเก่า (prefix ของ id) → build_path คืน path เก่า"""
+        topic  = self.test_dir / "short" / "conversation" / "python"
+        legacy = topic / "A1" / "a1b2.atom"
+        legacy.parent.mkdir(parents=True)
+        legacy.touch()
+        self.assertNotEqual(ShardPath.get_shard("a1b2", 2), "A1")
+        self.assertEqual(
+            ShardPath.build_path(self.test_dir, "short", "conversation", "python", "a1b2", 2),
+            legacy,
+        )
+
+        # มีทั้งสองที่ → ใช้ path ใหม่
+        hashed = topic / ShardPath.get_shard("a1b2", 2) / "a1b2.atom"
+        hashed.parent.mkdir(parents=True)
+        hashed.touch()
+        self.assertEqual(
+            ShardPath.build_path(self.test_dir, "short", "conversation", "python", "a1b2", 2),
+            hashed,
+        )
+
+    def test_build_path_skips_stat_without_legacy_folder(self):
+        """topic ที่ไม่มี folder แบบเก่าของ id → build_path ไม่ stat ไฟล์ แม้ไฟล์ยังไม่มี"""
+        topic = self.test_dir / "short" / "conversation" / "python"
+        (topic / ShardPath.get_shard("a1b2", 2)).mkdir(parents=True)
+        with mock.patch.object(Path, "exists", autospec=True, return_value=False) as exists:
+            path = ShardPath.build_path(self.test_dir, "short", "conversation", "python", "a1b2", 2)
+        self.assertEqual(path, topic / ShardPath.get_shard("a1b2", 2) / "a1b2.atom")
+        exists.assert_not_called()
+
+    def test_detect_depth_missing_folder(self):
+        """ไม่มี folder → SHARD_DEPTH_MIN"""
+        self.assertEqual(ShardPath.detect_depth(self.test_dir / "missing"), SHARD_DEPTH_MIN)
+
+    def test_detect_depth_ignores_files(self):
+        """นับเฉพาะ folder — ไฟล์ชื่อยาวไม่มีผล"""
+        (self.test_dir / "01A").mkdir()
+        (self.test_dir / "AB").mkdir()
+        (self.test_dir / "very_long_file_name.atom").touch()
+        self.assertEqual(ShardPath.detect_depth(self.test_dir), 3)
+
+    def test_should_expand_missing_folder(self):
+        """ไม่มี folder → False"""
+        self.assertFalse(ShardPath.should_expand(self.test_dir / "missing"))
+
+    def test_should_expand_over_limit(self):
+        """entries เกิน OS_FOLDER_LIMIT → True / เท่ากับ limit → False"""
+        for i in range(OS_FOLDER_LIMIT):
+            (self.test_dir / f"{i}.atom").touch()
+        self.assertFalse(ShardPath.should_expand(self.test_dir))
+
+        (self.test_dir / "extra.atom").touch()
+        self.assertTrue(ShardPath.should_expand(self.test_dir))
+
+
+# ============================================================================
+# 2. KnowletData JSON
+# ============================================================================
+
+class TestKnowletJson(unittest.TestCase):
+
+    def _knowlet(self, confidence, parent_confidence) -> KnowletData:
+        return KnowletData.create(
+            parent_ids=["a1", "b2"],
+            category="conversation",
+            primary="python",
+            summary="python เป็นภาษา interpreted",
+            confidence=confidence,
+            parent_confidence=parent_confidence,
+        )
+
+    def test_json_roundtrip(self):
+        """to_json → from_json ได้ค่าเดิม"""
+        k = self._knowlet(0.8, 0.6)
+        self.assertEqual(KnowletData.from_json(k.to_json()).to_dict(), k.to_dict())
+
+    def test_json_numpy_scalar_confidence(self):
+        """confidence เป็น numpy scalar (float64 / float32) → dump ได้"""
+        k = self._knowlet(np.float64(0.8), np.float32(0.6))
+        restored = KnowletData.from_json(k.to_json())
+        self.assertAlmostEqual(restored.confidence, 0.8)
+        self.assertAlmostEqual(restored.parent_confidence, 0.6, places=6)
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def run_tests():
+    loader = unittest.TestLoader()
+    suite  = unittest.TestSuite()
+
+    groups = [
+        ("1. ShardPath                     (9 tests)", TestShardPath),
+        ("2. KnowletData JSON              (2 tests)", TestKnowletJson),
+    ]
+
+    print("\n=================================================================")
+    print("  Knowlet / ShardPath Test Suite")
+    print("=================================================================")
+    for label, _ in groups:
+        print(f"  {label}")
+    print("─────────────────────────────────────────────────────────────────")
+    print("  Total: 11 tests")
+    print("=================================================================\n")
+
+    for _, cls in groups:
+        suite.addTests(loader.loadTestsFromTestCase(cls))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n=================================================================")
+    print(f"  Passed : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"  Failed : {len(result.failures)}")
+    print(f"  Errors : {len(result.errors)}")
+    print("=================================================================")
+    print("\n  🎉 ALL TESTS PASSED!\n" if result.wasSuccessful() else "\n  ❌ SOME TESTS FAILED\n")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,384 @@
+"""
+=================================================================
+  Memory Tier Test Suite  (BaseTier)
+=================================================================
+  1. Importance Sniff              (5 tests)
+  2. write_many                    (3 tests)
+  3. Promote → Delete              (2 tests)
+  4. list_promotable               (2 tests)
+  5. list_older_than               (2 tests)
+  6. clear                         (3 tests)
+  7. Read Cache                    (3 tests)
+  8. Shared Directory              (4 tests)
+-----------------------------------------------------------------
+  Total: 24 tests
+=================================================================
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import json
+from pathlib import Path
+from Core.Memory.MemoryController import MemoryController
+from Core.Memory.Structure.AtomStructure import AtomData
+from Core.Memory.Tiers.base import _importance, PARALLEL_IO_MIN
+from Core.Memory.Tiers.Short_term import Short_term, SHORT_TERM_PROMOTION_THRESHOLD
+from Core.Memory.Tiers.Immortal_term import Immortal_term
+
+# ============================================================================
+# 1. Importance Sniff
+# ============================================================================
+
+class TestImportanceSniff(unittest.TestCase):
+
+    def _parsed(self, meta: bytes):
+        return json.loads(meta).get("importance", 0)
+
+    def test_flat_metadata(self):
+        """metadata แบน → ได้ค่า importance ตรงกับ parse เต็ม"""
+        meta = b'{"category": "learning", "importance": 0.6}'
+        self.assertEqual(_importance(meta), 0.6)
+        self.assertEqual(_importance(meta), self._parsed(meta))
+
+    def test_missing_key_is_zero(self):
+        """ไม่มี importance → 0"""
+        self.assertEqual(_importance(b'{"category": "learning"}'), 0)
+
+    def test_nested_key_only(self):
+        """importance ซ้อนใน object ย่อย ไม่ใช่ค่าระดับบนสุด → 0"""
+        meta = b'{"topic": {"importance": 0.9}}'
+        self.assertEqual(_importance(meta), 0)
+        self.assertEqual(_importance(meta), self._parsed(meta))
+
+    def test_nested_key_with_top_level_null(self):
+        """ค่าระดับบนสุดเป็น null → None ไม่ใช่ค่าที่ซ้อนอยู่"""
+        meta = b'{"tags": {"importance": 7}, "importance": null}'
+        self.assertIsNone(_importance(meta))
+
+    def test_controller_metadata_layout(self):
+        """layout แบบ MemoryController (topic ซ้อนหลัง importance) → ค่าระดับบนสุด"""
+        meta = json.dumps({
+            "category":   "learning",
+            "primary":    "python",
+            "importance": 0.75,
+            "tier":       "short",
+            "topic":      {"cluster_id": 1, "importance": 0.1},
+        }).encode("utf-8")
+        self.assertEqual(_importance(meta), 0.75)
+        self.assertEqual(_importance(meta), self._parsed(meta))
+
+
+# ============================================================================
+# Base — Tier บน temp dir
+# ============================================================================
+
+class BaseTierTest(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.tier = Short_term(str(self.test_dir / "short"))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _atom(self, payload: bytes = b"payload", importance=None, created_ts_ms=None) -> AtomData:
+        metadata = b"" if importance is None else json.dumps({"importance": importance}).encode("utf-8")
+        return AtomData(payload=payload, metadata=metadata, created_ts_ms=created_ts_ms)
+
+    def _files(self, folder: Path) -> list[str]:
+        return sorted(name for _, _, names in os.walk(folder) for name in names)
+
+
+# ============================================================================
+# 2. write_many
+# ============================================================================
+
+class TestWriteMany(BaseTierTest):
+
+    def test_write_many_all_written(self):
+        """เขียนหลายตัว → คืนทุก id อ่านกลับได้ และนับใน list/count"""
+        items = [(f"atom{i}", self._atom(f"p{i}".encode())) for i in range(5)]
+        written = self.tier.write_many(items)
+
+        self.assertEqual(written, [atom_id for atom_id, _ in items])
+        self.assertEqual(sorted(self.tier.list()), sorted(written))
+        self.assertEqual(self.tier.count(), 5)
+        self.assertEqual(self.tier.read("atom3").payload, b"p3")
+
+    def test_write_many_partial_failure(self):
+        """ตัวที่ encode ไม่ได้ → ข้าม คืนเฉพาะตัวที่สำเร็จ ไม่มีไฟล์ค้าง"""
+        items = [
+            ("good1", self._atom(b"one")),
+            ("bad",   AtomData(payload=None)),
+            ("good2", self._atom(b"two")),
+        ]
+        written = self.tier.write_many(items)
+
+        self.assertEqual(written, ["good1", "good2"])
+        self.assertFalse(self.tier.exists("bad"))
+        self.assertIsNone(self.tier.read("bad"))
+        self.assertEqual(self._files(self.tier.data_path), ["good1.atom", "good2.atom"])
+
+    def test_write_many_overwrites_cached_read(self):
+        """เขียนทับ id เดิม → read ได้ค่าใหม่ ไม่ใช่ค่าใน cache"""
+        self.tier.write("atom", self._atom(b"old"))
+        self.assertEqual(self.tier.read("atom").payload, b"old")
+
+        self.assertEqual(self.tier.write_many([("atom", self._atom(b"new"))]), ["atom"])
+        self.assertEqual(self.tier.read("atom").payload, b"new")
+        self.assertEqual(self.tier.count(), 1)
+
+
+# ============================================================================
+# 3. Promote → Delete
+# ============================================================================
+
+class TestPromoteMany(BaseTierTest):
+
+    def setUp(self):
+        super().setUp()
+        self.controller = MemoryController(base_path=str(self.test_dir))
+        self.short  = self.controller._short
+        self.middle = self.controller._middle
+
+    def test_promote_many_moves_then_deletes(self):
+        """promote หลายตัว → อยู่ middle ครบ และถูกลบจาก short ทั้งใน index และบน disk"""
+        for i in range(3):
+            self.short.write(f"atom{i}", self._atom(f"p{i}".encode(), importance=0.9))
+
+        moved = self.controller._promote_many(["atom0", "atom1", "atom2"], "short")
+
+        self.assertEqual(moved, 3)
+        self.assertEqual(self.short.count(), 0)
+        self.assertEqual(self._files(self.short.data_path), [])
+        for i in range(3):
+            self.assertFalse(self.short.exists(f"atom{i}"))
+            self.assertIsNone(self.short.read(f"atom{i}"))
+            self.assertEqual(self.middle.read(f"atom{i}").payload, f"p{i}".encode())
+
+    def test_promote_many_skips_missing(self):
+        """id ที่ไม่มีใน Tier เดิม → ข้าม ไม่เขียนไป Tier ถัดไป"""
+        self.short.write("atom", self._atom(importance=0.9))
+
+        moved = self.controller._promote_many(["atom", "missing"], "short")
+
+        self.assertEqual(moved, 1)
+        self.assertTrue(self.middle.exists("atom"))
+        self.assertFalse(self.middle.exists("missing"))
+
+
+# ============================================================================
+# 4. list_promotable
+# ============================================================================
+
+class TestListPromotable(BaseTierTest):
+
+    def test_threshold(self):
+        """importance >= threshold → promotable / ต่ำกว่า หรือไม่มี metadata → ไม่"""
+        self.tier.write("high",  self._atom(importance=0.9))
+        self.tier.write("exact", self._atom(importance=SHORT_TERM_PROMOTION_THRESHOLD))
+        self.tier.write("low",   self._atom(importance=0.1))
+        self.tier.write("none",  self._atom())
+
+        self.assertEqual(sorted(self.tier.list_promotable()), ["exact", "high"])
+
+    def test_nested_importance_ignored(self):
+        """importance ที่ซ้อนใน object ย่อย → ไม่นับ"""
+        self.tier.write("nested", AtomData(
+            payload=b"p", metadata=b'{"topic": {"importance": 0.9}}',
+        ))
+        self.assertEqual(self.tier.list_promotable(), [])
+        self.assertEqual(self.tier.classify()["promotable"], [])
+
+
+# ============================================================================
+# 5. list_older_than
+# ============================================================================
+
+class TestListOlderThan(BaseTierTest):
+
+    def test_cutoff(self):
+        """created_ts_ms เก่ากว่า cutoff → คืน / ใหม่กว่า → ไม่คืน"""
+        now = time.time_ns() // 1_000_000
+        self.tier.write("old", self._atom(created_ts_ms=now - 3_600_000))
+        self.tier.write("new", self._atom(created_ts_ms=now))
+
+        self.assertEqual(self.tier.list_older_than(60), ["old"])
+        self.assertEqual(sorted(self.tier.list_older_than(-60)), ["new", "old"])
+
+    def test_index_follows_write_and_delete(self):
+        """write/delete หลังเรียกครั้งแรก → ผลครั้งถัดไปอัปเดตตาม"""
+        old_ts = time.time_ns() // 1_000_000 - 3_600_000
+        self.tier.write("a", self._atom(created_ts_ms=old_ts))
+        self.assertEqual(self.tier.list_older_than(60), ["a"])
+
+        self.tier.write("b", self._atom(created_ts_ms=old_ts))
+        self.tier.delete("a")
+        self.assertEqual(self.tier.list_older_than(60), ["b"])
+
+
+# ============================================================================
+# 6. clear
+# ============================================================================
+
+class TestClear(BaseTierTest):
+
+    def test_clear_removes_all(self):
+        """clear → คืนจำนวนที่ลบ list/count ว่าง ไม่มีไฟล์ .atom เหลือ"""
+        self.tier.write_many([(f"atom{i}", self._atom()) for i in range(4)])
+        self.assertEqual(self.tier.read("atom0").payload, b"payload")
+
+        self.assertEqual(self.tier.clear(), 4)
+        self.assertEqual(self.tier.list(), [])
+        self.assertEqual(self.tier.count(), 0)
+        self.assertEqual(self._files(self.tier.data_path), [])
+        self.assertIsNone(self.tier.read("atom0"))
+
+    def test_clear_empty_tier(self):
+        """Tier ว่าง → 0"""
+        self.assertEqual(self.tier.clear(), 0)
+
+    def test_clear_immortal_raises(self):
+        """Immortal → PermissionError ไฟล์ยังอยู่ครบ"""
+        immortal = Immortal_term(str(self.test_dir / "immortal"))
+        immortal.write("atom", self._atom())
+        with self.assertRaises(PermissionError):
+            immortal.clear()
+        self.assertTrue(immortal.exists("atom"))
+
+
+# ============================================================================
+# 7. Read Cache
+# ============================================================================
+
+class TestReadCache(BaseTierTest):
+
+    def test_read_returns_new_object(self):
+        """read ซ้ำ (cache hit) → ได้ AtomData คนละตัว ค่าเท่ากัน"""
+        self.tier.write("atom", self._atom(b"p", importance=0.9))
+        first, second = self.tier.read("atom"), self.tier.read("atom")
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+
+    def test_caller_mutation_not_cached(self):
+        """ผู้เรียกแก้ metadata/payload ของผลที่อ่าน → read ครั้งถัดไปยังได้ค่าบน disk"""
+        self.tier.write("atom", self._atom(b"p", importance=0.9))
+        for _ in range(2):                       # miss แล้ว hit
+            data = self.tier.read("atom")
+            data.metadata = b'{"importance": 0.0}'
+            data.payload  = b"changed"
+
+        fresh = self.tier.read("atom")
+        self.assertEqual(fresh.payload, b"p")
+        self.assertEqual(_importance(fresh.metadata), 0.9)
+
+    def test_read_many_keeps_order(self):
+        """read_many → เรียงตาม atom_ids ตัวที่ไม่มี → None ทั้งแบบทีละตัวและแบบ thread pool"""
+        ids = [f"a{i:03d}" for i in range(PARALLEL_IO_MIN)]
+        for atom_id in ids:
+            self.tier.write(atom_id, self._atom(atom_id.encode(), importance=0.1))
+        for wanted in (ids[:3] + ["missing"], ids[::-1] + ["missing"]):
+            got = self.tier.read_many(wanted)
+            self.assertEqual(
+                [d.payload if d else None for d in got],
+                [w.encode() if w != "missing" else None for w in wanted],
+            )
+
+
+# ============================================================================
+# 8. Shared Directory
+# ============================================================================
+
+class TestSharedDirectory(BaseTierTest):
+
+    def setUp(self):
+        super().setUp()
+        self.other = Short_term(str(self.tier.data_path))
+
+    def test_sees_writes_of_other_instance(self):
+        """Tier อีกตัวบน directory เดียวกันเขียน → exists/count/list เห็นทันที"""
+        self.assertEqual(self.other.count(), 0)
+
+        self.tier.write("a", self._atom())
+        self.assertTrue(self.other.exists("a"))
+        self.assertEqual(self.other.count(), 1)
+        self.assertEqual(self.other.list(), ["a"])
+
+        # เขียนต่อทันทีใน tick เดียวกัน — mtime อาจไม่ขยับ แต่ต้องยังเห็น
+        self.tier.write("b", self._atom())
+        self.assertEqual(sorted(self.other.list()), ["a", "b"])
+
+    def test_sees_deletes_of_other_instance(self):
+        """Tier อีกตัวลบ → exists/count/list ไม่เห็นไฟล์นั้นแล้ว"""
+        self.tier.write_many([("a", self._atom()), ("b", self._atom())])
+        self.assertEqual(self.other.count(), 2)
+
+        self.tier.delete("a")
+        self.assertFalse(self.other.exists("a"))
+        self.assertEqual(self.other.list(), ["b"])
+        self.assertEqual(self.other.count(), 1)
+
+    def test_cached_read_after_other_delete(self):
+        """read เข้า cache แล้ว Tier อีกตัวลบ → read คืน None ไม่ใช่ค่าเก่า"""
+        self.tier.write("a", self._atom(b"old"))
+        self.assertEqual(self.other.read("a").payload, b"old")
+
+        self.tier.delete("a")
+        self.assertIsNone(self.other.read("a"))
+
+    def test_cached_read_after_other_rewrite(self):
+        """read เข้า cache แล้ว Tier อีกตัวเขียนทับ (ขนาดเท่าเดิม) → ได้ค่าใหม่"""
+        self.tier.write("a", self._atom(b"old"))
+        self.assertEqual(self.other.read("a").payload, b"old")
+
+        self.tier.write("a", self._atom(b"new"))
+        self.assertEqual(self.other.read("a").payload, b"new")
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def run_tests():
+    loader = unittest.TestLoader()
+    suite  = unittest.TestSuite()
+
+    groups = [
+        ("1. Importance Sniff              (5 tests)", TestImportanceSniff),
+        ("2. write_many                    (3 tests)", TestWriteMany),
+        ("3. Promote → Delete              (2 tests)", TestPromoteMany),
+        ("4. list_promotable               (2 tests)", TestListPromotable),
+        ("5. list_older_than               (2 tests)", TestListOlderThan),
+        ("6. clear                         (3 tests)", TestClear),
+        ("7. Read Cache                    (3 tests)", TestReadCache),
+        ("8. Shared Directory              (4 tests)", TestSharedDirectory),
+    ]
+
+    print("\n=================================================================")
+    print("  Memory Tier Test Suite  (BaseTier)")
+    print("=================================================================")
+    for label, _ in groups:
+        print(f"  {label}")
+    print("─────────────────────────────────────────────────────────────────")
+    print("  Total: 24 tests")
+    print("=================================================================\n")
+
+    for _, cls in groups:
+        suite.addTests(loader.loadTestsFromTestCase(cls))
+
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+
+    print("\n=================================================================")
+    print(f"  Passed : {result.testsRun - len(result.failures) - len(result.errors)}")
+    print(f"  Failed : {len(result.failures)}")
+    print(f"  Errors : {len(result.errors)}")
+    print("=================================================================")
+    print("\n  🎉 ALL TESTS PASSED!\n" if result.wasSuccessful() else "\n  ❌ SOME TESTS FAILED\n")
+
+
+if __name__ == "__main__":
+    run_tests()
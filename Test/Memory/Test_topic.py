@@ -5,16 +5,18 @@
   1. Construction & Normalization  (5 tests)
   2. Derived Properties            (4 tests)
   3. Label Management              (3 tests)
-  4. Similarity                    (5 tests)
-  5. Serialization                 (4 tests)
+  4. Similarity                    (7 tests)
+  5. Serialization                 (6 tests)
   6. Factory                       (1 test)
 -----------------------------------------------------------------
-  Total: 22 tests
+  Total: 26 tests
 =================================================================
 """
 
 import unittest
 import json
+from dataclasses import fields
+import numpy as np
 from Core.Memory.Topic import TopicData, create_topic
 
 # ============================================================================
@@ -143,6 +145,19 @@ class TestTopicSimilarity(unittest.TestCase):
         with self.assertRaises(ValueError):
             a.cosine_similarity(b)
 
+    def test_cosine_similarity_zero_embedding(self):
+        """embedding เป็นศูนย์ทั้งหมด → cosine = 0.0 (ไม่หารด้วยศูนย์)"""
+        a = TopicData(cluster_id=1, top_keywords=[], coherence=0.5, embedding=[0.0, 0.0])
+        b = TopicData(cluster_id=2, top_keywords=[], coherence=0.5, embedding=[1.0, 0.0])
+        self.assertEqual(a.cosine_similarity(b), 0.0)
+
+    def test_cosine_similarity_q_close_to_float(self):
+        """cosine แบบ int8 ใกล้เคียงแบบ float / ไม่มี embedding → None"""
+        a = TopicData(cluster_id=1, top_keywords=[], coherence=0.5, embedding=[0.3, -0.8, 0.1, 0.5])
+        b = TopicData(cluster_id=2, top_keywords=[], coherence=0.5, embedding=[0.4, -0.6, 0.2, 0.1])
+        self.assertAlmostEqual(a.cosine_similarity_q(b), a.cosine_similarity(b), delta=0.02)
+        self.assertIsNone(a.cosine_similarity_q(TopicData(cluster_id=3, top_keywords=[], coherence=0.5)))
+
     def test_keyword_overlap_jaccard(self):
         """keyword_overlap = |intersection| / |union|"""
         a = TopicData(cluster_id=1, top_keywords=["ai", "ml", "deep"], coherence=0.7)
@@ -192,6 +207,11 @@ class TestTopicSerialization(unittest.TestCase):
         self.assertIsNone(restored.label)
         self.assertIsNone(restored.embedding)
 
+    def test_to_dict_covers_all_public_fields(self):
+        """to_dict มี key ตรงกับ field สาธารณะทุกตัว (ไม่รวม cache ภายใน)"""
+        public = {f.name for f in fields(TopicData) if f.init}
+        self.assertEqual(set(self._sample().to_dict()), public)
+
     def test_to_json_is_valid_json(self):
         """to_json() parse ได้ด้วย json.loads"""
         parsed = json.loads(self._sample().to_json())
@@ -199,6 +219,18 @@ class TestTopicSerialization(unittest.TestCase):
         self.assertIn("top_keywords",   parsed)
         self.assertIn("coherence",      parsed)
 
+    def test_to_json_numpy_scalars(self):
+        """coherence / embedding เป็น numpy scalar → to_json ได้ ไม่ TypeError"""
+        t = TopicData(
+            cluster_id   = 3,
+            top_keywords = ["numpy"],
+            coherence    = np.float64(0.7),
+            embedding    = [np.float32(0.25), np.float64(0.5)],
+        )
+        restored = TopicData.from_json(t.to_json())
+        self.assertAlmostEqual(restored.coherence, 0.7)
+        self.assertEqual(restored.embedding, [0.25, 0.5])
+
 
 # ============================================================================
 # 6. Factory
@@ -233,8 +265,8 @@ def run_tests():
         ("1. Construction & Normalization  (5 tests)", TestTopicConstruction),
         ("2. Derived Properties            (4 tests)", TestTopicDerivedProperties),
         ("3. Label Management              (3 tests)", TestTopicLabelManagement),
-        ("4. Similarity                    (5 tests)", TestTopicSimilarity),
-        ("5. Serialization                 (4 tests)", TestTopicSerialization),
+        ("4. Similarity                    (7 tests)", TestTopicSimilarity),
+        ("5. Serialization                 (6 tests)", TestTopicSerialization),
         ("6. Factory                       (1 test)",  TestTopicFactory),
     ]
 
@@ -244,7 +276,7 @@ def run_tests():
     for label, _ in groups:
         print(f"  {label}")
     print("─────────────────────────────────────────────────────────────────")
-    print("  Total: 22 tests")
+    print("  Total: 26 tests")
     print("=================================================================\n")
 
     for _, cls in groups:
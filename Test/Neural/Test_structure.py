@@ -2,16 +2,16 @@
 =================================================================
   BrainStructure Test Suite
 =================================================================
-  1. Activation Functions        (7 tests)
-  2. Loss Functions              (5 tests)
-  3. BrainStructure — Build      (4 tests)
-  4. BrainStructure — Forward    (3 tests)
-  5. BrainStructure — Train      (3 tests)
-  6. Snapshot & Rollback         (4 tests)
-  7. Evolution → Proposal        (5 tests)
-  8. Gradient Safety             (3 tests)
+  1. Activation Functions        (8 tests)
+  2. Loss Functions              (8 tests)
+  3. BrainStructure — Build      (5 tests)
+  4. BrainStructure — Forward    (14 tests)
+  5. BrainStructure — Train      (6 tests)
+  6. Snapshot & Rollback         (5 tests)
+  7. Evolution → Proposal        (8 tests)
+  8. Gradient Safety             (8 tests)
 -----------------------------------------------------------------
-  Total: 34 tests
+  Total: 62 tests
 =================================================================
 """
 
@@ -72,6 +72,18 @@ class TestActivation(unittest.TestCase):
         with self.assertRaises(ValueError):
             ActivationFunctions.get_activation_function("Unknown")
 
+    def test_vectorized_matches_scalar(self):
+        """vectorized=True → forward และ gradient เท่ากับ scalar ทีละ element"""
+        x = np.linspace(-5.0, 5.0, 41)
+        for name in ActivationFunctions.available():
+            if name == "softmax":
+                continue
+            for get in (ActivationFunctions.get_activation_function,
+                        ActivationFunctions.get_gradient_function):
+                scalar = get(name)
+                vector = get(name, vectorized=True)
+                self.assertTrue(np.allclose(vector(x), [scalar(v) for v in x]), name)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. Loss Functions
@@ -107,6 +119,43 @@ class TestLoss(unittest.TestCase):
         with self.assertRaises(ValueError):
             LossFunctions.get_loss_function("UnknownLoss")
 
+    def test_fused_mdn_matches_softmax_path(self):
+        """fused MDN NLL บน logit ≈ softmax + mdn_nll_loss/grad และไม่ overflow"""
+        from Core.Neural.Brain.Functions.Activation import softmax
+        logits = np.array([0.2, -1.0, 0.7])
+        mu, sigma, y = np.array([0.1, -0.4, 0.9]), np.array([0.8, 1.2, 0.5]), np.array([0.3])
+        outputs = {"mdn_pi": softmax(logits), "mdn_mu": mu, "mdn_sigma": sigma}
+        loss, d_pi, d_mu, d_sigma = LossFunctions.fused_mdn_nll_from_logits(logits, mu, sigma, y)
+        grads = LossFunctions.get_loss_gradient("MDN_NLL")(y, outputs)
+        self.assertAlmostEqual(loss, LossFunctions.get_loss_function("MDN_NLL")(y, outputs), places=9)
+        self.assertTrue(np.allclose(d_pi, grads["mdn_pi"], atol=1e-6))
+        self.assertTrue(np.allclose(d_mu, grads["mdn_mu"], atol=1e-6))
+        self.assertTrue(np.allclose(d_sigma, grads["mdn_sigma"], atol=1e-6))
+        big = LossFunctions.fused_mdn_nll_from_logits(logits * 1e3, mu, sigma, y)
+        self.assertTrue(np.isfinite(big[0]) and np.isfinite(big[1]).all())
+
+    def test_mdn_grad_stable_for_far_target(self):
+        """y ไกลจากทุก component → responsibility ยังรวมเป็น 1 และตรงกับ fused path"""
+        from Core.Neural.Brain.Functions.Activation import softmax
+        logits = np.array([0.3, -0.2])
+        mu, sigma, y = np.array([0.0, 1.0]), np.array([0.3, 0.5]), np.array([12.0])
+        outputs = {"mdn_pi": softmax(logits), "mdn_mu": mu, "mdn_sigma": sigma}
+        grads = LossFunctions.get_loss_gradient("MDN_NLL")(y, outputs)
+        _, d_pi, d_mu, _ = LossFunctions.fused_mdn_nll_from_logits(logits, mu, sigma, y)
+        self.assertAlmostEqual(float(grads["mdn_pi"].sum()), 0.0)
+        self.assertTrue(np.allclose(grads["mdn_pi"], d_pi))
+        self.assertTrue(np.allclose(grads["mdn_mu"], d_mu))
+
+    def test_loss_paths_follow_configured_dtype(self):
+        """softmax / loss gradient → คืนค่าเป็น DTYPE ที่ตั้งไว้ (ค่าเริ่มต้น float64)"""
+        from Core.Neural.Brain.Functions._dtype import DTYPE
+        from Core.Neural.Brain.Functions.Activation import softmax
+        pred = np.array([0.2, 0.8], dtype=DTYPE)
+        self.assertEqual(softmax([1, 2, 3]).dtype, DTYPE)
+        self.assertEqual(LossFunctions.get_loss_gradient("MSE")([0.0, 1.0], {"default": pred}).dtype, DTYPE)
+        bce = LossFunctions.get_loss_function("BinaryCrossEntropy")([1.0, 0.0], {"default": np.array([1.0, 0.0], dtype=DTYPE)})
+        self.assertTrue(np.isfinite(bce))
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 3. BrainStructure — Build
@@ -138,6 +187,19 @@ class TestBuild(unittest.TestCase):
         self.assertIsNotNone(b.loss_fn)
         self.assertIsNotNone(b.loss_name)
 
+    def test_build_reproducible_from_seed(self):
+        """seed เดียวกัน → โครงและ weight เหมือนกัน โดยไม่แตะ global RNG"""
+        b1 = BrainStructure(verbose=False)
+        b2 = BrainStructure(verbose=False)
+        b2._rng = np.random.default_rng(b1.seed)
+        state = np.random.get_state()[1].copy()
+        b1.build_structure(connection_prob=0.7)
+        b2.build_structure(connection_prob=0.7)
+        self.assertTrue(np.array_equal(np.random.get_state()[1], state))
+        self.assertEqual(b1.layers, b2.layers)
+        self.assertEqual(dict(b1.weights), dict(b2.weights))
+        self.assertEqual(dict(b1.biases), dict(b2.biases))
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 4. Forward pass
@@ -179,6 +241,196 @@ class TestForward(unittest.TestCase):
         for arr in outputs.values():
             self.assertIsInstance(arr, np.ndarray)
 
+    def test_collect_outputs_before_forward_raises(self):
+        """output ยังไม่มีค่า → RuntimeError, หลัง forward ได้ค่าตรงกับ node"""
+        with self.assertRaises(RuntimeError):
+            self.b.collect_outputs()
+        self._set_inputs([1.0, 0.5])
+        self.b.forward()
+        outputs, index_map = self.b.collect_outputs()
+        for key, ids in index_map.items():
+            if key == "mdn_pi":
+                continue
+            self.assertEqual(outputs[key].tolist(), [self.b.nodes[nid]["value"] for nid in ids])
+
+    def test_observe_pads_and_truncates_inputs(self):
+        """observe() → input ที่ขาดเป็น 0.0 ส่วนที่เกินถูกตัด"""
+        inputs = [nid for nid, n in self.b.nodes.items() if n["role"] == "input"]
+        self.b.observe(np.array([0.7]), "ctx")
+        self.assertEqual([self.b.nodes[nid]["value"] for nid in inputs], [0.7, 0.0])
+        self.b.observe(np.array([0.1, 0.2, 0.3]), "ctx")
+        self.assertEqual([self.b.nodes[nid]["value"] for nid in inputs], [0.1, 0.2])
+
+    def test_observe_updates_first_enabled_connections(self):
+        """observe() → ปรับเฉพาะ connection enabled ตัวแรกๆ และ sync กลับ dict"""
+        b = BrainStructure(verbose=False)
+        b.layers = [3, 5, 2]
+        b.build_structure(connection_prob=1.0)
+        first = next(iter(b.connections))
+        b.connections[first]["enabled"] = False
+        before = dict(b.weights)
+        b.observe(np.array([0.5, -0.5, 1.0]), "ctx")
+        after   = dict(b.weights)
+        enabled = [cid for cid, c in b.connections.items() if c["enabled"]]
+        changed = [cid for cid in before if after[cid] != before[cid]]
+        self.assertEqual(changed, enabled[:b.REALTIME_MAX_UPDATES])
+
+    def test_noise_pool_follows_instance_rng(self):
+        """_noise() → ลำดับเดียวกับ standard_normal ของ _rng แม้ข้ามรอบเติม pool"""
+        b = BrainStructure(verbose=False)
+        b.NOISE_POOL_SIZE = 8
+        b._rng = np.random.default_rng(3)
+        got = np.concatenate([b._noise(3).copy() for _ in range(4)])
+        rng = np.random.default_rng(3)
+        self.assertTrue(np.array_equal(got[:6], rng.standard_normal(8)[:6]))
+        self.assertEqual(got.size, 12)
+
+    def test_predict_batch_matches_forward(self):
+        """predict_batch() → เท่ากับ forward ทีละ sample และไม่แตะ usage"""
+        X = np.array([[1.0, 0.5], [-0.3, 0.2], [0.0, 2.0]])
+        pred = self.b.predict_batch(X)
+        usage = self.b.get_usage()
+        self.assertEqual(self.b.predict_batch(X)["default"].shape[0], 3)
+        self.assertEqual(self.b.get_usage(), usage)
+        for k, x in enumerate(X):
+            self._set_inputs(x)
+            self.b.forward()
+            outputs, _ = self.b.collect_outputs()
+            for head, arr in outputs.items():
+                self.assertTrue(np.allclose(pred[head][k], arr))
+
+    def _scalar_forward(self) -> dict:
+        """ไล่คำนวณทีละ node ตามลำดับ dict แบบ forward() เดิม → nid → value"""
+        expected = {nid: n["value"] for nid, n in self.b.nodes.items()}
+        for layer in sorted({n["layer"] for n in self.b.nodes.values()}):
+            for nid, n in self.b.nodes.items():
+                if n["layer"] != layer or n["role"] == "input":
+                    continue
+                total = self.b.biases[nid] + sum(
+                    self.b.weights[cid] * (expected[c["source"]] or 0.0)
+                    for cid, c in self.b.connections.items()
+                    if c["enabled"] and c["destination"] == nid
+                )
+                act = n["activation"]
+                expected[nid] = (
+                    ActivationFunctions.get_activation_function(act)(total)
+                    if act not in (None, "softmax") else total
+                )
+        return expected
+
+    def _scalar_backward(self) -> dict:
+        """ส่ง gradient ทีละ node ตามลำดับ dict แบบ backward() เดิม → nid → gradient"""
+        grads = {nid: n["gradient"] for nid, n in self.b.nodes.items()}
+        for layer in sorted({n["layer"] for n in self.b.nodes.values()}, reverse=True):
+            for nid, n in self.b.nodes.items():
+                if n["layer"] != layer or grads[nid] is None:
+                    continue
+                g = grads[nid]
+                for cid, c in self.b.connections.items():
+                    if c["enabled"] and c["destination"] == nid:
+                        prev = grads[c["source"]]
+                        contrib = g * self.b.weights[cid]
+                        grads[c["source"]] = contrib if prev is None else prev + contrib
+        return grads
+
+    def test_forward_matches_scalar_loop(self):
+        """forward() แบบ dense ได้ค่าเท่ากับไล่คำนวณทีละ node"""
+        self.b._add_node()          # ให้มี connection ข้าม/ภายใน layer
+        self._set_inputs([1.0, 0.5])
+        expected = self._scalar_forward()
+        self.b.forward()
+        for nid, n in self.b.nodes.items():
+            self.assertAlmostEqual(n["value"], expected[nid], places=12)
+
+    def test_intra_layer_edge_to_later_node(self):
+        """connection ภายใน layer จาก node ก่อนไป node หลัง → forward/backward ตรงกับ loop รายตัว"""
+        hidden = [nid for nid, n in self.b.nodes.items() if n["layer"] == 1]
+        for src, dst, w in [(hidden[0], hidden[2], 0.7), (hidden[1], hidden[1], 0.3),
+                            (hidden[3], hidden[1], -0.4)]:
+            cid = f"{src}->{dst}"
+            self.b.connections[cid] = {"source": src, "destination": dst, "enabled": True}
+            self.b.weights[cid] = w
+        self._set_inputs([1.0, 0.5])
+        expected = self._scalar_forward()
+        self.b.forward()
+        self.assertTrue(self.b._seq[0])
+        for nid, n in self.b.nodes.items():
+            self.assertAlmostEqual(n["value"], expected[nid], places=12)
+
+        for n in self.b.nodes.values():
+            n["gradient"] = None
+        for k, nid in enumerate(nid for nid, n in self.b.nodes.items() if n["role"] == "output"):
+            self.b.nodes[nid]["gradient"] = 0.5 + k
+        expected = self._scalar_backward()
+        self.b.backward()
+        for nid, n in self.b.nodes.items():
+            if expected[nid] is None:
+                self.assertIsNone(n["gradient"])
+            else:
+                self.assertAlmostEqual(n["gradient"], expected[nid], places=12)
+
+    def test_add_node_after_prune_keeps_ids_unique(self):
+        """prune แล้ว ADD_NODE → id ใหม่ไม่ชน node เดิม (ไม่เขียนทับ)"""
+        for _ in range(10):
+            self.b._prune_node()
+            before = dict(self.b.nodes)
+            n_conn = len(self.b.connections)
+            self.b._add_node()
+            for nid, node in before.items():
+                self.assertIs(self.b.nodes[nid], node)
+            added = len(self.b.nodes) - len(before)
+            self.assertEqual(len(self.b.connections) - n_conn, 2 * added)
+
+    def test_csr_kernel_matches_dense(self):
+        """CSR kernel (รันแบบ Python ไม่ต้องมี numba) ได้ค่าเท่ากับ dense"""
+        from unittest import mock
+        import Core.Neural.Brain.BrainStructure as bs_mod
+        self.b._add_node()
+        self._set_inputs([1.0, 0.5])
+        other = BrainStructure(verbose=False)
+        other.nodes       = {k: dict(v) for k, v in self.b.nodes.items()}
+        other.connections = {k: dict(v) for k, v in self.b.connections.items()}
+        other.weights     = dict(self.b.weights)
+        other.biases      = dict(self.b.biases)
+        self.b.forward()
+        with mock.patch.object(bs_mod, "_forward_csr_jit", bs_mod._forward_csr), \
+             mock.patch.object(BrainStructure, "CSR_MAX_DENSITY", 2.0):
+            other.forward()
+            self.assertIsNotNone(other._csr)
+        for nid, n in self.b.nodes.items():
+            self.assertAlmostEqual(other.nodes[nid]["value"], n["value"], places=12)
+            self.assertEqual(other.nodes[nid]["usage"], n["usage"])
+
+    def test_dict_edit_after_forward_is_seen(self):
+        """แก้ weights / biases ผ่าน dict หลัง forward → forward รอบถัดไปใช้ค่าใหม่"""
+        self._set_inputs([1.0, 0.5])
+        self.b.forward()
+        for cid in self.b.weights:
+            self.b.weights[cid] = 0.0
+        for nid in self.b.biases:
+            self.b.biases[nid] = 0.0
+        self.b.forward()
+        for n in self.b.nodes.values():
+            if n["role"] == "input" or n["activation"] in (None, "softmax"):
+                continue
+            fn = ActivationFunctions.get_activation_function(n["activation"])
+            self.assertAlmostEqual(n["value"], fn(0.0), places=12)
+            self.assertEqual(n["usage"], 2.0)
+
+    def test_topology_cached_until_structure_changes(self):
+        """แก้แค่ weight/value → ใช้โครงเดิม, evolution → compile ใหม่"""
+        self._set_inputs([1.0, 0.5])
+        self.b.forward()
+        order = self.b._order
+        self.b.weights[next(iter(self.b.weights))] += 0.1
+        self._set_inputs([0.2, 0.3])
+        self.b.forward()
+        self.assertIs(self.b._order, order)
+        self.b._add_layer()
+        self.b.forward()
+        self.assertIsNot(self.b._order, order)
+        self.assertEqual(len(self.b._order), len(self.b.nodes))
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 5. Train
@@ -219,6 +471,56 @@ class TestTrain(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             b.train(X, y, epochs=1, lr=0.01)
 
+    def test_backpropagation_updates_weights(self):
+        """backpropagation() → w -= lr·g·x และ b -= lr·g"""
+        b = BrainStructure(verbose=False)
+        b.layers = [2, 1]
+        b.build_structure()
+        b.loss_fn      = LossFunctions.get_loss_function("MSE")
+        b.loss_grad_fn = LossFunctions.get_loss_gradient("MSE")
+        out = next(nid for nid, n in b.nodes.items() if n["role"] == "output")
+        b.nodes[out]["activation"] = "Linear"
+        x = {nid: v for nid, v in zip(
+            [nid for nid, n in b.nodes.items() if n["role"] == "input"], [0.4, -0.2]
+        )}
+        for nid, v in x.items():
+            b.nodes[nid]["value"] = v
+        w_before = dict(b.weights)
+        b_before = b.biases[out]
+        b.forward()
+        g = -2.0 * (0.5 - b.nodes[out]["value"])
+        b.backpropagation(np.array([0.5]), lr=0.1)
+        for cid, c in b.connections.items():
+            self.assertAlmostEqual(
+                b.weights[cid], w_before[cid] - 0.1 * g * x[c["source"]], places=12
+            )
+        self.assertAlmostEqual(b.biases[out], b_before - 0.1 * g, places=12)
+        self.assertIsNone(b.nodes[out]["gradient"])
+
+    def test_train_batch_of_identical_samples(self):
+        """batch ของ sample ซ้ำกัน → อัปเดตเท่ากับ sample เดียว"""
+        import copy
+        other = copy.deepcopy(self.b)
+        X, y = np.array([[0.1, 0.2]]), np.array([[0.5]])
+        h1 = self.b.train(X, y, epochs=2, lr=0.05)
+        h2 = other.train(np.repeat(X, 4, axis=0), np.repeat(y, 4, axis=0),
+                         epochs=2, lr=0.05, batch_size=4)
+        self.assertTrue(np.allclose(h1, h2))
+        for cid, w in self.b.weights.items():
+            self.assertAlmostEqual(other.weights[cid], w, places=12)
+
+    def test_mutation_after_train_keeps_dense_view(self):
+        """MUTATE_WEIGHT / MUTATE_BIAS หลัง train → แก้ array ตรง ค่าเห็นได้จาก dict"""
+        self.b.train(np.array([[0.1, 0.2]]), np.array([[0.5]]), epochs=1, lr=0.05)
+        self.b._sync_params()
+        w0, b0 = dict(self.b._weights), dict(self.b._biases)
+        for _ in range(10):
+            self.b._mutate_weight()
+            self.b._mutate_bias()
+        self.assertTrue(self.b._dense_valid)
+        self.assertNotEqual(dict(self.b.weights), w0)
+        self.assertNotEqual(dict(self.b.biases), b0)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 6. Snapshot & Rollback
@@ -262,6 +564,19 @@ class TestSnapshotRollback(unittest.TestCase):
         b.rollback()
         self.assertEqual(len(b.nodes), count_after_first)
 
+    def test_snapshot_after_train_is_independent(self):
+        """snapshot หลัง train เก็บค่าล่าสุด และแก้ node ทีหลังไม่กระทบ snapshot"""
+        b = _brain(model_type="Regression")
+        b.loss_fn      = LossFunctions.get_loss_function("MSE")
+        b.loss_grad_fn = LossFunctions.get_loss_gradient("MSE")
+        b.train(np.array([[0.5, 0.5]]), np.array([[1.0]]), epochs=2, lr=0.1)
+        snap = b.take_snapshot()
+        self.assertEqual(snap["weights"], dict(b.weights))
+        nid = next(iter(b.nodes))
+        before = snap["nodes"][nid]["value"]
+        b.nodes[nid]["value"] = 123.0
+        self.assertEqual(snap["nodes"][nid]["value"], before)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 7. Evolution → Proposal
@@ -310,6 +625,40 @@ class TestEvolutionProposal(unittest.TestCase):
             # ADD_NODE ควรเพิ่ม node
             self.assertGreaterEqual(len(self.b.nodes), before)
 
+    def test_add_connection_goes_forward_in_layer(self):
+        """ADD_CONNECTION → src อยู่ layer ต่ำกว่า dst เสมอ ไม่ซ้ำของเดิม"""
+        b = BrainStructure(verbose=False)
+        b.layers = [2, 3, 2]
+        b.build_structure(connection_prob=0.0)
+        for _ in range(5):
+            b._add_connection()
+        self.assertEqual(len(b.connections), 5)
+        for c in b.connections.values():
+            self.assertLess(b.nodes[c["source"]]["layer"], b.nodes[c["destination"]]["layer"])
+
+    def test_propose_weight_updates_keeps_separate_payloads(self):
+        """_propose_weight_updates → สูงสุด 5 proposal เข้า pending และ payload ไม่แชร์กัน"""
+        props = self.b._propose_weight_updates(implicit_loss=0.2, context_label="ctx")
+        self.assertEqual(len(props), min(5, len(self.b.connections)))
+        self.assertEqual(self.b.pending_proposals[-len(props):], props)
+        self.assertEqual(len({p.payload["cid"] for p in props}), len(props))
+
+    def test_prune_layer_removes_whole_target_layer(self):
+        """PRUNE_LAYER → ลบ node ทั้ง layer ที่เลือก พร้อม connection ที่แตะ layer นั้น"""
+        b = BrainStructure(verbose=False)
+        b.layers = [2, 3, 4, 2]
+        b.build_structure(connection_prob=1.0)
+        before = {l: sum(1 for n in b.nodes.values() if n["layer"] == l) for l in (1, 2)}
+        b._prune_layer()
+        after = {l: sum(1 for n in b.nodes.values() if n["layer"] == l) for l in (1, 2)}
+        gone = [l for l in (1, 2) if after[l] == 0]
+        self.assertEqual(len(gone), 1)
+        kept = 3 - gone[0]
+        self.assertEqual(after[kept], before[kept])
+        for c in b.connections.values():
+            self.assertIn(c["source"], b.nodes)
+            self.assertIn(c["destination"], b.nodes)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 8. Gradient Safety
@@ -334,6 +683,55 @@ class TestGradientSafety(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             b._neural.monitor_gradient("test", 999.0)
 
+    def test_batch_gradient_keeps_worst_value(self):
+        """monitor_gradient_batch → snapshot เดียวของค่าที่ |grad| สูงสุด"""
+        b = _brain()
+        snap = b._neural.monitor_gradient_batch("test", np.array([0.1, -0.7, 0.3]))
+        self.assertEqual(snap.gradient, -0.7)
+        self.assertIs(b._neural.last_gradient("test"), snap)
+
+    def test_batch_gradient_non_finite_raises(self):
+        """มี Inf ตัวเดียวใน vector → RuntimeError"""
+        b = _brain()
+        with self.assertRaises(RuntimeError):
+            b._neural.monitor_gradient_batch("test", np.array([0.1, np.inf, 0.2]))
+
+    def test_batch_gradient_counts_per_element(self):
+        """gradients_checked นับทีละ element และหยุดนับที่ตัว critical ตัวแรก"""
+        b = _brain()
+        b._neural.monitor_gradient_batch("test", np.array([0.1, -0.7, 0.3, 0.2]))
+        self.assertEqual(b._neural.stats()["gradients_checked"], 4)
+        with self.assertRaises(RuntimeError):
+            b._neural.monitor_gradient_batch("test", np.array([0.1, 500.0, np.nan]))
+        stats = b._neural.stats()
+        self.assertEqual(stats["gradients_checked"], 6)
+        self.assertEqual(stats["gradients_critical"], 1)
+        self.assertEqual(b._neural.last_gradient("test").gradient, 500.0)
+
+    def test_batch_gradient_warns_single_vanish(self):
+        """มีตัวเดียวที่ vanish ใน vector → ยัง warning และเก็บ snapshot ของตัวนั้น"""
+        from Core.Neural.Brain.NeuralData import GradientStatus
+        b = _brain()
+        with self.assertLogs("mindwave.neural", level="WARNING") as logs:
+            snap = b._neural.monitor_gradient_batch("test", np.array([0.5, 1e-9, -0.2]))
+        self.assertEqual(snap.gradient, 0.5)
+        self.assertEqual(len([l for l in logs.output if "GRADIENT_VANISH" in l]), 1)
+        self.assertIn(
+            GradientStatus.VANISH,
+            [g.status for g in b._neural._gradients if g.domain == "test"],
+        )
+
+    def test_evaluate_batch_matches_scalar(self):
+        """evaluate_batch → status เหมือน evaluate ทีละตัว และสร้าง snapshot เฉพาะตัวที่ไม่ OK"""
+        from Core.Neural.Brain.NeuralData import GradientSnapshot, GradientStatus, STATUS_CODES
+        grads   = np.array([0.5, np.nan, -np.inf, 250.0, 1e-9, -3.0])
+        domains = [f"d{i}" for i in range(grads.size)]
+        codes, snaps = GradientSnapshot.evaluate_batch(domains, grads)
+        for d, g, c in zip(domains, grads, codes):
+            self.assertEqual(STATUS_CODES[c], GradientSnapshot.evaluate(d, float(g)).status)
+        self.assertEqual([s.domain for s in snaps], ["d1", "d2", "d3", "d4"])
+        self.assertNotIn(GradientStatus.OK, [s.status for s in snaps])
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # RUNNER
@@ -344,14 +742,14 @@ def run_tests():
     suite  = unittest.TestSuite()
 
     groups = [
-        ("1. Activation Functions       (7)", TestActivation),
-        ("2. Loss Functions             (5)", TestLoss),
-        ("3. BrainStructure — Build     (4)", TestBuild),
-        ("4. BrainStructure — Forward   (3)", TestForward),
-        ("5. BrainStructure — Train     (3)", TestTrain),
-        ("6. Snapshot & Rollback        (4)", TestSnapshotRollback),
-        ("7. Evolution → Proposal       (5)", TestEvolutionProposal),
-        ("8. Gradient Safety            (3)", TestGradientSafety),
+        ("1. Activation Functions       (8)", TestActivation),
+        ("2. Loss Functions             (8)", TestLoss),
+        ("3. BrainStructure — Build     (5)", TestBuild),
+        ("4. BrainStructure — Forward   (14)", TestForward),
+        ("5. BrainStructure — Train     (6)", TestTrain),
+        ("6. Snapshot & Rollback        (5)", TestSnapshotRollback),
+        ("7. Evolution → Proposal       (8)", TestEvolutionProposal),
+        ("8. Gradient Safety            (8)", TestGradientSafety),
     ]
 
     print("\n=================================================================")
@@ -360,7 +758,7 @@ def run_tests():
     for label, _ in groups:
         print(f"  {label}")
     print("─────────────────────────────────────────────────────────────────")
-    print("  Total: 34 tests")
+    print("  Total: 62 tests")
     print("=================================================================\n")
 
     for _, cls in groups: